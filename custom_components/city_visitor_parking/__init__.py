@@ -6,6 +6,7 @@ import inspect
 import logging
 import time
 from collections.abc import Mapping
+from functools import partial
 from pathlib import Path
 from typing import TYPE_CHECKING, Final, Protocol, cast
 
@@ -30,35 +31,57 @@ from homeassistant.setup import async_when_setup
 from pycityvisitorparking import AuthError, NetworkError
 from pycityvisitorparking.exceptions import PyCityVisitorParkingError
 
+from .circuit_breaker import async_get_circuit_breaker, async_release_circuit_breaker
 from .client import async_create_client
 from .const import (
     CONF_API_URL,
+    CONF_AUTO_END,
     CONF_BASE_URL,
+    CONF_DEDICATED_SESSION,
     CONF_DEMO_MODE,
     CONF_FREE_DATES,
     CONF_FREE_WEEKDAYS,
     CONF_GUI_URL,
+    CONF_HOST_BURST_REQUESTS,
+    CONF_HOST_REQUESTS_PER_SECOND,
     CONF_MUNICIPALITY,
     CONF_OPERATING_TIME_OVERRIDES,
     CONF_PERMIT_ID,
     CONF_PROVIDER_ID,
     CONF_RESOLVED_LOGIN_PARAMS,
     DOMAIN,
+    HOST_BURST_REQUESTS,
+    HOST_REQUESTS_PER_SECOND,
     PLATFORMS,
     WEEKDAY_KEYS,
 )
 from .coordinator import CityVisitorParkingCoordinator
 from .helpers import normalize_override_windows
-from .models import AutoEndState, OperatingTimeOverrides, ProviderConfig
-from .runtime_data import CityVisitorParkingRuntimeData
+from .http_session import async_get_session_pool
+from .models import OperatingTimeOverrides, ProviderConfig
+from .poll_scheduler import async_get_poll_scheduler, async_release_poll_scheduler
+from .provider_session import ProviderSession, ReloginProvider
+from .rate_limit import (
+    RateLimitedProvider,
+    async_get_host_governor,
+    async_release_host_governor,
+    host_key,
+)
+from .request_coalescing import CoalescingProvider, SingleFlight
+from .runtime_data import CityVisitorParkingRuntimeData, HostServices
 from .services import async_setup_services
+from .snapshot_store import SnapshotStore
 from .version import async_get_versions, build_log_block
 from .websocket_api import async_setup_websocket
 
 if TYPE_CHECKING:
+    import aiohttp
     from homeassistant.core import HomeAssistant
     from homeassistant.helpers.typing import ConfigType
+    from pycityvisitorparking import Client
+    from pycityvisitorparking.provider.base import BaseProvider
 
+    from .http_session import HostSessionPool
     from .runtime_data import CityVisitorParkingConfigEntry
 
 _LOGGER = logging.getLogger(__name__)
@@ -140,8 +163,111 @@ async def async_setup_entry(
         api_url=entry.data.get(CONF_API_URL),
         gui_url=entry.data.get(CONF_GUI_URL),
     )
+    client, provider, host_services = await _async_build_provider(
+        hass, entry, provider_config
+    )
+    # Shared logins and reads run as entry background tasks, so they are
+    # cancelled when the entry unloads.
+    create_task = partial(entry.async_create_background_task, hass)
+    provider_session = ProviderSession(
+        partial(_async_login, hass, entry, provider), create_task
+    )
+    entry.async_on_unload(provider_session.async_shutdown)
+
+    # Calls rejected with AuthError log in again once and are retried, and
+    # identical concurrent reads from the coordinator, services and websocket
+    # share one provider call.
+    request_coalescing = SingleFlight(create_task, name=f"{entry.title} provider call")
+    entry.async_on_unload(request_coalescing.async_shutdown)
+    provider = cast(
+        "BaseProvider",
+        CoalescingProvider(
+            ReloginProvider(provider, provider_session), request_coalescing
+        ),
+    )
+
+    snapshot_store = SnapshotStore(hass, entry.entry_id)
+    coordinator = CityVisitorParkingCoordinator(
+        hass,
+        provider=provider,
+        config_entry=entry,
+        snapshot_store=snapshot_store,
+        host_services=host_services,
+        request_coalescing=request_coalescing,
+    )
+    snapshot = await snapshot_store.async_load(entry.data[CONF_PERMIT_ID])
+    if snapshot is not None:
+        # Warm start: serve the last good data right away and log in plus
+        # refresh in the background.
+        _LOGGER.debug(
+            "Seeding %s (permit %s) from the stored snapshot",
+            entry.title,
+            entry.data.get(CONF_PERMIT_ID),
+        )
+        coordinator.async_seed(snapshot)
+        coordinator.async_defer_login(provider_session.async_login)
+        entry.async_create_background_task(
+            hass,
+            coordinator.async_refresh(),
+            f"{entry.title} warm start refresh",
+        )
+    else:
+        try:
+            await provider_session.async_login()
+        except AuthError as err:
+            raise ConfigEntryAuthFailed from err
+        except NetworkError as err:
+            raise ConfigEntryNotReady from err
+        except PyCityVisitorParkingError as err:
+            raise ConfigEntryError from err
+        refresh_started = time.perf_counter()
+        await coordinator.async_config_entry_first_refresh()
+        _LOGGER.debug(
+            "Initial coordinator refresh duration for %s (permit %s): %.3fs",
+            entry.title,
+            entry.data.get(CONF_PERMIT_ID),
+            time.perf_counter() - refresh_started,
+        )
+
+    raw_free_weekdays = entry.options.get(CONF_FREE_WEEKDAYS, [])
+    entry.runtime_data = CityVisitorParkingRuntimeData(
+        client=client,
+        provider=provider,
+        provider_config=provider_config,
+        coordinator=coordinator,
+        permit_id=entry.data[CONF_PERMIT_ID],
+        auto_end_state=coordinator.auto_end_state,
+        operating_time_overrides=_normalize_operating_time_overrides(entry.options),
+        free_dates=str(entry.options.get(CONF_FREE_DATES, "")),
+        free_weekdays=list(raw_free_weekdays)
+        if isinstance(raw_free_weekdays, list)
+        else [],
+        auto_end=bool(entry.options.get(CONF_AUTO_END, False)),
+        request_coalescing=request_coalescing,
+        provider_session=provider_session,
+        host_services=host_services,
+    )
+
+    entry.async_on_unload(entry.add_update_listener(_async_update_listener))
+    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    return True
+
+
+async def _async_build_provider(
+    hass: HomeAssistant,
+    entry: CityVisitorParkingConfigEntry,
+    provider_config: ProviderConfig,
+) -> tuple[Client, BaseProvider, HostServices]:
+    """Create the provider and join the services shared by its host."""
+    host = host_key(provider_config.base_url, provider_config.provider_id)
     ha_cvp_version, pycvp_version = await async_get_versions(hass)
-    client = await async_create_client(hass, provider_config)
+    session_pool: HostSessionPool | None = None
+    http_session: aiohttp.ClientSession | None = None
+    if entry.options.get(CONF_DEDICATED_SESSION, False):
+        session_pool = async_get_session_pool(hass, host)
+        http_session = session_pool.async_acquire(entry.entry_id)
+        entry.async_on_unload(partial(session_pool.async_release, entry.entry_id))
+    client = await async_create_client(hass, provider_config, http_session)
     provider = await client.get_provider(
         provider_config.provider_id,
         base_url=provider_config.base_url,
@@ -151,6 +277,43 @@ async def async_setup_entry(
         pycvp_version=pycvp_version,
     )
     _install_zone_validity_logging(provider)
+
+    # Every entry talking to the same host shares one rate limit, with
+    # interactive writes served ahead of background polls.
+    rate, burst = _host_rate_limits(entry.options)
+    host_governor = async_get_host_governor(
+        hass, host, entry.entry_id, rate=rate, burst=burst
+    )
+    entry.async_on_unload(
+        partial(async_release_host_governor, hass, host, entry.entry_id)
+    )
+    # Entries on the same host poll in their own slot of the interval, and
+    # polls of every entry on a failing host pause together. Both are
+    # released in async_unload_entry; the unload callback covers setups that
+    # fail before the entry is loaded.
+    poll_scheduler = async_get_poll_scheduler(hass, host, entry.entry_id)
+    circuit_breaker = async_get_circuit_breaker(hass, host, entry.entry_id)
+    entry.async_on_unload(
+        partial(_async_release_host_state, hass, host, entry.entry_id)
+    )
+    return (
+        client,
+        cast("BaseProvider", RateLimitedProvider(provider, host_governor)),
+        HostServices(
+            poll_scheduler=poll_scheduler,
+            circuit_breaker=circuit_breaker,
+            host_governor=host_governor,
+            session_pool=session_pool,
+        ),
+    )
+
+
+async def _async_login(
+    hass: HomeAssistant,
+    entry: CityVisitorParkingConfigEntry,
+    provider: BaseProvider,
+) -> None:
+    """Log in to the provider and remember the resolved login params."""
     login_started = time.perf_counter()
     try:
         await provider.login(
@@ -163,16 +326,12 @@ async def async_setup_entry(
             # on restart (e.g. location for 2park, permit_media_type_id for dvsportal).
             **entry.data.get(CONF_RESOLVED_LOGIN_PARAMS, {}),
         )
-    except AuthError as err:
+    except AuthError:
         if entry.data.get(CONF_RESOLVED_LOGIN_PARAMS):
             hass.config_entries.async_update_entry(
                 entry, data={**entry.data, CONF_RESOLVED_LOGIN_PARAMS: {}}
             )
-        raise ConfigEntryAuthFailed from err
-    except NetworkError as err:
-        raise ConfigEntryNotReady from err
-    except PyCityVisitorParkingError as err:
-        raise ConfigEntryError from err
+        raise
     finally:
         _LOGGER.debug(
             "Provider login duration for %s (permit %s): %.3fs",
@@ -187,42 +346,6 @@ async def async_setup_entry(
             entry, data={**entry.data, CONF_RESOLVED_LOGIN_PARAMS: resolved}
         )
 
-    auto_end_state = AutoEndState()
-    coordinator = CityVisitorParkingCoordinator(
-        hass,
-        provider=provider,
-        config_entry=entry,
-        permit_id=entry.data[CONF_PERMIT_ID],
-        auto_end_state=auto_end_state,
-    )
-    refresh_started = time.perf_counter()
-    await coordinator.async_config_entry_first_refresh()
-    _LOGGER.debug(
-        "Initial coordinator refresh duration for %s (permit %s): %.3fs",
-        entry.title,
-        entry.data.get(CONF_PERMIT_ID),
-        time.perf_counter() - refresh_started,
-    )
-
-    raw_free_weekdays = entry.options.get(CONF_FREE_WEEKDAYS, [])
-    entry.runtime_data = CityVisitorParkingRuntimeData(
-        client=client,
-        provider=provider,
-        provider_config=provider_config,
-        coordinator=coordinator,
-        permit_id=entry.data[CONF_PERMIT_ID],
-        auto_end_state=auto_end_state,
-        operating_time_overrides=_normalize_operating_time_overrides(entry.options),
-        free_dates=str(entry.options.get(CONF_FREE_DATES, "")),
-        free_weekdays=list(raw_free_weekdays)
-        if isinstance(raw_free_weekdays, list)
-        else [],
-    )
-
-    entry.async_on_unload(entry.add_update_listener(_async_update_listener))
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
-    return True
-
 
 def _install_zone_validity_logging(provider: object) -> None:
     """Add extra debug logging when zone validity falls back to the zone block."""
@@ -296,30 +419,88 @@ def _normalize_operating_time_overrides(
     return normalized
 
 
+def _host_rate_limits(options: Mapping[str, object]) -> tuple[float, int]:
+    """Return the host rate and burst an entry asks for."""
+    return (
+        float(
+            cast(
+                "float",
+                options.get(CONF_HOST_REQUESTS_PER_SECOND, HOST_REQUESTS_PER_SECOND),
+            )
+        ),
+        int(cast("int", options.get(CONF_HOST_BURST_REQUESTS, HOST_BURST_REQUESTS))),
+    )
+
+
 async def _async_update_listener(
     hass: HomeAssistant, entry: CityVisitorParkingConfigEntry
 ) -> None:
     """Handle config entry updates."""
     runtime: CityVisitorParkingRuntimeData = entry.runtime_data
+    host_services = runtime.host_services
+    if entry.options.get(CONF_DEDICATED_SESSION, False) != (
+        host_services.session_pool is not None
+    ):
+        # The HTTP session is fixed for the lifetime of the provider client.
+        await hass.config_entries.async_reload(entry.entry_id)
+        return
+    if host_services.host_governor is not None:
+        rate, burst = _host_rate_limits(entry.options)
+        host_services.host_governor.async_register(
+            entry.entry_id, rate=rate, burst=burst
+        )
     overrides = _normalize_operating_time_overrides(entry.options)
     free_dates = str(entry.options.get(CONF_FREE_DATES, ""))
     raw_free_weekdays = entry.options.get(CONF_FREE_WEEKDAYS, [])
     free_weekdays = (
         list(raw_free_weekdays) if isinstance(raw_free_weekdays, list) else []
     )
-    overrides_changed = overrides != runtime.operating_time_overrides
-    free_dates_changed = free_dates != runtime.free_dates
-    free_weekdays_changed = free_weekdays != runtime.free_weekdays
-    if overrides_changed or free_dates_changed or free_weekdays_changed:
-        # Reload so the coordinator recomputes availability with new windows.
-        await hass.config_entries.async_reload(entry.entry_id)
+    auto_end = bool(entry.options.get(CONF_AUTO_END, False))
+    if (
+        overrides != runtime.operating_time_overrides
+        or free_dates != runtime.free_dates
+        or free_weekdays != runtime.free_weekdays
+        or auto_end != runtime.auto_end
+    ):
+        # These options only shape the local schedule and the transition
+        # timer, so apply them in place instead of reloading the entry and
+        # logging in again.
+        runtime.operating_time_overrides = overrides
+        runtime.free_dates = free_dates
+        runtime.free_weekdays = free_weekdays
+        runtime.auto_end = auto_end
+        runtime.coordinator.async_apply_options()
 
 
 async def async_unload_entry(
     hass: HomeAssistant, entry: CityVisitorParkingConfigEntry
 ) -> bool:
     """Unload a City visitor parking config entry."""
-    return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    if not await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
+        return False
+    provider_config = entry.runtime_data.provider_config
+    _async_release_host_state(
+        hass,
+        host_key(provider_config.base_url, provider_config.provider_id),
+        entry.entry_id,
+    )
+    return True
+
+
+def _async_release_host_state(hass: HomeAssistant, host: str, entry_id: str) -> None:
+    """Release an entry's poll slot and circuit breaker on its host.
+
+    Releasing an entry twice is a no-op.
+    """
+    async_release_poll_scheduler(hass, host, entry_id)
+    async_release_circuit_breaker(hass, host, entry_id)
+
+
+async def async_remove_entry(
+    hass: HomeAssistant, entry: CityVisitorParkingConfigEntry
+) -> None:
+    """Remove stored data of a deleted config entry."""
+    await SnapshotStore(hass, entry.entry_id).async_remove()
 
 
 async def _async_register_frontend(hass: HomeAssistant, _component: str) -> None:
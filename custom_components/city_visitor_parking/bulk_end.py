@@ -0,0 +1,72 @@
+"""Bounded concurrent ending of reservations for City visitor parking."""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from pycityvisitorparking.exceptions import NetworkError, PyCityVisitorParkingError
+
+from .const import BULK_END_MAX_CONCURRENT, BULK_END_RETRIES, BULK_END_RETRY_DELAY
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from datetime import datetime
+
+    from pycityvisitorparking.provider.base import BaseProvider
+
+
+@dataclass(frozen=True)
+class EndResult:
+    """Outcome of ending one reservation."""
+
+    reservation_id: str
+    error: PyCityVisitorParkingError | None = None
+    attempts: int = 1
+
+    @property
+    def ended(self) -> bool:
+        """Return whether the provider ended the reservation."""
+        return self.error is None
+
+
+async def async_end_reservations(
+    provider: BaseProvider,
+    reservation_ids: Iterable[str],
+    end_time: datetime,
+    *,
+    max_concurrent: int = BULK_END_MAX_CONCURRENT,
+) -> list[EndResult]:
+    """End reservations in parallel and return one result per id, in order.
+
+    At most ``max_concurrent`` calls run at once. Network errors are retried
+    ``BULK_END_RETRIES`` times with exponential backoff starting at
+    ``BULK_END_RETRY_DELAY``; other provider errors are final. A failure
+    never cancels the remaining calls.
+    """
+    semaphore = asyncio.Semaphore(max_concurrent)
+    retry_delay = BULK_END_RETRY_DELAY.total_seconds()
+
+    async def _end(reservation_id: str) -> EndResult:
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                async with semaphore:
+                    await provider.end_reservation(reservation_id, end_time)
+            except NetworkError as err:
+                if attempt > BULK_END_RETRIES:
+                    return EndResult(reservation_id, err, attempt)
+            except PyCityVisitorParkingError as err:
+                return EndResult(reservation_id, err, attempt)
+            else:
+                return EndResult(reservation_id, attempts=attempt)
+            # Back off outside the semaphore so other ends keep going.
+            await asyncio.sleep(retry_delay * 2 ** (attempt - 1))
+
+    return list(
+        await asyncio.gather(
+            *(_end(reservation_id) for reservation_id in dict.fromkeys(reservation_ids))
+        )
+    )
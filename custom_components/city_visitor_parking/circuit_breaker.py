@@ -0,0 +1,147 @@
+"""Per-host circuit breaker for failing providers in City visitor parking."""
+
+from __future__ import annotations
+
+import random
+from enum import StrEnum
+from typing import TYPE_CHECKING, Final, cast
+
+from homeassistant.core import callback
+
+from .const import (
+    CIRCUIT_FAILURE_THRESHOLD,
+    CIRCUIT_MAX_OPEN_TIME,
+    CIRCUIT_MIN_OPEN_TIME,
+    DOMAIN,
+)
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+_BREAKERS_KEY: Final = "circuit_breakers"
+
+
+class CircuitState(StrEnum):
+    """State of a host circuit breaker."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class HostCircuitBreaker:
+    """Stop polling a provider host after consecutive failures.
+
+    Failures of every entry on the host count together. Once
+    ``CIRCUIT_FAILURE_THRESHOLD`` polls failed in a row the breaker opens and
+    polls are skipped until the open time has passed. The next poll then
+    probes the host alone; success closes the breaker, failure opens it
+    again for twice as long, up to ``CIRCUIT_MAX_OPEN_TIME``. Open times are
+    jittered between half and the full backoff so entries do not retry in
+    lockstep.
+
+    Times are monotonic seconds passed in by the caller.
+    """
+
+    def __init__(
+        self,
+        *,
+        failure_threshold: int = CIRCUIT_FAILURE_THRESHOLD,
+        min_open_time: float = CIRCUIT_MIN_OPEN_TIME.total_seconds(),
+        max_open_time: float = CIRCUIT_MAX_OPEN_TIME.total_seconds(),
+    ) -> None:
+        """Initialize a closed breaker."""
+        self._failure_threshold = failure_threshold
+        self._min_open_time = min_open_time
+        self._max_open_time = max_open_time
+        self.state: CircuitState = CircuitState.CLOSED
+        self.failures: int = 0
+        self.trips: int = 0
+        self._open_until: float | None = None
+        self._entry_ids: set[str] = set()
+
+    @callback
+    def async_register(self, entry_id: str) -> None:
+        """Count an entry as a user of the breaker."""
+        self._entry_ids.add(entry_id)
+
+    @callback
+    def async_unregister(self, entry_id: str) -> bool:
+        """Drop an entry and return True when no entry is left."""
+        self._entry_ids.discard(entry_id)
+        return not self._entry_ids
+
+    def allow(self, now: float) -> bool:
+        """Return whether a poll may call the provider now."""
+        if self.state is CircuitState.CLOSED:
+            return True
+        if self._open_until is not None and now < self._open_until:
+            return False
+        # Let this poll probe the host; others wait for its outcome, or for
+        # the probe to time out when it never reports back.
+        self.state = CircuitState.HALF_OPEN
+        self._open_until = now + self._min_open_time
+        return True
+
+    def record_success(self) -> None:
+        """Close the breaker after a successful call."""
+        self.state = CircuitState.CLOSED
+        self.failures = 0
+        self.trips = 0
+        self._open_until = None
+
+    def record_failure(self, now: float) -> None:
+        """Count a failed call and open the breaker when needed."""
+        self.failures += 1
+        if self.state is CircuitState.OPEN or (
+            self.state is CircuitState.CLOSED
+            and self.failures < self._failure_threshold
+        ):
+            return
+        self.trips += 1
+        backoff = min(self._max_open_time, self._min_open_time * 2 ** (self.trips - 1))
+        self.state = CircuitState.OPEN
+        self._open_until = now + backoff * random.uniform(0.5, 1.0)
+
+    def retry_after(self, now: float) -> float | None:
+        """Return seconds until polls should try again, or None when closed."""
+        if self.state is CircuitState.CLOSED or self._open_until is None:
+            return None
+        return max(self._open_until - now, 0.0)
+
+    def as_dict(self, now: float) -> dict[str, object]:
+        """Return the breaker state for diagnostics."""
+        retry_after = self.retry_after(now)
+        return {
+            "state": self.state.value,
+            "consecutive_failures": self.failures,
+            "trips": self.trips,
+            "retry_after": round(retry_after, 1) if retry_after is not None else None,
+        }
+
+
+def async_get_circuit_breaker(
+    hass: HomeAssistant, key: str, entry_id: str
+) -> HostCircuitBreaker:
+    """Return the circuit breaker shared by every config entry using host key."""
+    breakers = _breakers(hass)
+    breaker = breakers.get(key)
+    if breaker is None:
+        breaker = breakers[key] = HostCircuitBreaker()
+    breaker.async_register(entry_id)
+    return breaker
+
+
+@callback
+def async_release_circuit_breaker(hass: HomeAssistant, key: str, entry_id: str) -> None:
+    """Release an entry's use and drop the breaker after the last one."""
+    breakers = _breakers(hass)
+    breaker = breakers.get(key)
+    if breaker is not None and breaker.async_unregister(entry_id):
+        del breakers[key]
+
+
+def _breakers(hass: HomeAssistant) -> dict[str, HostCircuitBreaker]:
+    """Return the circuit breakers registry."""
+    data: dict[str, object] = hass.data.setdefault(DOMAIN, {})
+    return cast("dict[str, HostCircuitBreaker]", data.setdefault(_BREAKERS_KEY, {}))
@@ -8,14 +8,23 @@ from homeassistant.helpers import aiohttp_client
 from pycityvisitorparking import Client
 
 if TYPE_CHECKING:
+    import aiohttp
     from homeassistant.core import HomeAssistant
 
     from .models import ProviderConfig
 
 
-async def async_create_client(hass: HomeAssistant, provider: ProviderConfig) -> Client:
-    """Create a pycityvisitorparking client using Home Assistant's session."""
-    session = aiohttp_client.async_get_clientsession(hass)
+async def async_create_client(
+    hass: HomeAssistant,
+    provider: ProviderConfig,
+    session: aiohttp.ClientSession | None = None,
+) -> Client:
+    """Create a pycityvisitorparking client.
+
+    Uses Home Assistant's shared session unless a dedicated one is passed.
+    """
+    if session is None:
+        session = aiohttp_client.async_get_clientsession(hass)
     return Client(
         session=session,
         base_url=provider.base_url,
@@ -31,15 +31,22 @@ from .const import (
     CONF_API_URL,
     CONF_AUTO_END,
     CONF_BASE_URL,
+    CONF_DEDICATED_SESSION,
     CONF_DEMO_MODE,
     CONF_FREE_DATES,
     CONF_FREE_WEEKDAYS,
     CONF_GUI_URL,
+    CONF_HOST_BURST_REQUESTS,
+    CONF_HOST_REQUESTS_PER_SECOND,
+    CONF_MAX_DATA_AGE,
     CONF_MUNICIPALITY,
     CONF_OPERATING_TIME_OVERRIDES,
     CONF_PERMIT_ID,
     CONF_PROVIDER_ID,
+    DEFAULT_MAX_DATA_AGE,
     DOMAIN,
+    HOST_BURST_REQUESTS,
+    HOST_REQUESTS_PER_SECOND,
     WEEKDAY_KEYS,
 )
 from .helpers import get_attr, normalize_override_windows, parse_comma_separated
@@ -471,6 +478,18 @@ class CityVisitorParkingOptionsFlow(config_entries.OptionsFlow):
                 title="",
                 data={
                     CONF_AUTO_END: cast("bool", user_input[CONF_AUTO_END]),
+                    CONF_MAX_DATA_AGE: _normalize_max_data_age(
+                        user_input.get(CONF_MAX_DATA_AGE)
+                    ),
+                    CONF_DEDICATED_SESSION: bool(
+                        user_input.get(CONF_DEDICATED_SESSION, False)
+                    ),
+                    CONF_HOST_REQUESTS_PER_SECOND: _normalize_host_rate(
+                        user_input.get(CONF_HOST_REQUESTS_PER_SECOND)
+                    ),
+                    CONF_HOST_BURST_REQUESTS: _normalize_host_burst(
+                        user_input.get(CONF_HOST_BURST_REQUESTS)
+                    ),
                     CONF_FREE_DATES: free_dates,
                     CONF_FREE_WEEKDAYS: free_weekdays,
                     CONF_OPERATING_TIME_OVERRIDES: overrides,
@@ -487,11 +506,40 @@ class CityVisitorParkingOptionsFlow(config_entries.OptionsFlow):
         if not isinstance(overrides, Mapping):
             overrides = {}
         overrides = cast("Mapping[str, object]", overrides)
-        defaults = {CONF_AUTO_END: self._config_entry.options.get(CONF_AUTO_END, False)}
+        defaults = {
+            CONF_AUTO_END: self._config_entry.options.get(CONF_AUTO_END, False),
+            CONF_DEDICATED_SESSION: self._config_entry.options.get(
+                CONF_DEDICATED_SESSION, False
+            ),
+        }
         if user_input is not None:
-            raw_auto_end = user_input.get(CONF_AUTO_END)
-            if isinstance(raw_auto_end, bool):
-                defaults[CONF_AUTO_END] = raw_auto_end
+            for key in (CONF_AUTO_END, CONF_DEDICATED_SESSION):
+                raw_value = user_input.get(key)
+                if isinstance(raw_value, bool):
+                    defaults[key] = raw_value
+        max_data_age_default = _normalize_max_data_age(
+            self._config_entry.options.get(CONF_MAX_DATA_AGE)
+        )
+        if user_input is not None and CONF_MAX_DATA_AGE in user_input:
+            max_data_age_default = _normalize_max_data_age(
+                user_input[CONF_MAX_DATA_AGE]
+            )
+
+        host_rate_default = _normalize_host_rate(
+            self._config_entry.options.get(CONF_HOST_REQUESTS_PER_SECOND)
+        )
+        host_burst_default = _normalize_host_burst(
+            self._config_entry.options.get(CONF_HOST_BURST_REQUESTS)
+        )
+        if user_input is not None:
+            if CONF_HOST_REQUESTS_PER_SECOND in user_input:
+                host_rate_default = _normalize_host_rate(
+                    user_input[CONF_HOST_REQUESTS_PER_SECOND]
+                )
+            if CONF_HOST_BURST_REQUESTS in user_input:
+                host_burst_default = _normalize_host_burst(
+                    user_input[CONF_HOST_BURST_REQUESTS]
+                )
 
         raw_free_weekdays = self._config_entry.options.get(CONF_FREE_WEEKDAYS, [])
         free_weekdays: list[str] = (
@@ -513,6 +561,38 @@ class CityVisitorParkingOptionsFlow(config_entries.OptionsFlow):
 
         schema: dict[object, object] = {
             vol.Required(CONF_AUTO_END, default=defaults[CONF_AUTO_END]): cv.boolean,
+            vol.Optional(
+                CONF_MAX_DATA_AGE, default=max_data_age_default
+            ): selector.NumberSelector(
+                selector.NumberSelectorConfig(
+                    min=0,
+                    max=3600,
+                    step=1,
+                    unit_of_measurement="s",
+                    mode=selector.NumberSelectorMode.BOX,
+                )
+            ),
+            vol.Optional(
+                CONF_DEDICATED_SESSION, default=defaults[CONF_DEDICATED_SESSION]
+            ): cv.boolean,
+            vol.Optional(
+                CONF_HOST_REQUESTS_PER_SECOND, default=host_rate_default
+            ): selector.NumberSelector(
+                selector.NumberSelectorConfig(
+                    min=0.1,
+                    max=10,
+                    step=0.1,
+                    unit_of_measurement="req/s",
+                    mode=selector.NumberSelectorMode.BOX,
+                )
+            ),
+            vol.Optional(
+                CONF_HOST_BURST_REQUESTS, default=host_burst_default
+            ): selector.NumberSelector(
+                selector.NumberSelectorConfig(
+                    min=1, max=20, step=1, mode=selector.NumberSelectorMode.BOX
+                )
+            ),
         }
 
         day_schema = _build_day_schema(overrides, free_weekdays, user_input)
@@ -781,6 +861,27 @@ def _normalize_free_dates(value: str, errors: dict[str, str]) -> str:
     return ", ".join(entries)
 
 
+def _normalize_max_data_age(value: object) -> int:
+    """Return the data freshness limit in whole seconds."""
+    if isinstance(value, bool) or not isinstance(value, int | float):
+        return int(DEFAULT_MAX_DATA_AGE.total_seconds())
+    return max(0, int(value))
+
+
+def _normalize_host_rate(value: object) -> float:
+    """Return the sustained provider calls per second for the host."""
+    if isinstance(value, bool) or not isinstance(value, int | float) or value <= 0:
+        return HOST_REQUESTS_PER_SECOND
+    return float(value)
+
+
+def _normalize_host_burst(value: object) -> int:
+    """Return the back to back provider calls allowed for the host."""
+    if isinstance(value, bool) or not isinstance(value, int | float):
+        return HOST_BURST_REQUESTS
+    return max(1, int(value))
+
+
 def _normalize_optional_text(value: object) -> str | None:
     """Normalize optional text input to None or a stripped string."""
     if not isinstance(value, str):
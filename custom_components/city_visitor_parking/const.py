@@ -25,6 +25,10 @@ CONF_OPERATING_TIME_OVERRIDES: Final = "operating_time_overrides"
 CONF_AUTO_END: Final = "auto_end_reservation_when_free"
 CONF_FREE_DATES: Final = "free_dates"
 CONF_FREE_WEEKDAYS: Final = "free_weekdays"
+CONF_MAX_DATA_AGE: Final = "max_data_age"
+CONF_DEDICATED_SESSION: Final = "dedicated_connection_pool"
+CONF_HOST_REQUESTS_PER_SECOND: Final = "host_requests_per_second"
+CONF_HOST_BURST_REQUESTS: Final = "host_burst_requests"
 
 ATTR_LICENSE_PLATE: Final = "license_plate"
 ATTR_NAME: Final = "name"
@@ -32,12 +36,15 @@ ATTR_RESERVATION_ID: Final = "reservation_id"
 ATTR_FAVORITE_ID: Final = "favorite_id"
 ATTR_START_TIME: Final = "start_time"
 ATTR_END_TIME: Final = "end_time"
+ATTR_MAX_AGE: Final = "max_age"
+ATTR_REFRESH: Final = "refresh"
+ATTR_DELTAS: Final = "deltas"
 
 STATE_CHARGEABLE: Final = "chargeable"
 STATE_FREE: Final = "free"
 
 DEFAULT_UPDATE_INTERVAL: Final = timedelta(minutes=5)
-"""Polling interval used when a reservation is active or a zone transition is imminent.
+"""Polling interval used when a reservation is active or the zone is chargeable.
 
 This keeps HA responsive for the most time-sensitive situations: tracking an active
 reservation, reacting to auto-end logic, and reflecting a zone state change promptly
@@ -47,28 +54,140 @@ after it occurs.
 IDLE_UPDATE_INTERVAL: Final = timedelta(minutes=30)
 """Polling interval used when there is nothing urgent to track.
 
-Applied when no reservation is active, the zone is currently free, and no transition
-is expected within TRANSITION_LOOKAHEAD. Reduces API calls by up to ~83 % compared
-to polling at DEFAULT_UPDATE_INTERVAL continuously.
+Applied when no reservation is active and the zone is currently free. Zone
+transitions are applied locally by a timer, so they do not need faster polling.
+Reduces API calls by up to ~83 % compared to polling at DEFAULT_UPDATE_INTERVAL
+continuously.
 """
 
-TRANSITION_LOOKAHEAD: Final = timedelta(minutes=30)
-"""How far ahead of a known zone transition to switch back to DEFAULT_UPDATE_INTERVAL.
+AUTO_END_COOLDOWN: Final = timedelta(minutes=10)
+
+BULK_END_MAX_CONCURRENT: Final = 3
+"""Reservations ended in parallel by auto-end and the end-all service.
 
-When a transition is this close, the coordinator starts polling at the default (fast)
-rate so that the zone state change is reflected in HA shortly after it occurs.
+Kept at HOST_MAX_CONCURRENT_REQUESTS; more calls would only wait in the host
+governor.
 """
+BULK_END_RETRIES: Final = 2
+"""Extra attempts for a reservation end that failed with a network error."""
+BULK_END_RETRY_DELAY: Final = timedelta(seconds=1)
+"""Delay before the first retry; doubled for every further attempt."""
 
-TRANSITION_BUFFER: Final = timedelta(minutes=2)
-"""Lead time subtracted when scheduling a precise update before a zone transition.
+SCHEDULE_HORIZON: Final = timedelta(days=15)
+"""How many days ahead the compiled chargeable-window schedule is resolved.
 
-When the next zone change is known and further away than TRANSITION_LOOKAHEAD, the
-coordinator schedules the next update to arrive this much *before* the transition
-rather than landing exactly on it.  A small buffer compensates for scheduling jitter
-and ensures the poll happens before — not after — the transition moment.
+The coordinator recompiles the schedule when the zone validity or the schedule
+options change, or once fewer than eight days of the horizon remain.
 """
 
-AUTO_END_COOLDOWN: Final = timedelta(minutes=10)
+SCHEDULE_CACHE_SIZE: Final = 64
+"""Compiled schedules kept process-wide for reuse across config entries."""
+
+ZONE_VALIDITY_CACHE_SIZE: Final = 64
+"""Parsed zone validity block sets kept process-wide across config entries."""
+
+DEFAULT_MAX_DATA_AGE: Final = timedelta(seconds=30)
+"""Maximum age of coordinator data served by read services without a refresh.
+
+``list_reservations`` and ``get_status`` answer from memory while the last
+successful fetch is younger than this, so bursts of calls from a blueprint or
+several open cards share one provider round-trip. Overridable per config entry
+(``max_data_age`` option) and per service call (``max_age`` field).
+"""
+
+BALANCE_PROJECTION_INTERVAL: Final = timedelta(minutes=1)
+"""How often a minute balance is projected locally while it is being consumed.
+
+During an active reservation in a chargeable window the remaining minutes are
+counted down between polls, anchored to the balance of the last fetch.
+"""
+
+RECONCILE_DELAY: Final = timedelta(seconds=10)
+"""Quiet period after the latest locally applied write before re-fetching.
+
+Favorite and reservation changes are applied to the coordinator snapshot right
+away; one background refresh after this delay reconciles the snapshot with the
+provider, so a series of edits costs a single round-trip.
+"""
+
+RECONCILE_MAX_DELAY: Final = timedelta(minutes=1)
+"""Longest a write waits for its reconcile while further writes keep coming."""
+
+HOST_REQUESTS_PER_SECOND: Final = 1.0
+"""Default sustained rate of provider calls per host, shared by all entries.
+
+Most municipalities share a handful of provider hosts, so entries refreshing
+at the same time are throttled together instead of each hitting the host.
+Entries can lower or raise it in their options; the strictest rate of the
+entries on a host applies.
+"""
+
+HOST_BURST_REQUESTS: Final = 5
+"""Default provider calls a host may receive back to back before rate limiting.
+
+Like the rate, the smallest burst of the entries on a host applies.
+"""
+
+HOST_MAX_CONCURRENT_REQUESTS: Final = 3
+"""Provider calls that may be in flight to one host at the same time."""
+
+POLL_JITTER_FRACTION: Final = 0.2
+"""Share of a poll slot added as deterministic per-entry jitter.
+
+Entries on the same provider host poll in evenly spaced slots of the update
+interval; the jitter keeps hosts with identical entry layouts from lining up.
+"""
+
+CIRCUIT_FAILURE_THRESHOLD: Final = 3
+"""Consecutive failed polls on one provider host before polling pauses."""
+
+CIRCUIT_MIN_OPEN_TIME: Final = timedelta(minutes=5)
+"""First pause after the circuit of a failing provider host opens.
+
+Every failed probe doubles the pause up to ``CIRCUIT_MAX_OPEN_TIME``; the last
+snapshot stays in memory while the host is down.
+"""
+
+CIRCUIT_MAX_OPEN_TIME: Final = timedelta(hours=1)
+"""Longest pause between probes of a failing provider host."""
+
+HOST_KEEPALIVE_TIMEOUT: Final = timedelta(seconds=90)
+"""How long idle connections of a dedicated host session are kept open.
+
+Covers the calls of one refresh and a write followed by its reconcile
+refresh, which comes within RECONCILE_MAX_DELAY. Polls are minutes apart, and
+provider servers close idle connections well before that, so a longer
+timeout would only keep sockets the server has already dropped.
+"""
+
+HOST_DNS_CACHE_TTL: Final = timedelta(minutes=10)
+"""How long a dedicated host session caches the resolved provider address."""
+
+HOST_CONNECT_TIMEOUT: Final = timedelta(seconds=10)
+"""Connect and TLS handshake timeout of a dedicated host session."""
+
+HOST_READ_TIMEOUT: Final = timedelta(seconds=30)
+"""Timeout between reads of a response on a dedicated host session."""
+
+SECTION_BALANCE: Final = "balance"
+SECTION_RESERVATIONS: Final = "reservations"
+SECTION_FAVORITES: Final = "favorites"
+SECTION_ZONE_VALIDITY: Final = "zone_validity"
+SECTION_AVAILABILITY: Final = "availability"
+COORDINATOR_SECTIONS: Final = frozenset(
+    {
+        SECTION_BALANCE,
+        SECTION_RESERVATIONS,
+        SECTION_FAVORITES,
+        SECTION_ZONE_VALIDITY,
+        SECTION_AVAILABILITY,
+    }
+)
+"""Parts of the coordinator data that are fingerprinted on every update.
+
+Entities declare the sections they render and skip state writes when none of
+them changed, which keeps unchanged states out of the recorder.
+"""
 
 WEEKDAY_KEYS: Final[list[str]] = [
     "mon",
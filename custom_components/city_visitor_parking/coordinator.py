@@ -2,39 +2,62 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import time
+from dataclasses import replace
 from datetime import UTC, datetime, timedelta
-from typing import TYPE_CHECKING, Protocol, cast
+from functools import lru_cache
+from typing import TYPE_CHECKING, Final, Protocol, cast
 
+from homeassistant.core import CALLBACK_TYPE, callback
 from homeassistant.exceptions import ConfigEntryAuthFailed
+from homeassistant.helpers.event import async_track_point_in_utc_time
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.util import dt as dt_util
 from pycityvisitorparking import AuthError, NetworkError
 from pycityvisitorparking.exceptions import PyCityVisitorParkingError
 
+from .bulk_end import async_end_reservations
 from .const import (
     AUTO_END_COOLDOWN,
+    BALANCE_PROJECTION_INTERVAL,
     CONF_AUTO_END,
+    CONF_PERMIT_ID,
+    COORDINATOR_SECTIONS,
     DEFAULT_UPDATE_INTERVAL,
     IDLE_UPDATE_INTERVAL,
-    TRANSITION_BUFFER,
-    TRANSITION_LOOKAHEAD,
+    SECTION_AVAILABILITY,
+    SECTION_BALANCE,
+    SECTION_FAVORITES,
+    SECTION_RESERVATIONS,
+    SECTION_ZONE_VALIDITY,
+    ZONE_VALIDITY_CACHE_SIZE,
 )
-from .helpers import get_attr
+from .helpers import build_favorite_index, get_attr
+from .local_updates import with_reservation_ended
 from .models import (
     AutoEndState,
     CoordinatorData,
     Reservation,
     TimeRange,
-    ZoneAvailability,
 )
 from .models import Favorite as CoordinatorFavorite
-from .time_windows import windows_for_today
+from .reconcile import WriteReconciler
+from .request_coalescing import call_key
+from .reservation_index import ReservationIndex, reservation_index
+from .runtime_data import HostServices
+from .schedule import (
+    ChargeSchedule,
+    effective_schedule,
+    provider_schedule,
+    shared_schedule,
+)
+from .snapshot_store import CoordinatorSnapshot
 from .version import async_get_versions, build_log_block
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable, Mapping
+    from collections.abc import Awaitable, Callable, Iterable, Mapping, Sequence
 
     from homeassistant.config_entries import ConfigEntry
     from homeassistant.core import HomeAssistant
@@ -42,6 +65,11 @@ if TYPE_CHECKING:
     from pycityvisitorparking import Permit
     from pycityvisitorparking import Reservation as ProviderReservation
     from pycityvisitorparking.provider.base import BaseProvider as ProviderProtocol
+
+    from .circuit_breaker import HostCircuitBreaker
+    from .poll_scheduler import HostPollScheduler
+    from .request_coalescing import SingleFlight
+    from .snapshot_store import SnapshotStore
 else:
 
     class ProviderProtocol(Protocol):
@@ -65,18 +93,22 @@ else:
 
 _LOGGER = logging.getLogger(__name__)
 
+_MINUTE_BALANCE_UNITS: Final = frozenset({None, "MINUTE"})
+"""Balance units counted in minutes; providers without a unit report minutes."""
+
 
 class CityVisitorParkingCoordinator(DataUpdateCoordinator[CoordinatorData]):
     """Data update coordinator for City visitor parking."""
 
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         hass: HomeAssistant,
         *,
         provider: ProviderProtocol,
         config_entry: ConfigEntry,
-        permit_id: str,
-        auto_end_state: AutoEndState,
+        snapshot_store: SnapshotStore | None = None,
+        host_services: HostServices | None = None,
+        request_coalescing: SingleFlight | None = None,
     ) -> None:
         """Initialize the coordinator."""
         super().__init__(
@@ -88,13 +120,293 @@ class CityVisitorParkingCoordinator(DataUpdateCoordinator[CoordinatorData]):
         )
         self._entry_title: str = config_entry.title
         self._provider: ProviderProtocol = provider
-        self._permit_id: str = permit_id
-        self._auto_end_state: AutoEndState = auto_end_state
+        self._permit_id: str = config_entry.data[CONF_PERMIT_ID]
+        self.auto_end_state: AutoEndState = AutoEndState()
+        self._snapshot_store: SnapshotStore | None = snapshot_store
+        host_services = host_services or HostServices()
+        self._poll_scheduler: HostPollScheduler | None = host_services.poll_scheduler
+        self._poll_interval: timedelta = DEFAULT_UPDATE_INTERVAL
+        self._circuit_breaker: HostCircuitBreaker | None = host_services.circuit_breaker
+        self._request_coalescing: SingleFlight | None = request_coalescing
+        self._pending_login: Callable[[], Awaitable[None]] | None = None
         self._unavailable_logged: bool = False
+        self._data_updated_at: float | None = None
+        self._refresh_task: asyncio.Task[None] | None = None
+        self._charge_schedule: ChargeSchedule | None = None
+        self._provider_schedule: ChargeSchedule | None = None
+        self._fingerprints: dict[str, int] = {}
+        self.changed_sections: frozenset[str] = COORDINATOR_SECTIONS
+        self._transition_at: datetime | None = None
+        self._transition_unsub: CALLBACK_TYPE | None = None
+        self._balance_anchor: tuple[datetime, float] | None = None
+        self._balance_tick_unsub: CALLBACK_TYPE | None = None
+        self.write_reconciler = WriteReconciler(
+            hass,
+            config_entry,
+            function=self.async_refresh,
+            name=f"{self._entry_title} reconcile after write",
+        )
+
+    @property
+    def data_age_seconds(self) -> float | None:
+        """Return seconds since the last successful provider fetch."""
+        if self._data_updated_at is None:
+            return None
+        return time.monotonic() - self._data_updated_at
+
+    async def async_refresh_if_stale(self, max_age: timedelta) -> None:
+        """Refresh only when the data is older than max_age.
+
+        Concurrent callers share a single in-flight refresh, so a burst of
+        service calls results in at most one provider round-trip.
+        """
+        age = self.data_age_seconds
+        if (
+            self.last_update_success
+            and age is not None
+            and age <= max_age.total_seconds()
+        ):
+            return
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = self.hass.async_create_task(
+                self.async_refresh(),
+                f"{self._entry_title} on-demand refresh",
+            )
+        await asyncio.shield(self._refresh_task)
+
+    @callback
+    def async_defer_login(self, login: Callable[[], Awaitable[None]]) -> None:
+        """Run the provider login before the next fetch instead of during setup."""
+        self._pending_login = login
+
+    @callback
+    def async_seed(self, snapshot: CoordinatorSnapshot) -> None:
+        """Serve a persisted snapshot until the provider answers again.
+
+        The seeded data counts as stale until a refresh succeeds.
+        """
+        self.data = self._build_data(snapshot, dt_util.utcnow())
+
+    @callback
+    def async_apply_local_update(self, data: CoordinatorData) -> None:
+        """Publish a locally updated snapshot and reconcile it later.
+
+        Listeners are notified immediately without touching the polling
+        schedule; a debounced background refresh brings the snapshot back in
+        line with the provider.
+        """
+        self.data = data
+        self.async_update_listeners()
+        self.async_schedule_reconcile()
+
+    @callback
+    def async_schedule_reconcile(self) -> None:
+        """Mark the entry dirty so one refresh follows the current write burst."""
+        self.write_reconciler.async_mark_dirty()
+
+    async def async_shutdown(self) -> None:
+        """Cancel pending reconciliation and shut down the coordinator."""
+        self.write_reconciler.async_shutdown()
+        self._async_cancel_transition()
+        self._async_cancel_balance_tick()
+        if self._snapshot_store is not None:
+            await self._snapshot_store.async_flush()
+        await super().async_shutdown()
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Record which data sections changed, then notify listeners."""
+        fingerprints = (
+            {}
+            if self.data is None
+            else section_fingerprints(self.data, self._options(), dt_util.utcnow())
+        )
+        self.changed_sections = frozenset(
+            section
+            for section in COORDINATOR_SECTIONS
+            if section not in fingerprints
+            or fingerprints[section] != self._fingerprints.get(section)
+        )
+        self._fingerprints = fingerprints
+        self._async_arm_transition()
+        self._async_arm_balance_tick()
+        super().async_update_listeners()
+
+    @callback
+    def _async_arm_transition(self) -> None:
+        """Arm a timer at the next zone transition of the current data.
+
+        Today's windows also roll over at local midnight, so the timer never
+        waits past the next midnight.
+        """
+        if self.data is None or not (
+            self._listeners or self._auto_end_enabled(self.data)
+        ):
+            self._async_cancel_transition()
+            return
+        now = dt_util.utcnow()
+        fire_at = dt_util.start_of_local_day(
+            (dt_util.as_local(now) + timedelta(days=1)).date()
+        )
+        next_change = self.data.zone_availability.next_change_time
+        if next_change is not None and now < next_change < fire_at:
+            fire_at = next_change
+        if fire_at == self._transition_at and self._transition_unsub is not None:
+            return
+        self._async_cancel_transition()
+        self._transition_at = fire_at
+        self._transition_unsub = async_track_point_in_utc_time(
+            self.hass, self._async_handle_transition, fire_at
+        )
+
+    @callback
+    def _async_cancel_transition(self) -> None:
+        """Cancel a pending zone transition timer."""
+        if self._transition_unsub is not None:
+            self._transition_unsub()
+            self._transition_unsub = None
+        self._transition_at = None
+
+    @callback
+    def _async_arm_balance_tick(self) -> None:
+        """Arm the next local balance projection while minutes are consumed."""
+        data = self.data
+        if (
+            data is None
+            or not self._listeners
+            or self._balance_anchor is None
+            or data.permit_balance_unit not in _MINUTE_BALANCE_UNITS
+            or not data.active_reservations
+            or not data.zone_availability.is_chargeable_now
+        ):
+            self._async_cancel_balance_tick()
+            return
+        if self._balance_tick_unsub is not None:
+            return
+        self._balance_tick_unsub = async_track_point_in_utc_time(
+            self.hass,
+            self._async_handle_balance_tick,
+            dt_util.utcnow() + BALANCE_PROJECTION_INTERVAL,
+        )
+
+    @callback
+    def _async_cancel_balance_tick(self) -> None:
+        """Cancel a pending balance projection."""
+        if self._balance_tick_unsub is not None:
+            self._balance_tick_unsub()
+            self._balance_tick_unsub = None
+
+    @callback
+    def _async_handle_balance_tick(self, _fired_at: datetime) -> None:
+        """Publish the projected balance without contacting the provider."""
+        self._balance_tick_unsub = None
+        data = self.data
+        if data is None or self._balance_anchor is None:
+            return
+        now = dt_util.utcnow()
+        anchored_at, anchored_balance = self._balance_anchor
+        self.data = replace(
+            data,
+            permit_remaining_balance=projected_balance(
+                data, self._options(), anchored_at, anchored_balance, now
+            ),
+            active_reservations=reservation_index(data).active_at(now),
+        )
+        self.async_update_listeners()
+
+    @callback
+    def async_apply_options(self) -> None:
+        """Recompute zone availability after the schedule or auto-end options changed.
+
+        Operating time overrides and free days only affect the local schedule,
+        so the current data is republished without contacting the provider.
+        Every section counts as changed because entities may render the
+        options themselves.
+        """
+        # Auto-end alone keeps the transition timer armed, so arm or cancel
+        # it for the new option even when there is no data to republish.
+        self._async_arm_transition()
+        if self.data is None:
+            return
+        self._async_recompute_schedule()
+        self._fingerprints = {}
+        self._async_publish_rescheduled()
+
+    @callback
+    def _async_handle_transition(self, _fired_at: datetime) -> None:
+        """Recompute zone availability locally and push it to listeners."""
+        self._transition_unsub = None
+        self._transition_at = None
+        if self.data is None:
+            return
+        self._async_recompute_schedule()
+        data = self.data
+        _LOGGER.debug(
+            "Zone transition for %s: chargeable=%s",
+            self._entry_title,
+            data.zone_availability.is_chargeable_now,
+        )
+        # A zone turning chargeable needs the faster interval right away, not
+        # after the idle poll that is already scheduled.
+        self._async_publish_rescheduled()
+        if (
+            self.config_entry is not None
+            and self._auto_end_enabled(data)
+            and not data.zone_availability.is_chargeable_now
+        ):
+            # End reservations right at the free transition instead of at the
+            # next poll, then reconcile the snapshot with the provider.
+            self.config_entry.async_create_background_task(
+                self.hass,
+                self._async_auto_end_at_transition(data),
+                f"{self._entry_title} auto-end at zone transition",
+            )
+
+    @callback
+    def _async_publish_rescheduled(self) -> None:
+        """Notify listeners and move the pending poll to the adaptive interval.
+
+        async_set_updated_data replaces the pending poll with one after the
+        new interval. After a failed update, or while the host circuit is
+        open, the retry keeps its own timing and listeners are only notified.
+        """
+        data = self.data
+        if data is None:
+            return
+        breaker = self._circuit_breaker
+        if not self.last_update_success or (
+            breaker is not None and breaker.retry_after(time.monotonic()) is not None
+        ):
+            self.async_update_listeners()
+            return
+        self._set_poll_interval(self._compute_next_interval(data))
+        self.async_set_updated_data(data)
+
+    @callback
+    def _async_recompute_schedule(self) -> None:
+        """Recompute availability and the active set of the current data."""
+        data = self.data
+        if data is None:
+            return
+        now = dt_util.utcnow()
+        charge_schedule, provider_schedule = self._schedules(
+            list(data.zone_validity), now
+        )
+        self.data = replace(
+            data,
+            zone_availability=charge_schedule.availability(now),
+            active_reservations=reservation_index(data).active_at(now),
+            charge_schedule=charge_schedule,
+            provider_schedule=provider_schedule,
+        )
 
     async def _async_update_data(self) -> CoordinatorData:
         """Fetch data from the API and normalize it."""
         ha_cvp_version, pycvp_version = await async_get_versions(self.hass)
+        breaker = self._circuit_breaker
+        if breaker is not None and not breaker.allow(time.monotonic()):
+            self._schedule_retry()
+            raise UpdateFailed("Provider is failing, polling is paused")
         try:
             _LOGGER.debug(
                 "Fetching permit, reservations, and favorites for %s (permit %s)",
@@ -102,6 +414,10 @@ class CityVisitorParkingCoordinator(DataUpdateCoordinator[CoordinatorData]):
                 self._permit_id,
             )
 
+            if self._pending_login is not None:
+                await self._pending_login()
+                self._pending_login = None
+            fetch_started_at = self._fetch_started_at()
             started = time.perf_counter()
             permit, reservations, favorites = await self._provider.fetch_all()
             _LOGGER.debug(
@@ -111,6 +427,9 @@ class CityVisitorParkingCoordinator(DataUpdateCoordinator[CoordinatorData]):
                 len(reservations or []),
                 len(favorites or []),
             )
+            if breaker is not None:
+                breaker.record_success()
+            self.write_reconciler.async_fetched(fetch_started_at)
             if self._unavailable_logged:
                 _LOGGER.info("Visitor parking data is available again")
                 self._unavailable_logged = False
@@ -136,6 +455,9 @@ class CityVisitorParkingCoordinator(DataUpdateCoordinator[CoordinatorData]):
             raise ConfigEntryAuthFailed from err
         except (NetworkError, PyCityVisitorParkingError) as err:
             self._log_unavailable_once()
+            if breaker is not None:
+                breaker.record_failure(time.monotonic())
+            self._schedule_retry()
             _LOGGER.debug(
                 "%s",
                 build_log_block(
@@ -156,6 +478,7 @@ class CityVisitorParkingCoordinator(DataUpdateCoordinator[CoordinatorData]):
             raise UpdateFailed("API communication error") from err
         except Exception as err:  # Allowed in background tasks
             self._log_unavailable_once()
+            self._schedule_retry()
             _LOGGER.debug(
                 "%s",
                 build_log_block(
@@ -175,91 +498,172 @@ class CityVisitorParkingCoordinator(DataUpdateCoordinator[CoordinatorData]):
             )
             raise UpdateFailed("Unexpected error") from err
 
-        remaining_balance = _normalize_remaining_balance(permit)
         balance_unit = get_attr(permit, "balance_unit")
-        zone_validity = _normalize_zone_validity(permit)
-        normalized_reservations = _normalize_reservations(reservations)
-        normalized_favorites = _normalize_favorites(favorites)
+        remaining_balance = _normalize_remaining_balance(permit)
         now = dt_util.utcnow()
-        active_reservations = _active_reservations(normalized_reservations, now)
-        zone_availability = _compute_zone_availability(
-            zone_validity,
-            self._options(),
+        data = self._build_data(
+            CoordinatorSnapshot(
+                permit_id=self._permit_id,
+                permit_remaining_balance=remaining_balance,
+                permit_balance_unit=balance_unit
+                if isinstance(balance_unit, str)
+                else None,
+                zone_validity=_normalize_zone_validity(permit),
+                reservations=_normalize_reservations(reservations),
+                favorites=tuple(_normalize_favorites(favorites)),
+            ),
             now,
         )
+        # Re-anchor local balance projections to the provider value.
+        self._balance_anchor = (now, remaining_balance)
+
+        self._set_poll_interval(self._compute_next_interval(data))
+        self._data_updated_at = time.monotonic()
+        if self._snapshot_store is not None:
+            self._snapshot_store.async_delay_save(data)
+        await self._async_maybe_auto_end(data)
+        return data
 
-        data = CoordinatorData(
+    def _build_data(
+        self, snapshot: CoordinatorSnapshot, now: datetime
+    ) -> CoordinatorData:
+        """Return coordinator data with derived state computed for now."""
+        index = ReservationIndex(snapshot.reservations)
+        charge_schedule, provider_schedule = self._schedules(
+            snapshot.zone_validity, now
+        )
+        return CoordinatorData(
             permit_id=self._permit_id,
-            permit_remaining_balance=remaining_balance,
-            permit_balance_unit=balance_unit if isinstance(balance_unit, str) else None,
-            zone_validity=tuple(zone_validity),
-            reservations=tuple(normalized_reservations),
-            favorites=tuple(normalized_favorites),
-            zone_availability=zone_availability,
-            active_reservations=tuple(active_reservations),
+            permit_remaining_balance=snapshot.permit_remaining_balance,
+            permit_balance_unit=snapshot.permit_balance_unit,
+            zone_validity=charge_schedule.zone_validity,
+            reservations=tuple(snapshot.reservations),
+            favorites=snapshot.favorites,
+            zone_availability=charge_schedule.availability(now),
+            active_reservations=index.active_at(now),
+            charge_schedule=charge_schedule,
+            provider_schedule=provider_schedule,
+            reservation_index=index,
+            favorite_by_plate=build_favorite_index(snapshot.favorites),
         )
 
-        next_interval = self._compute_next_interval(data, now)
-        current_interval: timedelta | None = self.update_interval  # type: ignore[has-type]
-        if next_interval != current_interval:
-            _LOGGER.debug(
-                "Adaptive interval for %s: %s → %s",
-                self._entry_title,
-                current_interval,
-                next_interval,
+    def _auto_end_enabled(self, data: CoordinatorData) -> bool:
+        """Return True when auto-end may have to act on data."""
+        return bool(self._options().get(CONF_AUTO_END, False)) and bool(
+            data.active_reservations
+        )
+
+    async def _async_auto_end_at_transition(self, data: CoordinatorData) -> None:
+        """Auto-end reservations at a zone transition and reconcile afterwards.
+
+        Ended reservations are applied to the current snapshot right away, the
+        same way the end_reservation service does.
+        """
+        ended_ids = await self._async_maybe_auto_end(data)
+        current = self.data
+        if ended_ids and current is not None:
+            self.async_apply_local_update(
+                with_reservation_ended(current, ended_ids, dt_util.utcnow())
             )
-            self.update_interval = next_interval  # type: ignore[has-type]
+            return
+        self.async_schedule_reconcile()
 
-        await self._async_maybe_auto_end(data)
-        return data
+    async def _async_maybe_auto_end(self, data: CoordinatorData) -> list[str]:
+        """Auto-end reservations when the zone becomes free.
 
-    async def _async_maybe_auto_end(self, data: CoordinatorData) -> None:
-        """Auto-end reservations when the zone becomes free."""
+        Returns the ids of the reservations the provider ended.
+        """
         options = self._options()
         if not options.get(CONF_AUTO_END, False):
-            return
+            return []
         if data.zone_availability.is_chargeable_now:
-            return
+            return []
         if not data.active_reservations:
-            return
+            return []
 
         now = dt_util.utcnow()
         self._prune_auto_end_attempts(now)
 
-        for reservation in data.active_reservations:
-            if not _should_attempt_auto_end(
-                self._auto_end_state,
-                reservation.reservation_id,
-                now,
-            ):
-                continue
-
-            self._auto_end_state.attempted_ids[reservation.reservation_id] = now
-            try:
-                await self._provider.end_reservation(
-                    reservation.reservation_id,
-                    dt_util.as_utc(now),
-                )
-            except PyCityVisitorParkingError:
+        reservation_ids = [
+            reservation.reservation_id
+            for reservation in data.active_reservations
+            if _should_attempt_auto_end(
+                self.auto_end_state, reservation.reservation_id, now
+            )
+        ]
+        if not reservation_ids:
+            return []
+        for reservation_id in reservation_ids:
+            self.auto_end_state.attempted_ids[reservation_id] = now
+
+        results = await async_end_reservations(
+            self._provider, reservation_ids, dt_util.as_utc(now)
+        )
+        for result in results:
+            if not result.ended:
                 _LOGGER.debug(
-                    "Auto-end failed for an active reservation", exc_info=True
+                    "Auto-end failed for an active reservation after %s attempts: "
+                    "%s: %s",
+                    result.attempts,
+                    type(result.error).__name__,
+                    result.error,
                 )
+        return [result.reservation_id for result in results if result.ended]
 
     def _prune_auto_end_attempts(self, now: datetime) -> None:
         """Remove stale auto-end attempts to keep memory usage small."""
         cutoff = now - timedelta(hours=6)
-        self._auto_end_state.attempted_ids = {
+        self.auto_end_state.attempted_ids = {
             reservation_id: attempted_at
             for reservation_id, attempted_at in (
-                self._auto_end_state.attempted_ids.items()
+                self.auto_end_state.attempted_ids.items()
             )
             if attempted_at > cutoff
         }
 
+    def _schedules(
+        self, zone_validity: Sequence[TimeRange], now: datetime
+    ) -> tuple[ChargeSchedule, ChargeSchedule]:
+        """Return the effective and provider schedules, recompiling when needed.
+
+        Schedules are reused across polls while the zone validity and the
+        schedule options are unchanged and the horizon still covers now.
+        """
+        options = self._options()
+        schedule = self._charge_schedule
+        if (
+            schedule is None
+            or not schedule.matches(zone_validity, options)
+            or not schedule.covers(now)
+        ):
+            schedule = shared_schedule(zone_validity, options, now)
+            self._charge_schedule = schedule
+        provider = self._provider_schedule
+        if (
+            provider is None
+            or not provider.matches(schedule.zone_validity, {})
+            or not provider.covers(now)
+        ):
+            provider = shared_schedule(schedule.zone_validity, {}, now)
+            self._provider_schedule = provider
+        return schedule, provider
+
     def _options(self) -> Mapping[str, object]:
         """Return options from the config entry."""
         return self.config_entry.options if self.config_entry is not None else {}
 
+    def _fetch_started_at(self) -> float:
+        """Return when the data of the fetch about to run is read from.
+
+        A fetch that joins a shared call still running gets the data that
+        call reads, so writes made after that call started are not in it.
+        """
+        now = self.hass.loop.time()
+        if self._request_coalescing is None:
+            return now
+        started_at = self._request_coalescing.started_at(call_key("fetch_all"))
+        return now if started_at is None else started_at
+
     def _log_unavailable_once(self) -> None:
         """Log an unavailable message only once until recovery."""
         if self._unavailable_logged:
@@ -267,14 +671,46 @@ class CityVisitorParkingCoordinator(DataUpdateCoordinator[CoordinatorData]):
         _LOGGER.info("Visitor parking data is unavailable")
         self._unavailable_logged = True
 
-    def _compute_next_interval(self, data: CoordinatorData, now: datetime) -> timedelta:
+    def _schedule_retry(self) -> None:
+        """Time the next poll after a failed update.
+
+        An open host circuit delays it until the circuit allows a retry;
+        otherwise the next poll returns to the entry's slot.
+        """
+        retry_after = (
+            None
+            if self._circuit_breaker is None
+            else self._circuit_breaker.retry_after(time.monotonic())
+        )
+        if retry_after is None:
+            self._set_poll_interval(self._poll_interval)
+            return
+        self.update_interval = timedelta(seconds=max(retry_after, 1.0))  # type: ignore[has-type]
+
+    def _set_poll_interval(self, interval: timedelta) -> None:
+        """Apply the adaptive interval, aligned to the entry's poll slot."""
+        if interval != self._poll_interval:
+            _LOGGER.debug(
+                "Adaptive interval for %s: %s → %s",
+                self._entry_title,
+                self._poll_interval,
+                interval,
+            )
+            self._poll_interval = interval
+        if self._poll_scheduler is not None and self.config_entry is not None:
+            interval = self._poll_scheduler.next_interval(
+                self.config_entry.entry_id, interval, dt_util.utcnow()
+            )
+        self.update_interval = interval  # type: ignore[has-type]
+
+    def _compute_next_interval(self, data: CoordinatorData) -> timedelta:
         """Return the polling interval to use after the current update.
 
         The interval adapts to the current state so that the coordinator polls
         frequently when there is something time-sensitive to track, and falls
         back to a longer idle interval when nothing is expected to change soon.
-        This reduces API calls significantly during quiet periods without
-        sacrificing responsiveness when it matters.
+        Zone transitions are not polled for: the transition timer flips the
+        zone availability locally at each window boundary.
 
         Decision tree (first match wins):
 
@@ -288,21 +724,10 @@ class CityVisitorParkingCoordinator(DataUpdateCoordinator[CoordinatorData]):
            a reservation could be started at any moment and should appear in HA
            promptly.
 
-        3. **Zone transition imminent** (within ``TRANSITION_LOOKAHEAD``) →
-           ``DEFAULT_UPDATE_INTERVAL``
-           Polling at full speed ensures the zone-state sensor flips as soon as
-           the paid-parking window opens or closes.
-
-        4. **Zone transition known, not imminent** → precise interval
-           Schedule the next update to arrive ``TRANSITION_BUFFER`` before the
-           upcoming transition, capped at ``IDLE_UPDATE_INTERVAL``.  This
-           combines two goals: the coordinator wakes up just in time to catch
-           the transition (precise scheduling), but never goes completely silent
-           for more than ``IDLE_UPDATE_INTERVAL``.
-
-        5. **No upcoming transition known** → ``IDLE_UPDATE_INTERVAL``
-           Nothing is expected to change; poll at the minimum rate to keep data
-           reasonably fresh while minimising API traffic.
+        3. **Otherwise** → ``IDLE_UPDATE_INTERVAL``
+           Nothing provider-side is expected to change; poll at the minimum
+           rate to keep balance and reservations reasonably fresh while
+           minimising API traffic.
         """
         # 1. Active reservation — track closely.
         if data.active_reservations:
@@ -312,28 +737,17 @@ class CityVisitorParkingCoordinator(DataUpdateCoordinator[CoordinatorData]):
         if data.zone_availability.is_chargeable_now:
             return DEFAULT_UPDATE_INTERVAL
 
-        next_change = data.zone_availability.next_change_time
-        if next_change is not None:
-            time_until_change = next_change - now
-
-            # 3. Transition is imminent — switch to fast polling.
-            if time_until_change <= TRANSITION_LOOKAHEAD:
-                return DEFAULT_UPDATE_INTERVAL
-
-            # 4. Transition is known but not imminent — schedule precisely.
-            #    Arrive TRANSITION_BUFFER before the change, but cap at the
-            #    idle interval so we never sleep longer than that.
-            precise_interval = max(time_until_change - TRANSITION_BUFFER, timedelta(0))
-            return min(precise_interval, IDLE_UPDATE_INTERVAL)
-
-        # 5. No known upcoming change — idle polling.
+        # 3. Nothing urgent — idle polling.
         return IDLE_UPDATE_INTERVAL
 
 
 def _parse_time_range(item: object) -> TimeRange | None:
     """Parse start_time/end_time from an item into a valid TimeRange, or None."""
-    start = get_attr(item, "start_time")
-    end = get_attr(item, "end_time")
+    return _time_range(get_attr(item, "start_time"), get_attr(item, "end_time"))
+
+
+def _time_range(start: object, end: object) -> TimeRange | None:
+    """Return a valid TimeRange in UTC for raw start and end values, or None."""
     if start is None or end is None:
         return None
     start_dt = _as_utc_datetime(start)
@@ -343,16 +757,35 @@ def _parse_time_range(item: object) -> TimeRange | None:
     return TimeRange(start=start_dt, end=end_dt)
 
 
-def _normalize_zone_validity(permit: Permit) -> list[TimeRange]:
-    """Normalize zone validity blocks to TimeRange objects in UTC."""
+def _normalize_zone_validity(permit: Permit) -> tuple[TimeRange, ...]:
+    """Normalize zone validity blocks to TimeRange objects in UTC.
+
+    Permits in the same zone report the same blocks, so parsed blocks are
+    cached process-wide by their raw values and every entry shares one tuple.
+    """
     raw_blocks = get_attr(permit, "zone_validity")
     if not isinstance(raw_blocks, list):
-        return []
-    return [
-        time_range
+        return ()
+    raw_ranges = tuple(
+        (get_attr(block, "start_time"), get_attr(block, "end_time"))
         for block in cast("list[object]", raw_blocks)
-        if (time_range := _parse_time_range(block)) is not None
-    ]
+    )
+    try:
+        return _parse_zone_validity(raw_ranges)
+    except TypeError:  # Unhashable raw values cannot be cached.
+        return _parse_zone_validity.__wrapped__(raw_ranges)
+
+
+@lru_cache(maxsize=ZONE_VALIDITY_CACHE_SIZE)
+def _parse_zone_validity(
+    raw_ranges: tuple[tuple[object, object], ...],
+) -> tuple[TimeRange, ...]:
+    """Parse raw zone validity start and end values."""
+    return tuple(
+        time_range
+        for start, end in raw_ranges
+        if (time_range := _time_range(start, end)) is not None
+    )
 
 
 def _normalize_remaining_balance(permit: Permit) -> float:
@@ -369,6 +802,64 @@ def _normalize_remaining_balance(permit: Permit) -> float:
     return max(0.0, value)
 
 
+def section_fingerprints(
+    data: CoordinatorData, options: Mapping[str, object], now: datetime
+) -> dict[str, int]:
+    """Return a hash per data section covering everything entities render.
+
+    Reservation and availability fingerprints include the values that move
+    with the clock, such as the active set and the current or next windows,
+    so a section also changes when time alone changes what it shows.
+    """
+    provider = provider_schedule(data, now)
+    return {
+        SECTION_BALANCE: hash(
+            (data.permit_remaining_balance, data.permit_balance_unit)
+        ),
+        SECTION_RESERVATIONS: hash(
+            (
+                data.reservations,
+                data.active_reservations,
+                reservation_index(data).count_starting_after(now),
+            )
+        ),
+        SECTION_FAVORITES: hash(data.favorites),
+        SECTION_ZONE_VALIDITY: hash(data.zone_validity),
+        SECTION_AVAILABILITY: hash(
+            (
+                data.zone_availability,
+                effective_schedule(data, options, now).current_or_next(now),
+                provider.windows_for_day(now),
+                provider.current_or_next(now),
+            )
+        ),
+    }
+
+
+def projected_balance(
+    data: CoordinatorData,
+    options: Mapping[str, object],
+    anchored_at: datetime,
+    anchored_balance: float,
+    now: datetime,
+) -> float:
+    """Return the minute balance left at now, counted down from an anchor.
+
+    Every reservation consumes one minute of balance per minute that it
+    overlaps a chargeable window after the anchor; reservations running at the
+    same time are counted separately.
+    """
+    schedule = effective_schedule(data, options, now)
+    consumed = sum(
+        schedule.chargeable_seconds(
+            max(reservation.start_time, anchored_at), min(reservation.end_time, now)
+        )
+        for reservation in reservation_index(data).ending_after(anchored_at)
+        if reservation.start_time < now
+    )
+    return max(0.0, anchored_balance - consumed / 60)
+
+
 def _normalize_reservations(
     reservations: Iterable[ProviderReservation],
 ) -> list[Reservation]:
@@ -414,52 +905,6 @@ def _normalize_favorites(
     return normalized
 
 
-def _active_reservations(
-    reservations: list[Reservation], now: datetime
-) -> list[Reservation]:
-    """Return reservations active at the provided time."""
-    return [
-        reservation
-        for reservation in reservations
-        if reservation.start_time <= now < reservation.end_time
-    ]
-
-
-def _compute_zone_availability(
-    zone_validity: list[TimeRange],
-    options: Mapping[str, object],
-    now: datetime,
-) -> ZoneAvailability:
-    """Compute zone availability using validity blocks and overrides."""
-    windows_today = windows_for_today(zone_validity, options, now)
-    is_chargeable_now = any(
-        window.start <= now < window.end for window in windows_today
-    )
-
-    next_change_time = None
-    if windows_today:
-        if is_chargeable_now:
-            next_change_time = min(
-                (
-                    window.end
-                    for window in windows_today
-                    if window.start <= now < window.end
-                ),
-                default=None,
-            )
-        else:
-            next_change_time = min(
-                (window.start for window in windows_today if window.start > now),
-                default=None,
-            )
-
-    return ZoneAvailability(
-        is_chargeable_now=is_chargeable_now,
-        next_change_time=next_change_time,
-        windows_today=tuple(windows_today),
-    )
-
-
 def _should_attempt_auto_end(
     state: AutoEndState, reservation_id: str, now: datetime
 ) -> bool:
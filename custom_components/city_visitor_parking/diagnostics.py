@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import time
 from typing import TYPE_CHECKING, Final, Protocol, cast
 
 from homeassistant.components import diagnostics as diagnostics_util
@@ -9,6 +10,7 @@ from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
 
 from .const import (
     CONF_AUTO_END,
+    CONF_MAX_DATA_AGE,
     CONF_OPERATING_TIME_OVERRIDES,
     CONF_RESOLVED_LOGIN_PARAMS,
 )
@@ -41,9 +43,16 @@ async def async_get_config_entry_diagnostics(
 ) -> dict[str, object]:
     """Return diagnostics for a config entry."""
     coordinator = entry.runtime_data.coordinator
+    provider_session = entry.runtime_data.provider_session
+    host_services = entry.runtime_data.host_services
+    host_governor = host_services.host_governor
+    circuit_breaker = host_services.circuit_breaker
+    session_pool = host_services.session_pool
     data = coordinator.data
 
     last_update_success_time = getattr(coordinator, "last_update_success_time", None)
+    data_age_seconds = getattr(coordinator, "data_age_seconds", None)
+    write_reconciler = getattr(coordinator, "write_reconciler", None)
 
     return {
         "entry_data": _async_redact_data(dict(entry.data), TO_REDACT),
@@ -57,13 +66,33 @@ async def async_get_config_entry_diagnostics(
             "last_update_success_time": last_update_success_time.isoformat()
             if last_update_success_time
             else None,
+            "data_age_seconds": round(data_age_seconds, 1)
+            if isinstance(data_age_seconds, float)
+            else None,
             "active_reservations": len(data.active_reservations),
             "favorites": len(data.favorites),
             "zone_validity_blocks": len(data.zone_validity),
             "zone_is_chargeable_now": data.zone_availability.is_chargeable_now,
+            "request_coalescing": entry.runtime_data.request_coalescing.as_dict(),
+            "provider_session": provider_session.as_dict()
+            if provider_session is not None
+            else None,
+            "host_governor": host_governor.as_dict()
+            if host_governor is not None
+            else None,
+            "circuit_breaker": circuit_breaker.as_dict(time.monotonic())
+            if circuit_breaker is not None
+            else None,
+            "connection_pool": session_pool.stats.as_dict()
+            if session_pool is not None
+            else None,
+            "write_reconcile": write_reconciler.as_dict()
+            if write_reconciler is not None
+            else None,
         },
         "options_summary": {
             CONF_AUTO_END: entry.options.get(CONF_AUTO_END, False),
+            CONF_MAX_DATA_AGE: entry.options.get(CONF_MAX_DATA_AGE),
             CONF_OPERATING_TIME_OVERRIDES: entry.options.get(
                 CONF_OPERATING_TIME_OVERRIDES, {}
             ),
@@ -24,6 +24,8 @@ class CityVisitorParkingEntity(
 
     _attr_has_entity_name: bool = True
     _entity_key: str
+    _coordinator_sections: frozenset[str] | None = None
+    """Coordinator data sections rendered by the entity; None renders all."""
 
     def __init__(
         self,
@@ -34,6 +36,7 @@ class CityVisitorParkingEntity(
         """Initialize the entity."""
         super().__init__(coordinator)
         self._entry: CityVisitorParkingConfigEntry = entry
+        self._written_available: bool | None = None
         if key is not None:
             self._entity_key = key
         municipality = entry.data.get(CONF_MUNICIPALITY)
@@ -66,7 +69,19 @@ class CityVisitorParkingEntity(
 
     @callback
     def _handle_coordinator_update(self) -> None:
-        """Update entity state and availability."""
+        """Update entity state and availability.
+
+        The state write is skipped when availability is unchanged and none of
+        the coordinator sections this entity renders changed.
+        """
+        available = self.available
+        if (
+            self._coordinator_sections is not None
+            and available == self._written_available
+            and self._coordinator_sections.isdisjoint(self.coordinator.changed_sections)
+        ):
+            return
+        self._written_available = available
         self._update_from_coordinator()
         super()._handle_coordinator_update()
 
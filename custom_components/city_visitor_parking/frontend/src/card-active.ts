@@ -1,6 +1,11 @@
 /** Lovelace card for listing and updating active visitor parking reservations. */
 import { css, html, nothing, type TemplateResult } from "lit";
-import type { DeviceEntry, HomeAssistant, ValueElement } from "./types";
+import type {
+  DeviceEntry,
+  HomeAssistant,
+  StatusSubscriptionEvent,
+  ValueElement,
+} from "./types";
 import { ensureTranslations, getGlobalHass, localize } from "./translations";
 import {
   DOMAIN,
@@ -16,6 +21,7 @@ import {
   normalizePlateValue,
   parseDateTimeValue,
   resolvePermitLabelsByDevice,
+  subscribeStatus,
 } from "./helpers";
 import {
   BASE_CARD_STYLES,
@@ -114,6 +120,8 @@ class CityVisitorParkingActiveCard extends BaseLocalizedCard<CardConfig> {
   _activeReservationsError: string | null = null;
   _activeReservationsLoadedFor: string | null = null;
   _activeReservationsLoading = false;
+  _reservationsByDevice = new Map<string, ActiveReservation[]>();
+  _statusUnsubscribeByDevice = new Map<string, () => void>();
   _reservationUpdateFlagsByDevice = new Map<string, number>();
   _devicesPromise: Promise<DeviceEntry[]> | null = null;
   _configEntriesPromise: Promise<Map<string, string>> | null = null;
@@ -160,6 +168,7 @@ class CityVisitorParkingActiveCard extends BaseLocalizedCard<CardConfig> {
       RESERVATION_STARTED_EVENT,
       this._reservationStartedHandler,
     );
+    void this._maybeLoadActiveReservations();
   }
 
   disconnectedCallback(): void {
@@ -167,6 +176,9 @@ class CityVisitorParkingActiveCard extends BaseLocalizedCard<CardConfig> {
       this._clearEndButtonState(reservationId);
     }
     this._pendingReservationNameByKey.clear();
+    this._clearStatusSubscriptions();
+    // Load again and resubscribe when the card is attached again.
+    this._activeReservationsLoadedFor = null;
     if (this._reservationStartedHandler)
       window.removeEventListener(
         RESERVATION_STARTED_EVENT,
@@ -246,9 +258,9 @@ class CityVisitorParkingActiveCard extends BaseLocalizedCard<CardConfig> {
         );
       }
       if (!devices.length) {
-        this._activeReservations = [];
-        this._activeReservationsById.clear();
+        this._setActiveReservations(new Map());
         this._reservationUpdateFlagsByDevice.clear();
+        this._syncStatusSubscriptions(new Map());
         this._activeReservationsLoadedFor = target;
         return;
       }
@@ -276,8 +288,7 @@ class CityVisitorParkingActiveCard extends BaseLocalizedCard<CardConfig> {
           }),
         ),
       );
-      const collected: ActiveReservation[] = [];
-      const collectedById = new Map<string, ActiveReservation>();
+      const collected = new Map<string, ActiveReservation[]>();
       const reservationUpdateFlagsByDevice = new Map<string, number>();
       const failedDevices: string[] = [];
       for (const [index, settled] of results.entries()) {
@@ -297,16 +308,14 @@ class CityVisitorParkingActiveCard extends BaseLocalizedCard<CardConfig> {
           reservationUpdateFlagsByDevice.set(device.id, updateFlags);
         }
         if (Array.isArray(activeReservations)) {
-          for (const reservation of activeReservations) {
-            const resolvedReservation = reservation.device_id
-              ? reservation
-              : { ...reservation, device_id: device.id };
-            collected.push(resolvedReservation);
-            collectedById.set(
-              resolvedReservation.reservation_id,
-              resolvedReservation,
-            );
-          }
+          collected.set(
+            device.id,
+            activeReservations.map((reservation) =>
+              reservation.device_id
+                ? reservation
+                : { ...reservation, device_id: device.id },
+            ),
+          );
         }
       }
       if (failedDevices.length) {
@@ -315,26 +324,23 @@ class CityVisitorParkingActiveCard extends BaseLocalizedCard<CardConfig> {
         );
       }
       this._reservationUpdateFlagsByDevice = reservationUpdateFlagsByDevice;
-      this._activeReservations = collected;
-      this._activeReservationsById = collectedById;
+      this._setActiveReservations(collected);
+      this._syncStatusSubscriptions(
+        new Map(
+          devices.map((device) => [
+            device.id,
+            (device.config_entries ?? []).find((id) => entryTitles.has(id)) ??
+              device.config_entries?.[0] ??
+              null,
+          ]),
+        ),
+      );
       // Only mark as loaded when all devices succeeded; failed devices will be retried on the next update.
       if (!failedDevices.length) {
         this._activeReservationsLoadedFor = target;
       }
-      for (const reservationId of this._reservationInputValues.keys()) {
-        if (!collectedById.has(reservationId)) {
-          this._reservationInputValues.delete(reservationId);
-        }
-      }
-      this._prunePendingReservationNames();
-      for (const reservationId of [...this._endButtonSuccessByReservationId]) {
-        if (!collectedById.has(reservationId)) {
-          this._clearEndButtonState(reservationId);
-        }
-      }
     } catch (err: unknown) {
-      this._activeReservations = [];
-      this._activeReservationsById.clear();
+      this._setActiveReservations(new Map());
       this._reservationUpdateFlagsByDevice.clear();
       this._activeReservationsError = this._errorMessage(
         err,
@@ -347,6 +353,73 @@ class CityVisitorParkingActiveCard extends BaseLocalizedCard<CardConfig> {
     }
   }
 
+  /** Replaces the shown reservations and drops state of ended ones. */
+  _setActiveReservations(byDevice: Map<string, ActiveReservation[]>): void {
+    this._reservationsByDevice = byDevice;
+    const collected = [...byDevice.values()].flat();
+    const collectedById = new Map(
+      collected.map((reservation) => [reservation.reservation_id, reservation]),
+    );
+    this._activeReservations = collected;
+    this._activeReservationsById = collectedById;
+    for (const reservationId of this._reservationInputValues.keys()) {
+      if (!collectedById.has(reservationId)) {
+        this._reservationInputValues.delete(reservationId);
+      }
+    }
+    this._prunePendingReservationNames();
+    for (const reservationId of [...this._endButtonSuccessByReservationId]) {
+      if (!collectedById.has(reservationId)) {
+        this._clearEndButtonState(reservationId);
+      }
+    }
+  }
+
+  /**
+   * Keeps one status subscription per shown device so reservations started,
+   * changed or ended elsewhere show up without polling.
+   */
+  _syncStatusSubscriptions(entryIdByDevice: Map<string, string | null>): void {
+    for (const [deviceId, unsubscribe] of this._statusUnsubscribeByDevice) {
+      if (entryIdByDevice.has(deviceId)) continue;
+      unsubscribe();
+      this._statusUnsubscribeByDevice.delete(deviceId);
+    }
+    if (!this._hass) return;
+    for (const [deviceId, entryId] of entryIdByDevice) {
+      if (!entryId || this._statusUnsubscribeByDevice.has(deviceId)) continue;
+      this._statusUnsubscribeByDevice.set(
+        deviceId,
+        subscribeStatus(this._hass, entryId, (event) =>
+          this._handleStatusEvent(deviceId, event),
+        ),
+      );
+    }
+  }
+
+  _clearStatusSubscriptions(): void {
+    for (const unsubscribe of this._statusUnsubscribeByDevice.values()) {
+      unsubscribe();
+    }
+    this._statusUnsubscribeByDevice.clear();
+  }
+
+  _handleStatusEvent(deviceId: string, event: StatusSubscriptionEvent): void {
+    const reservations = event.reservations?.reservations;
+    if (!Array.isArray(reservations)) return;
+    if (!this._statusUnsubscribeByDevice.has(deviceId)) return;
+    const byDevice = new Map(this._reservationsByDevice);
+    byDevice.set(
+      deviceId,
+      reservations.map((reservation) => ({
+        ...reservation,
+        device_id: deviceId,
+      })),
+    );
+    this._setActiveReservations(byDevice);
+    this._requestRender();
+  }
+
   render(): TemplateResult {
     if (!this._config) return html``;
     if (!isHassRunning(this._hass)) {
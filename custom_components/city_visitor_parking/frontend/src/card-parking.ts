@@ -6,6 +6,7 @@ import type {
   FavoriteItem,
   HomeAssistant,
   PermitOption,
+  StatusSubscriptionEvent,
   ZoneStatus,
   ZoneStatusResponse,
 } from "./types";
@@ -28,12 +29,14 @@ import {
   filterDomainDevices,
   formatDateTimeLocal,
   getConfigEntryId,
+  indexReservationsByPlate,
   invalidateFavoritesCache,
   isHassRunning,
   normalizeMatchValue,
   normalizePlateValue,
   parseDateTimeValue,
   setPendingPermitDefaults,
+  subscribeStatus,
 } from "./helpers";
 import {
   BASE_CARD_STYLES,
@@ -52,9 +55,6 @@ const WS_LIST_FAVORITES = "city_visitor_parking/favorites";
 const WS_GET_STATUS = "city_visitor_parking/status";
 // Minimum interval between status fetches triggered by hass updates.
 const STATUS_THROTTLE_MS = 60000;
-// Background polling interval for zone status (and on page visibility restore).
-// The coordinator already polls at 5–30 min; no need to fetch more often than that.
-const STATUS_REFRESH_MS = 300000;
 
 type CardConfig = {
   type: string;
@@ -154,8 +154,7 @@ class CityVisitorParkingNewReservationCard extends BaseLocalizedCard<CardConfig>
   _zoneStatusByEntryId = new Map<string, ZoneStatus>();
   _pendingPermitDefaultsEntryId: string | null = null;
   _pendingPermitDefaultsForce = false;
-  _statusRefreshHandle: number | null = null;
-  _statusVisibilityHandler: (() => void) | null = null;
+  _statusUnsubscribe: (() => void) | null = null;
   _translationsReady = false;
   _translationsLanguage: string | null = null;
   _activeReservationsByPlate = new Map<
@@ -280,7 +279,7 @@ class CityVisitorParkingNewReservationCard extends BaseLocalizedCard<CardConfig>
       this._onReservationEnded,
     );
     super.disconnectedCallback();
-    this._clearStatusRefresh();
+    this._clearStatusSubscription();
   }
 
   getCardSize(): number {
@@ -836,7 +835,7 @@ class CityVisitorParkingNewReservationCard extends BaseLocalizedCard<CardConfig>
     if (!value) {
       this._selectedEntryId = null;
       setPendingPermitDefaults(this, null);
-      this._clearStatusRefresh();
+      this._clearStatusSubscription();
       this._resetDeviceState();
       this._clearPermitScopedFormValues();
       this._setInputValue("licensePlate", "");
@@ -862,7 +861,7 @@ class CityVisitorParkingNewReservationCard extends BaseLocalizedCard<CardConfig>
     this._maybeLoadFavorites();
     void this._loadZoneStatusForEntry(value);
     void this._loadActivePlates(value);
-    this._setupStatusRefresh(value);
+    this._setupStatusSubscription(value);
   }
 
   _resetFavoritesState(): void {
@@ -909,49 +908,44 @@ class CityVisitorParkingNewReservationCard extends BaseLocalizedCard<CardConfig>
     this._ensurePermitOptions();
     this._maybeSelectSinglePermit();
     if (entryId) void this._loadZoneStatusForEntry(entryId);
-    if (forceSetupRefresh || this._statusRefreshHandle === null) {
-      this._setupStatusRefresh(entryId);
+    if (forceSetupRefresh || this._statusUnsubscribe === null) {
+      this._setupStatusSubscription(entryId);
     }
     void this._maybeLoadFavorites();
     if (entryId) void this._loadActivePlates(entryId);
   }
 
-  _setupStatusRefresh(entryId: string | null): void {
-    this._clearStatusRefresh();
-    if (!getConfigEntryId(this._config) || !entryId) return;
-    const refresh = (): void => {
-      if (!this._hass) return;
-      const activeEntryId = this._getActiveEntryId();
-      if (!activeEntryId || activeEntryId !== entryId) return;
-      setPendingPermitDefaults(this, entryId);
-      void this._loadZoneStatusForEntry(entryId);
-      // Invalidate active-plate cache so the next render re-fetches and
-      // picks up reservations ended or changed outside this card.
-      this._activeReservationsLoadedFor = null;
-      void this._loadActivePlates(entryId);
-    };
-    this._statusRefreshHandle = window.setInterval(refresh, STATUS_REFRESH_MS);
-    this._statusVisibilityHandler = () => {
-      if (document.visibilityState === "visible") refresh();
-    };
-    document.addEventListener(
-      "visibilitychange",
-      this._statusVisibilityHandler,
+  _setupStatusSubscription(entryId: string | null): void {
+    this._clearStatusSubscription();
+    if (!this._hass || !getConfigEntryId(this._config) || !entryId) return;
+    // The backend pushes status and reservations after every coordinator
+    // update and at window boundaries, so the card does not poll.
+    this._statusUnsubscribe = subscribeStatus(this._hass, entryId, (event) =>
+      this._handleStatusEvent(entryId, event),
     );
   }
 
-  _clearStatusRefresh(): void {
-    if (this._statusRefreshHandle !== null) {
-      window.clearInterval(this._statusRefreshHandle);
-      this._statusRefreshHandle = null;
+  _clearStatusSubscription(): void {
+    if (this._statusUnsubscribe !== null) {
+      this._statusUnsubscribe();
+      this._statusUnsubscribe = null;
     }
-    if (this._statusVisibilityHandler !== null) {
-      document.removeEventListener(
-        "visibilitychange",
-        this._statusVisibilityHandler,
-      );
-      this._statusVisibilityHandler = null;
+  }
+
+  _handleStatusEvent(entryId: string, event: StatusSubscriptionEvent): void {
+    if (entryId !== this._getActiveEntryId()) return;
+    const status = this._normalizeZoneStatus(event.status);
+    this._zoneStatusByEntryId.set(entryId, status);
+    this._zoneStatusTsByEntryId.set(entryId, Date.now());
+    applyZoneStatus(this, status);
+    setPendingPermitDefaults(this, entryId);
+    this._applyPendingPermitDefaults(entryId);
+    const reservations = event.reservations?.reservations;
+    if (Array.isArray(reservations)) {
+      this._activeReservationsByPlate = indexReservationsByPlate(reservations);
+      this._activeReservationsLoadedFor = entryId;
     }
+    this._requestRender();
   }
 
   _setFavorites(favorites: FavoriteItem[]): void {
@@ -1334,7 +1328,8 @@ class CityVisitorParkingNewReservationCard extends BaseLocalizedCard<CardConfig>
       const domainDevices = filterDomainDevices(devices).filter((device) =>
         (device.config_entries ?? []).includes(entryId),
       );
-      const byPlate = new Map<string, Array<{ start: Date; end: Date }>>();
+      const collected: NonNullable<ActiveReservationsResult["reservations"]> =
+        [];
       const results = await Promise.allSettled(
         domainDevices.map((device) =>
           hass.callWS<ActiveReservationsResult>({
@@ -1359,22 +1354,12 @@ class CityVisitorParkingNewReservationCard extends BaseLocalizedCard<CardConfig>
         const result = settled.value;
         const response = result?.response ?? result;
         const reservations = response?.reservations;
-        if (Array.isArray(reservations)) {
-          for (const r of reservations) {
-            const plate = normalizePlateValue(r.license_plate);
-            const start = parseDateTimeValue(r.start_time);
-            const end = parseDateTimeValue(r.end_time);
-            if (!plate || !start || !end) continue;
-            const existing = byPlate.get(plate) ?? [];
-            existing.push({ start, end });
-            byPlate.set(plate, existing);
-          }
-        }
+        if (Array.isArray(reservations)) collected.push(...reservations);
       }
       // Only apply result if the entry hasn't changed while awaiting (P1).
       // Reset the loaded marker when any device failed so the next call retries (P2).
       if (this._activeReservationsLoadedFor === entryId) {
-        this._activeReservationsByPlate = byPlate;
+        this._activeReservationsByPlate = indexReservationsByPlate(collected);
         if (anyFailed) {
           this._activeReservationsLoadedFor = null;
         }
@@ -6,6 +6,8 @@ import type {
   LocalizeTarget,
   PermitEntry,
   PermitOption,
+  ReservationPayload,
+  StatusSubscriptionEvent,
   ZoneStatus,
 } from "./types";
 import { localize } from "./translations";
@@ -15,6 +17,8 @@ export const DOMAIN = "city_visitor_parking";
 export const RESERVATION_STARTED_EVENT =
   "city-visitor-parking-reservation-started";
 export const RESERVATION_ENDED_EVENT = "city-visitor-parking-reservation-ended";
+/** Websocket command that pushes status and reservations for one entry. */
+export const WS_SUBSCRIBE_STATUS = "city_visitor_parking/subscribe_status";
 
 /** Empty zone state used before a status payload has been loaded. */
 export const EMPTY_ZONE_STATUS: ZoneStatus = {
@@ -251,6 +255,57 @@ export const makeDedupedLoader = <T>(
   return promise;
 };
 
+/**
+ * Subscribes to pushed status and reservation updates for one config entry.
+ *
+ * Returns a function that ends the subscription, also while it is still being
+ * set up. Without a websocket connection nothing is subscribed.
+ */
+export const subscribeStatus = (
+  hass: HomeAssistant,
+  entryId: string,
+  onEvent: (event: StatusSubscriptionEvent) => void,
+): (() => void) => {
+  const connection = hass.connection;
+  if (!connection) return () => undefined;
+  let active = true;
+  const unsubscribe = connection
+    .subscribeMessage<StatusSubscriptionEvent>(
+      (event) => {
+        if (active) onEvent(event);
+      },
+      { type: WS_SUBSCRIBE_STATUS, config_entry_id: entryId },
+    )
+    .catch((err: unknown) => {
+      console.warn(
+        `[city-visitor-parking] Could not subscribe to status for ${entryId}:`,
+        err,
+      );
+      return null;
+    });
+  return () => {
+    active = false;
+    void unsubscribe.then((unsub) => unsub?.()).catch(() => undefined);
+  };
+};
+
+/** Groups reservation start/end times by normalized license plate. */
+export const indexReservationsByPlate = (
+  reservations: Array<Partial<ReservationPayload>>,
+): Map<string, Array<{ start: Date; end: Date }>> => {
+  const byPlate = new Map<string, Array<{ start: Date; end: Date }>>();
+  for (const reservation of reservations) {
+    const plate = normalizePlateValue(reservation.license_plate);
+    const start = parseDateTimeValue(reservation.start_time);
+    const end = parseDateTimeValue(reservation.end_time);
+    if (!plate || !start || !end) continue;
+    const existing = byPlate.get(plate) ?? [];
+    existing.push({ start, end });
+    byPlate.set(plate, existing);
+  }
+  return byPlate;
+};
+
 /** Reads a selector value from a Home Assistant event with an element fallback. */
 export const extractEventValue = (
   event: Event,
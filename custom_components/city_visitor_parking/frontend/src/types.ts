@@ -30,6 +30,12 @@ export type HomeAssistant = {
     service: string,
     data: Record<string, unknown>,
   ) => Promise<T>;
+  connection?: {
+    subscribeMessage: <T = unknown>(
+      callback: (message: T) => void,
+      msg: Record<string, unknown>,
+    ) => Promise<() => Promise<void>>;
+  };
   config?: { state?: string };
   localize?: LocalizeFunc;
   language?: string;
@@ -128,6 +134,33 @@ export type ZoneStatusResponse = {
   balance_unit: string | null;
 };
 
+/** Reservation fields returned by `build_reservations_payload()`. */
+export type ReservationPayload = {
+  reservation_id: string;
+  license_plate?: string;
+  start_time: string;
+  end_time: string;
+  favorite_id?: string;
+  favorite_name?: string;
+};
+
+/**
+ * Event pushed by the Python websocket subscription
+ * `city_visitor_parking/subscribe_status` (without `deltas`).
+ *
+ * One event is sent right after subscribing, then after every coordinator
+ * update and whenever a window or reservation boundary passes.
+ */
+export type StatusSubscriptionEvent = {
+  status: ZoneStatusResponse & { stale?: boolean };
+  reservations: {
+    count: number;
+    active_count: number;
+    future_count: number;
+    reservations: ReservationPayload[];
+  };
+};
+
 /** HTMLElement variant used for simple input-like value access. */
 export type ValueElement = HTMLElement & { value?: string };
 /** Progress-button instance with imperative success and error helpers. */
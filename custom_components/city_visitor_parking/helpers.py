@@ -2,8 +2,15 @@
 
 from __future__ import annotations
 
+import sys
 from collections.abc import Mapping
-from typing import cast
+from functools import lru_cache
+from typing import TYPE_CHECKING, cast
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from .models import CoordinatorData, Favorite
 
 
 def normalize_override_windows(value: object) -> list[dict[str, object]]:
@@ -20,11 +27,28 @@ def normalize_override_windows(value: object) -> list[dict[str, object]]:
     return []
 
 
+@lru_cache(maxsize=256)
 def normalize_plate(value: str | None) -> str:
     """Normalize a license plate for matching (uppercase alphanumeric only)."""
     if not value:
         return ""
-    return "".join(ch for ch in value.strip().upper() if ch.isalnum())
+    return sys.intern("".join(ch for ch in value.strip().upper() if ch.isalnum()))
+
+
+def build_favorite_index(favorites: Iterable[Favorite]) -> dict[str, Favorite]:
+    """Map normalized license plates to favorites; later favorites win."""
+    return {
+        normalize_plate(favorite.license_plate): favorite
+        for favorite in favorites
+        if favorite.license_plate
+    }
+
+
+def favorite_index(data: CoordinatorData) -> Mapping[str, Favorite]:
+    """Return the coordinator favorite index, building one if missing."""
+    if data.favorite_by_plate is not None:
+        return data.favorite_by_plate
+    return build_favorite_index(data.favorites)
 
 
 def parse_comma_separated(value: str) -> list[str]:
@@ -0,0 +1,180 @@
+"""Dedicated HTTP connection pools per provider host for City visitor parking."""
+
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING, Final, cast
+
+import aiohttp
+from aiohttp.hdrs import USER_AGENT
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
+from homeassistant.core import callback
+from homeassistant.helpers.aiohttp_client import SERVER_SOFTWARE
+from homeassistant.util.ssl import get_default_context
+
+from .const import (
+    DOMAIN,
+    HOST_CONNECT_TIMEOUT,
+    HOST_DNS_CACHE_TTL,
+    HOST_KEEPALIVE_TIMEOUT,
+    HOST_READ_TIMEOUT,
+)
+
+if TYPE_CHECKING:
+    from types import SimpleNamespace
+
+    from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant
+
+_POOLS_KEY: Final = "session_pools"
+
+
+class ConnectionStats:
+    """Connection reuse and handshake timings of one session."""
+
+    def __init__(self) -> None:
+        """Initialize empty counters."""
+        self.new_connections: int = 0
+        self.reused_connections: int = 0
+        self.dns_cache_hits: int = 0
+        self.dns_lookups: int = 0
+        self.connect_seconds: float = 0.0
+
+    def trace_config(self) -> aiohttp.TraceConfig:
+        """Return a trace config that feeds these counters."""
+        trace = aiohttp.TraceConfig()
+        trace.on_connection_create_start.append(self._on_connect_start)
+        trace.on_connection_create_end.append(self._on_connect_end)
+        trace.on_connection_reuseconn.append(self._on_reuse)
+        trace.on_dns_cache_hit.append(self._on_dns_cache_hit)
+        trace.on_dns_resolvehost_end.append(self._on_dns_lookup)
+        return trace
+
+    async def _on_connect_start(
+        self, _session: object, context: SimpleNamespace, _params: object
+    ) -> None:
+        """Remember when a new connection, including its TLS handshake, began."""
+        context.connect_started = time.perf_counter()
+
+    async def _on_connect_end(
+        self, _session: object, context: SimpleNamespace, _params: object
+    ) -> None:
+        """Count a new connection and its setup time."""
+        self.new_connections += 1
+        started = getattr(context, "connect_started", None)
+        if started is not None:
+            self.connect_seconds += time.perf_counter() - started
+
+    async def _on_reuse(
+        self, _session: object, _context: SimpleNamespace, _params: object
+    ) -> None:
+        """Count a request served by a kept-alive connection."""
+        self.reused_connections += 1
+
+    async def _on_dns_cache_hit(
+        self, _session: object, _context: SimpleNamespace, _params: object
+    ) -> None:
+        """Count a DNS cache hit."""
+        self.dns_cache_hits += 1
+
+    async def _on_dns_lookup(
+        self, _session: object, _context: SimpleNamespace, _params: object
+    ) -> None:
+        """Count a DNS lookup that missed the cache."""
+        self.dns_lookups += 1
+
+    def as_dict(self) -> dict[str, object]:
+        """Return counters for diagnostics."""
+        return {
+            "new_connections": self.new_connections,
+            "reused_connections": self.reused_connections,
+            "avg_connect_ms": round(
+                self.connect_seconds / self.new_connections * 1000, 1
+            )
+            if self.new_connections
+            else None,
+            "dns_lookups": self.dns_lookups,
+            "dns_cache_hits": self.dns_cache_hits,
+        }
+
+
+class HostSessionPool:
+    """Integration-owned aiohttp session shared by the entries of one host.
+
+    Keeping connections to a provider host alive lets the calls of a refresh,
+    and a write and its reconcile refresh, share one TCP and TLS handshake.
+    The connection count is not capped here; the host governor already
+    bounds concurrent provider calls. The session is closed when the last
+    entry releases it or Home Assistant closes.
+    """
+
+    def __init__(self, hass: HomeAssistant, key: str) -> None:
+        """Initialize an empty pool."""
+        self._hass = hass
+        self._key = key
+        self._entry_ids: set[str] = set()
+        self._session: aiohttp.ClientSession | None = None
+        self._unsub_close: CALLBACK_TYPE | None = None
+        self.stats = ConnectionStats()
+
+    @callback
+    def async_acquire(self, entry_id: str) -> aiohttp.ClientSession:
+        """Return the host session for an entry, creating it when needed."""
+        self._entry_ids.add(entry_id)
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit_per_host=0,
+                    ttl_dns_cache=HOST_DNS_CACHE_TTL.total_seconds(),
+                    keepalive_timeout=HOST_KEEPALIVE_TIMEOUT.total_seconds(),
+                    ssl=get_default_context(),
+                ),
+                timeout=aiohttp.ClientTimeout(
+                    connect=HOST_CONNECT_TIMEOUT.total_seconds(),
+                    sock_read=HOST_READ_TIMEOUT.total_seconds(),
+                ),
+                headers={USER_AGENT: SERVER_SOFTWARE},
+                trace_configs=[self.stats.trace_config()],
+            )
+            self._unsub_close = self._hass.bus.async_listen_once(
+                EVENT_HOMEASSISTANT_CLOSE, self._async_close_at_stop
+            )
+        return self._session
+
+    async def async_release(self, entry_id: str) -> None:
+        """Release an entry's use and close the session after the last one."""
+        self._entry_ids.discard(entry_id)
+        if self._entry_ids:
+            return
+        pools = _pools(self._hass)
+        if pools.get(self._key) is self:
+            del pools[self._key]
+        if self._unsub_close is not None:
+            self._unsub_close()
+            self._unsub_close = None
+        await self._async_close()
+
+    async def _async_close_at_stop(self, _event: Event) -> None:
+        """Close the session when Home Assistant closes."""
+        self._unsub_close = None
+        await self._async_close()
+
+    async def _async_close(self) -> None:
+        """Close the session if it is open."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+
+def async_get_session_pool(hass: HomeAssistant, key: str) -> HostSessionPool:
+    """Return the session pool shared by every config entry using host key."""
+    pools = _pools(hass)
+    pool = pools.get(key)
+    if pool is None:
+        pool = pools[key] = HostSessionPool(hass, key)
+    return pool
+
+
+def _pools(hass: HomeAssistant) -> dict[str, HostSessionPool]:
+    """Return the session pools registry."""
+    data: dict[str, object] = hass.data.setdefault(DOMAIN, {})
+    return cast("dict[str, HostSessionPool]", data.setdefault(_POOLS_KEY, {}))
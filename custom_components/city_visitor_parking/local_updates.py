@@ -0,0 +1,195 @@
+"""Optimistic snapshot updates for City visitor parking writes."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, replace
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING
+
+from homeassistant.util import dt as dt_util
+
+from .helpers import build_favorite_index, get_attr
+from .models import Favorite, Reservation
+from .reservation_index import ReservationIndex
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from .models import CoordinatorData
+
+
+def with_favorite_added(
+    data: CoordinatorData,
+    favorite_id: str,
+    license_plate: str,
+    name: str | None,
+) -> CoordinatorData:
+    """Return a snapshot with a favorite appended."""
+    favorite = Favorite(
+        favorite_id=favorite_id,
+        license_plate=license_plate or None,
+        name=name or None,
+    )
+    return _with_favorites(data, (*data.favorites, favorite))
+
+
+def with_favorite_updated(
+    data: CoordinatorData,
+    favorite_id: str,
+    license_plate: str | None,
+    name: str | None,
+) -> CoordinatorData:
+    """Return a snapshot with the given favorite fields changed in place."""
+    favorites = tuple(
+        replace(
+            favorite,
+            license_plate=(
+                favorite.license_plate if license_plate is None else license_plate
+            ),
+            name=favorite.name if name is None else name or None,
+        )
+        if favorite.favorite_id == favorite_id
+        else favorite
+        for favorite in data.favorites
+    )
+    return _with_favorites(data, favorites)
+
+
+def with_favorite_removed(data: CoordinatorData, favorite_id: str) -> CoordinatorData:
+    """Return a snapshot without the given favorite."""
+    favorites = tuple(
+        favorite for favorite in data.favorites if favorite.favorite_id != favorite_id
+    )
+    return _with_favorites(data, favorites)
+
+
+def _with_favorites(
+    data: CoordinatorData, favorites: tuple[Favorite, ...]
+) -> CoordinatorData:
+    """Return a snapshot with new favorites and a matching plate index."""
+    return replace(
+        data, favorites=favorites, favorite_by_plate=build_favorite_index(favorites)
+    )
+
+
+def reservation_from_result(
+    result: object,
+    start_time: datetime,
+    end_time: datetime,
+    license_plate: str | None,
+) -> Reservation | None:
+    """Return the reservation reported by a provider write, if it has an id.
+
+    Times and plate the provider does not report fall back to the requested
+    values.
+    """
+    reservation_id = get_attr(result, "id")
+    if reservation_id is None or reservation_id == "":
+        return None
+    reported_plate = get_attr(result, "license_plate")
+    return Reservation(
+        reservation_id=str(reservation_id),
+        start_time=_as_utc_or(get_attr(result, "start_time"), start_time),
+        end_time=_as_utc_or(get_attr(result, "end_time"), end_time),
+        license_plate=str(reported_plate) if reported_plate else license_plate,
+    )
+
+
+def with_reservation_added(
+    data: CoordinatorData, reservation: Reservation, now: datetime
+) -> CoordinatorData:
+    """Return a snapshot with a reservation added or replaced by id."""
+    reservations = tuple(
+        existing
+        for existing in data.reservations
+        if existing.reservation_id != reservation.reservation_id
+    )
+    return _with_reservations(data, (*reservations, reservation), now)
+
+
+@dataclass(frozen=True)
+class ReservationUpdate:
+    """Requested reservation times and the provider's answer to the change."""
+
+    start_time: datetime | None = None
+    end_time: datetime | None = None
+    result: object = None
+
+    def apply(self, reservation: Reservation) -> Reservation:
+        """Return a reservation with requested and reported changes applied.
+
+        Values reported in the provider's result take precedence over the
+        requested times.
+        """
+        requested = replace(
+            reservation,
+            start_time=(
+                reservation.start_time if self.start_time is None else self.start_time
+            ),
+            end_time=reservation.end_time if self.end_time is None else self.end_time,
+        )
+        reported = reservation_from_result(
+            self.result,
+            requested.start_time,
+            requested.end_time,
+            requested.license_plate,
+        )
+        return requested if reported is None else reported
+
+
+def with_reservation_updated(
+    data: CoordinatorData,
+    reservation_id: str,
+    update: ReservationUpdate,
+    now: datetime,
+) -> CoordinatorData:
+    """Return a snapshot with the given reservation changed in place."""
+    reservations = tuple(
+        update.apply(reservation)
+        if reservation.reservation_id == reservation_id
+        else reservation
+        for reservation in data.reservations
+    )
+    return _with_reservations(data, reservations, now)
+
+
+def with_reservation_ended(
+    data: CoordinatorData, reservation_ids: Iterable[str], now: datetime
+) -> CoordinatorData:
+    """Return a snapshot where the given reservations end at now.
+
+    Reservations that had not started yet are cancelled and dropped.
+    """
+    ended = set(reservation_ids)
+    reservations = tuple(
+        replace(reservation, end_time=min(reservation.end_time, now))
+        if reservation.reservation_id in ended
+        else reservation
+        for reservation in data.reservations
+        if reservation.reservation_id not in ended or reservation.start_time < now
+    )
+    return _with_reservations(data, reservations, now)
+
+
+def _with_reservations(
+    data: CoordinatorData, reservations: tuple[Reservation, ...], now: datetime
+) -> CoordinatorData:
+    """Return a snapshot with new reservations, index, and active set."""
+    index = ReservationIndex(reservations)
+    return replace(
+        data,
+        reservations=reservations,
+        active_reservations=index.active_at(now),
+        reservation_index=index,
+    )
+
+
+def _as_utc_or(value: object, fallback: datetime) -> datetime:
+    """Return a reported datetime or ISO string in UTC, or the fallback."""
+    if isinstance(value, str):
+        value = dt_util.parse_datetime(value)
+    if not isinstance(value, datetime):
+        return fallback
+    if value.tzinfo is None:
+        return value.replace(tzinfo=UTC)
+    return dt_util.as_utc(value)
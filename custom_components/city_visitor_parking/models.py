@@ -6,8 +6,12 @@ from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping
     from datetime import datetime
 
+    from .reservation_index import ReservationIndex
+    from .schedule import ChargeSchedule
+
 
 @dataclass(frozen=True)
 class ProviderConfig:
@@ -68,6 +72,18 @@ class CoordinatorData:
     favorites: tuple[Favorite, ...]
     zone_availability: ZoneAvailability
     active_reservations: tuple[Reservation, ...]
+    charge_schedule: ChargeSchedule | None = field(
+        default=None, compare=False, repr=False
+    )
+    provider_schedule: ChargeSchedule | None = field(
+        default=None, compare=False, repr=False
+    )
+    reservation_index: ReservationIndex | None = field(
+        default=None, compare=False, repr=False
+    )
+    favorite_by_plate: Mapping[str, Favorite] | None = field(
+        default=None, compare=False, repr=False
+    )
 
 
 def _default_attempts() -> dict[str, datetime]:
@@ -2,17 +2,14 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, cast
 
 from homeassistant.util import dt as dt_util
 
 from .const import STATE_CHARGEABLE, STATE_FREE
-from .helpers import get_attr, normalize_plate
-from .time_windows import (
-    current_or_next_window,
-    current_or_next_window_with_overrides,
-    windows_for_today,
-)
+from .helpers import favorite_index, get_attr, normalize_plate
+from .reservation_index import reservation_index
+from .schedule import effective_schedule, provider_schedule
 
 if TYPE_CHECKING:
     from collections.abc import Iterable, Mapping
@@ -60,6 +57,25 @@ def reservation_payload(
     return payload
 
 
+def build_reservations_payload(
+    data: CoordinatorData, now: datetime
+) -> dict[str, object]:
+    """Build the shared reservation list response for services and websocket."""
+    index = reservation_index(data)
+    visible = index.ending_after(now)
+    active_count = index.count_active_at(now)
+    favorite_by_plate = favorite_index(data)
+    return {
+        "count": len(visible),
+        "active_count": active_count,
+        "future_count": len(visible) - active_count,
+        "reservations": [
+            reservation_payload(reservation, favorite_by_plate)
+            for reservation in visible
+        ],
+    }
+
+
 def normalize_favorites(
     favorites: Iterable[ProviderFavorite],
 ) -> list[dict[str, str]]:
@@ -84,6 +100,50 @@ def normalize_favorites(
     return normalized
 
 
+def favorite_payloads(favorites: Iterable[Favorite]) -> list[dict[str, str]]:
+    """Convert coordinator favorites to the normalized favorites structure."""
+    payloads: list[dict[str, str]] = []
+    for favorite in favorites:
+        payload: dict[str, str] = {"id": favorite.favorite_id}
+        if favorite.license_plate is not None:
+            payload["license_plate"] = favorite.license_plate
+        if favorite.name is not None:
+            payload["name"] = favorite.name
+        payloads.append(payload)
+    return payloads
+
+
+def json_patch(old: object, new: object, path: str = "") -> list[dict[str, object]]:
+    """Return JSON-patch style operations that turn old into new.
+
+    Mappings are diffed key by key; any other changed value, including lists,
+    is replaced as a whole.
+    """
+    if isinstance(old, dict) and isinstance(new, dict):
+        old_map = cast("dict[str, object]", old)
+        new_map = cast("dict[str, object]", new)
+        ops: list[dict[str, object]] = []
+        for key, value in old_map.items():
+            if key not in new_map:
+                ops.append({"op": "remove", "path": _pointer(path, key)})
+            else:
+                ops.extend(json_patch(value, new_map[key], _pointer(path, key)))
+        ops.extend(
+            {"op": "add", "path": _pointer(path, key), "value": value}
+            for key, value in new_map.items()
+            if key not in old_map
+        )
+        return ops
+    if old == new and type(old) is type(new):
+        return []
+    return [{"op": "replace", "path": path, "value": new}]
+
+
+def _pointer(path: str, key: str) -> str:
+    """Append an escaped JSON pointer segment to a path."""
+    return f"{path}/{key.replace('~', '~0').replace('/', '~1')}"
+
+
 def build_status_payload(
     data: CoordinatorData,
     options: Mapping[str, object],
@@ -92,14 +152,12 @@ def build_status_payload(
     stale: bool = False,
 ) -> dict[str, object]:
     """Build the shared status response for services and websocket."""
-    provider_windows_today = windows_for_today(data.zone_validity, {}, now)
-    effective_windows_today = windows_for_today(data.zone_validity, options, now)
-    effective_window = current_or_next_window_with_overrides(
-        data.zone_validity,
-        options,
-        now,
-    )
-    provider_window = current_or_next_window(data.zone_validity, now)
+    schedule = effective_schedule(data, options, now)
+    provider = provider_schedule(data, now)
+    provider_windows_today = provider.windows_for_day(now)
+    effective_windows_today = schedule.windows_for_day(now)
+    effective_window = schedule.current_or_next(now)
+    provider_window = provider.current_or_next(now)
     is_chargeable_now = data.zone_availability.is_chargeable_now
     next_change_time = data.zone_availability.next_change_time
     if stale:
@@ -0,0 +1,106 @@
+"""Staggered poll scheduling across config entries for City visitor parking."""
+
+from __future__ import annotations
+
+import zlib
+from bisect import insort
+from datetime import timedelta
+from typing import TYPE_CHECKING, Final, cast
+
+from homeassistant.core import callback
+
+from .const import DOMAIN, POLL_JITTER_FRACTION
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from datetime import datetime
+
+    from homeassistant.core import HomeAssistant
+
+_SCHEDULERS_KEY: Final = "poll_schedulers"
+
+
+class HostPollScheduler:
+    """Spread the polls of every config entry on one host across the interval.
+
+    Entries get evenly spaced phase slots in entry id order, plus a
+    deterministic jitter of up to ``POLL_JITTER_FRACTION`` of a slot derived
+    from the entry id. Each poll is scheduled at the next occurrence of the
+    entry's phase on a wall-clock grid of the interval, so entries that were
+    set up at the same moment drift apart after their first poll and stay
+    apart across restarts.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty scheduler."""
+        self._entry_ids: list[str] = []
+
+    @callback
+    def async_register(self, entry_id: str) -> Callable[[], None]:
+        """Give an entry a phase slot and return a callback releasing it."""
+        if entry_id not in self._entry_ids:
+            insort(self._entry_ids, entry_id)
+
+        @callback
+        def _unregister() -> None:
+            self.async_unregister(entry_id)
+
+        return _unregister
+
+    @callback
+    def async_unregister(self, entry_id: str) -> bool:
+        """Release an entry's slot and return True when no entry is left."""
+        if entry_id in self._entry_ids:
+            self._entry_ids.remove(entry_id)
+        return not self._entry_ids
+
+    def phase(self, entry_id: str, interval: timedelta) -> float:
+        """Return the offset of an entry's polls within interval, in seconds."""
+        slot = interval.total_seconds() / max(len(self._entry_ids), 1)
+        rank = self._entry_ids.index(entry_id) if entry_id in self._entry_ids else 0
+        jitter = zlib.crc32(entry_id.encode()) / 0xFFFFFFFF
+        return slot * (rank + jitter * POLL_JITTER_FRACTION)
+
+    def next_interval(
+        self, entry_id: str, interval: timedelta, now: datetime
+    ) -> timedelta:
+        """Return the delay until the entry's next poll slot.
+
+        The delay stays between half and one and a half intervals, so the
+        polling rate of the adaptive interval is kept while the entry moves
+        onto its slot.
+        """
+        seconds = interval.total_seconds()
+        if seconds <= 0:
+            return interval
+        delay = seconds - (now.timestamp() - self.phase(entry_id, interval)) % seconds
+        if delay < seconds / 2:
+            delay += seconds
+        return timedelta(seconds=delay)
+
+
+def async_get_poll_scheduler(
+    hass: HomeAssistant, key: str, entry_id: str
+) -> HostPollScheduler:
+    """Return the poll scheduler shared by every config entry using host key."""
+    schedulers = _schedulers(hass)
+    scheduler = schedulers.get(key)
+    if scheduler is None:
+        scheduler = schedulers[key] = HostPollScheduler()
+    scheduler.async_register(entry_id)
+    return scheduler
+
+
+@callback
+def async_release_poll_scheduler(hass: HomeAssistant, key: str, entry_id: str) -> None:
+    """Release an entry's slot and drop the scheduler after the last one."""
+    schedulers = _schedulers(hass)
+    scheduler = schedulers.get(key)
+    if scheduler is not None and scheduler.async_unregister(entry_id):
+        del schedulers[key]
+
+
+def _schedulers(hass: HomeAssistant) -> dict[str, HostPollScheduler]:
+    """Return the poll schedulers registry."""
+    data: dict[str, object] = hass.data.setdefault(DOMAIN, {})
+    return cast("dict[str, HostPollScheduler]", data.setdefault(_SCHEDULERS_KEY, {}))
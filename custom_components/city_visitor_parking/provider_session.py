@@ -0,0 +1,94 @@
+"""Transparent provider re-login for City visitor parking."""
+
+from __future__ import annotations
+
+import inspect
+import logging
+from typing import TYPE_CHECKING, cast
+
+from homeassistant.core import callback
+from pycityvisitorparking import AuthError
+
+from .request_coalescing import SingleFlight
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    from .request_coalescing import TaskFactory
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class ProviderSession:
+    """Hold the provider login and share re-logins between concurrent callers.
+
+    Every completed login bumps ``generation``. A caller that saw an AuthError
+    passes the generation it started with, so calls that fail after another
+    caller already logged in again simply retry instead of logging in twice.
+    """
+
+    def __init__(
+        self,
+        login: Callable[[], Awaitable[None]],
+        create_task: TaskFactory | None = None,
+    ) -> None:
+        """Initialize the session."""
+        self._login = login
+        self._single_flight = SingleFlight(create_task, name="provider login")
+        self.generation: int = 0
+
+    async def async_login(self) -> None:
+        """Log in, joining a login that is already running."""
+        await self._single_flight.async_run("login", self._async_login)
+
+    async def async_relogin(self, generation: int) -> None:
+        """Log in again unless that already happened since generation."""
+        if generation != self.generation:
+            return
+        await self.async_login()
+
+    async def _async_login(self) -> None:
+        """Run the provider login and start a new generation."""
+        await self._login()
+        self.generation += 1
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Cancel a login that is still running."""
+        self._single_flight.async_shutdown()
+
+    def as_dict(self) -> dict[str, int]:
+        """Return counters for diagnostics."""
+        return {"logins": self.generation}
+
+
+class ReloginProvider:
+    """Provider proxy that logs in again once on AuthError and retries the call.
+
+    An AuthError from the re-login itself, or from the retried call, is raised
+    to the caller. Attributes and ``login`` are forwarded as-is.
+    """
+
+    def __init__(self, provider: object, session: ProviderSession) -> None:
+        """Wrap a provider."""
+        self._provider = provider
+        self._session = session
+
+    def __getattr__(self, name: str) -> object:
+        """Return provider attributes, retrying async methods after a re-login."""
+        attr = getattr(self._provider, name)
+        if name == "login" or not inspect.iscoroutinefunction(attr):
+            return attr
+        method = cast("Callable[..., Awaitable[object]]", attr)
+        session = self._session
+
+        async def _with_relogin(*args: object, **kwargs: object) -> object:
+            generation = session.generation
+            try:
+                return await method(*args, **kwargs)
+            except AuthError:
+                _LOGGER.debug("Provider rejected the session in %s, logging in", name)
+                await session.async_relogin(generation)
+            return await method(*args, **kwargs)
+
+        return _with_relogin
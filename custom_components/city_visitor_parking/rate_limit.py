@@ -0,0 +1,263 @@
+"""Per-host rate limiting of provider calls for City visitor parking."""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import inspect
+from contextlib import asynccontextmanager
+from itertools import count
+from typing import TYPE_CHECKING, Final, cast
+from urllib.parse import urlsplit
+
+from homeassistant.core import callback
+
+from .const import (
+    DOMAIN,
+    HOST_BURST_REQUESTS,
+    HOST_MAX_CONCURRENT_REQUESTS,
+    HOST_REQUESTS_PER_SECOND,
+)
+from .request_coalescing import COALESCED_READ_METHODS
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Awaitable, Callable
+
+    from homeassistant.core import HomeAssistant
+
+PRIORITY_INTERACTIVE: Final = 0
+"""Priority of user-initiated writes such as starting a reservation."""
+
+PRIORITY_BACKGROUND: Final = 1
+"""Priority of reads such as coordinator polls."""
+
+INTERACTIVE_METHODS: Final[frozenset[str]] = frozenset(
+    {
+        "add_favorite",
+        "end_reservation",
+        "login",
+        "remove_favorite",
+        "start_reservation",
+        "update_favorite",
+        "update_reservation",
+    }
+)
+"""Provider methods that jump the queue ahead of background reads."""
+
+BACKGROUND_METHODS: Final[frozenset[str]] = COALESCED_READ_METHODS
+"""Provider methods that wait behind interactive calls."""
+
+_GOVERNORS_KEY: Final = "host_governors"
+
+
+class HostGovernor:
+    """Token bucket plus concurrency limit shared by every entry on one host.
+
+    A call needs a free concurrency slot and a token. Tokens refill at a
+    sustained rate up to the burst size. Waiting calls are served by
+    priority first and arrival order second, so interactive writes overtake
+    queued background polls without starving them once the queue drains.
+
+    Config entries register their own rate and burst; the strictest of them
+    applies to the host.
+    """
+
+    def __init__(
+        self,
+        *,
+        rate: float = HOST_REQUESTS_PER_SECOND,
+        burst: int = HOST_BURST_REQUESTS,
+        max_concurrent: int = HOST_MAX_CONCURRENT_REQUESTS,
+    ) -> None:
+        """Initialize the governor with a full bucket."""
+        self._rate = rate
+        self._burst = burst
+        self._max_concurrent = max_concurrent
+        self._tokens = float(burst)
+        self._refilled_at: float | None = None
+        self._active = 0
+        self._waiters: list[tuple[int, int, asyncio.Future[None]]] = []
+        self._sequence = count()
+        self._timer: asyncio.TimerHandle | None = None
+        self._entry_limits: dict[str, tuple[float, int]] = {}
+        self.calls: int = 0
+        self.throttled: int = 0
+
+    @callback
+    def async_register(self, entry_id: str, *, rate: float, burst: int) -> None:
+        """Add or update the limits an entry asks for."""
+        self._entry_limits[entry_id] = (rate, burst)
+        self._apply_entry_limits()
+
+    @callback
+    def async_unregister(self, entry_id: str) -> bool:
+        """Drop an entry's limits and return True when no entry is left."""
+        self._entry_limits.pop(entry_id, None)
+        if not self._entry_limits:
+            return True
+        self._apply_entry_limits()
+        return False
+
+    def _apply_entry_limits(self) -> None:
+        """Apply the strictest rate and burst of the registered entries."""
+        self._rate = min(rate for rate, _ in self._entry_limits.values())
+        self._burst = min(burst for _, burst in self._entry_limits.values())
+        self._tokens = min(self._tokens, float(self._burst))
+
+    @asynccontextmanager
+    async def async_slot(self, priority: int) -> AsyncIterator[None]:
+        """Hold a concurrency slot and one token for the duration of a call."""
+        await self._async_acquire(priority)
+        try:
+            yield
+        finally:
+            self._release()
+
+    async def _async_acquire(self, priority: int) -> None:
+        """Wait until a slot and a token are available for priority."""
+        self.calls += 1
+        if not self._waiters and self._try_take():
+            return
+        self.throttled += 1
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._sequence), future))
+        self._wake()
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # The slot was granted just before the caller went away.
+                self._release()
+            else:
+                future.cancel()
+            raise
+
+    def _try_take(self) -> bool:
+        """Take a slot and a token when both are available."""
+        if self._active >= self._max_concurrent:
+            return False
+        now = asyncio.get_running_loop().time()
+        if self._refilled_at is not None:
+            self._tokens = min(
+                float(self._burst),
+                self._tokens + (now - self._refilled_at) * self._rate,
+            )
+        self._refilled_at = now
+        if self._tokens < 1:
+            return False
+        self._tokens -= 1
+        self._active += 1
+        return True
+
+    def _release(self) -> None:
+        """Return a slot and hand it to the next waiter."""
+        self._active -= 1
+        self._wake()
+
+    def _wake(self) -> None:
+        """Grant slots to waiters in priority order while tokens last."""
+        while self._waiters:
+            future = self._waiters[0][2]
+            if future.done():
+                heapq.heappop(self._waiters)
+                continue
+            if not self._try_take():
+                break
+            heapq.heappop(self._waiters)
+            future.set_result(None)
+        if (
+            self._waiters
+            and self._timer is None
+            and self._active < self._max_concurrent
+        ):
+            # Only the bucket is empty; retry once the next token is due.
+            self._timer = asyncio.get_running_loop().call_later(
+                (1 - self._tokens) / self._rate, self._on_timer
+            )
+
+    def _on_timer(self) -> None:
+        """Retry waiting calls after the bucket refilled."""
+        self._timer = None
+        self._wake()
+
+    def as_dict(self) -> dict[str, int]:
+        """Return counters for diagnostics."""
+        return {
+            "calls": self.calls,
+            "throttled": self.throttled,
+            "active": self._active,
+            "waiting": sum(1 for *_, future in self._waiters if not future.done()),
+        }
+
+
+def host_key(base_url: str | None, provider_id: str) -> str:
+    """Return the key of the host a provider talks to."""
+    host = urlsplit(base_url).netloc.lower() if base_url else ""
+    return host or provider_id
+
+
+@callback
+def async_get_host_governor(
+    hass: HomeAssistant,
+    key: str,
+    entry_id: str,
+    *,
+    rate: float = HOST_REQUESTS_PER_SECOND,
+    burst: int = HOST_BURST_REQUESTS,
+) -> HostGovernor:
+    """Return the governor shared by every config entry using host key.
+
+    The entry is registered with its limits until it releases the governor.
+    """
+    governors = _governors(hass)
+    governor = governors.get(key)
+    if governor is None:
+        governor = governors[key] = HostGovernor()
+    governor.async_register(entry_id, rate=rate, burst=burst)
+    return governor
+
+
+@callback
+def async_release_host_governor(hass: HomeAssistant, key: str, entry_id: str) -> None:
+    """Release an entry's use and drop the governor after the last one."""
+    governors = _governors(hass)
+    governor = governors.get(key)
+    if governor is not None and governor.async_unregister(entry_id):
+        del governors[key]
+
+
+def _governors(hass: HomeAssistant) -> dict[str, HostGovernor]:
+    """Return the host governors registry."""
+    data: dict[str, object] = hass.data.setdefault(DOMAIN, {})
+    return cast("dict[str, HostGovernor]", data.setdefault(_GOVERNORS_KEY, {}))
+
+
+class RateLimitedProvider:
+    """Provider proxy that runs provider API calls through a host governor.
+
+    Other methods and attributes are forwarded to the wrapped provider as-is.
+    """
+
+    def __init__(self, provider: object, governor: HostGovernor) -> None:
+        """Wrap a provider."""
+        self._provider = provider
+        self._governor = governor
+
+    def __getattr__(self, name: str) -> object:
+        """Return provider attributes, rate limiting async methods."""
+        attr = getattr(self._provider, name)
+        if (
+            name not in INTERACTIVE_METHODS and name not in BACKGROUND_METHODS
+        ) or not inspect.iscoroutinefunction(attr):
+            return attr
+        method = cast("Callable[..., Awaitable[object]]", attr)
+        governor = self._governor
+        priority = (
+            PRIORITY_INTERACTIVE if name in INTERACTIVE_METHODS else PRIORITY_BACKGROUND
+        )
+
+        async def _limited(*args: object, **kwargs: object) -> object:
+            async with governor.async_slot(priority):
+                return await method(*args, **kwargs)
+
+        return _limited
@@ -0,0 +1,145 @@
+"""Debounced refresh after provider writes for City visitor parking."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from homeassistant.core import callback
+
+from .const import RECONCILE_DELAY, RECONCILE_MAX_DELAY
+
+if TYPE_CHECKING:
+    import asyncio
+    from collections.abc import Callable, Coroutine
+
+    from homeassistant.config_entries import ConfigEntry
+    from homeassistant.core import HomeAssistant
+
+
+class WriteReconciler:
+    """Refresh once after a burst of writes has gone quiet.
+
+    Every write marks the entry dirty and pushes the refresh back to
+    ``RECONCILE_DELAY`` after the latest write, but never later than
+    ``RECONCILE_MAX_DELAY`` after the first write of the burst, so a steady
+    stream of writes still reconciles. A fetch that started after the latest
+    write already reflects every pending write and settles them without an
+    extra refresh.
+
+    Times are ``loop.time()`` seconds.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        config_entry: ConfigEntry,
+        *,
+        function: Callable[[], Coroutine[object, object, None]],
+        name: str,
+    ) -> None:
+        """Initialize a clean reconciler."""
+        self._hass = hass
+        self._config_entry = config_entry
+        self._function = function
+        self._name = name
+        self._pending_writes: int = 0
+        self._first_write_at: float | None = None
+        self._last_write_at: float | None = None
+        self._timer: asyncio.TimerHandle | None = None
+        self._task: asyncio.Task[None] | None = None
+        self.refreshes: int = 0
+        self.settled_by_fetch: int = 0
+        self.coalesced_writes: int = 0
+        self.last_coalesced: int = 0
+        self.max_coalesced: int = 0
+
+    @property
+    def dirty(self) -> bool:
+        """Return whether writes are waiting for a refresh."""
+        return self._pending_writes > 0
+
+    @callback
+    def async_mark_dirty(self) -> None:
+        """Record a write and push the refresh back to the end of the burst."""
+        now = self._hass.loop.time()
+        if self._first_write_at is None:
+            self._first_write_at = now
+        self._last_write_at = now
+        self._pending_writes += 1
+        self._async_schedule(
+            min(
+                now + RECONCILE_DELAY.total_seconds(),
+                self._first_write_at + RECONCILE_MAX_DELAY.total_seconds(),
+            )
+        )
+
+    @callback
+    def async_fetched(self, started_at: float) -> None:
+        """Settle pending writes when a fetch started after the latest one."""
+        if self._last_write_at is None or started_at < self._last_write_at:
+            return
+        self._async_cancel_timer()
+        self._settle()
+        self.settled_by_fetch += 1
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Drop pending writes and cancel the scheduled refresh."""
+        self._async_cancel_timer()
+        self._pending_writes = 0
+        self._first_write_at = None
+        self._last_write_at = None
+
+    def as_dict(self) -> dict[str, object]:
+        """Return counters for diagnostics."""
+        return {
+            "pending_writes": self._pending_writes,
+            "refreshes": self.refreshes,
+            "settled_by_fetch": self.settled_by_fetch,
+            "coalesced_writes": self.coalesced_writes,
+            "last_coalesced": self.last_coalesced,
+            "max_coalesced": self.max_coalesced,
+        }
+
+    @callback
+    def _async_schedule(self, fire_at: float) -> None:
+        """(Re)arm the refresh timer."""
+        self._async_cancel_timer()
+        self._timer = self._hass.loop.call_at(fire_at, self._async_fire)
+
+    @callback
+    def _async_cancel_timer(self) -> None:
+        """Cancel a pending refresh timer."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    @callback
+    def _async_fire(self) -> None:
+        """Start the refresh for the pending writes."""
+        self._timer = None
+        if not self.dirty:
+            return
+        if self._task is not None and not self._task.done():
+            # The running refresh may predate the latest write; try again
+            # once it had time to finish.
+            self._async_schedule(
+                self._hass.loop.time() + RECONCILE_DELAY.total_seconds()
+            )
+            return
+        self._settle()
+        self.refreshes += 1
+        # Bound to the entry so unloading it cancels a running refresh.
+        self._task = self._config_entry.async_create_background_task(
+            self._hass, self._function(), self._name
+        )
+
+    def _settle(self) -> None:
+        """Count the pending writes as covered by one fetch."""
+        writes = self._pending_writes
+        self._pending_writes = 0
+        self._first_write_at = None
+        self._last_write_at = None
+        self.coalesced_writes += writes
+        self.last_coalesced = writes
+        self.max_coalesced = max(self.max_coalesced, writes)
@@ -0,0 +1,134 @@
+"""Single-flight coalescing of provider read calls for City visitor parking."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, Any, Final, cast
+
+from homeassistant.core import callback
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Coroutine, Hashable
+
+    type TaskFactory = Callable[
+        [Coroutine[Any, Any, object], str], asyncio.Future[object]
+    ]
+
+COALESCED_READ_METHODS: Final[frozenset[str]] = frozenset(
+    {"fetch_all", "get_permit", "list_favorites", "list_reservations"}
+)
+"""Provider methods that are safe to share between identical concurrent calls."""
+
+
+class SingleFlight:
+    """Share one in-flight awaitable between identical concurrent calls.
+
+    Shared calls run as tasks made by ``create_task``, which takes the
+    coroutine and a task name. Pass the config entry's background task
+    factory so Home Assistant tracks them; without one they are plain
+    asyncio tasks.
+    """
+
+    def __init__(
+        self, create_task: TaskFactory | None = None, *, name: str = "single flight"
+    ) -> None:
+        """Initialize the single-flight group."""
+        self._create_task = create_task
+        self._name = name
+        self._in_flight: dict[Hashable, asyncio.Future[object]] = {}
+        self._started_at: dict[Hashable, float] = {}
+        self.hits: int = 0
+        self.misses: int = 0
+
+    async def async_run[T](
+        self, key: Hashable, factory: Callable[[], Awaitable[T]]
+    ) -> T:
+        """Await factory once per key while a call with the same key is running."""
+        future = self._in_flight.get(key)
+        if future is None:
+            self.misses += 1
+            self._started_at[key] = asyncio.get_running_loop().time()
+            future = self._start(key, factory)
+            self._in_flight[key] = future
+            future.add_done_callback(lambda done: self._forget(key, done))
+        else:
+            self.hits += 1
+        # Shield so a cancelled caller does not cancel the call for the others.
+        return cast("T", await asyncio.shield(future))
+
+    def started_at(self, key: Hashable) -> float | None:
+        """Return the loop time the running call for key started, if any."""
+        return self._started_at.get(key)
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Cancel the shared calls that are still running."""
+        for future in list(self._in_flight.values()):
+            future.cancel()
+
+    def _start(
+        self, key: Hashable, factory: Callable[[], Awaitable[object]]
+    ) -> asyncio.Future[object]:
+        """Start the shared call for key as a task."""
+        coro = _async_await(factory)
+        name = f"{self._name} {key}"
+        if self._create_task is None:
+            return asyncio.get_running_loop().create_task(coro, name=name)
+        return self._create_task(coro, name)
+
+    def _forget(self, key: Hashable, future: asyncio.Future[object]) -> None:
+        """Drop a finished call so the next caller starts a fresh one."""
+        if self._in_flight.get(key) is future:
+            del self._in_flight[key]
+            del self._started_at[key]
+        if not future.cancelled():
+            # Mark the exception as retrieved when every caller went away.
+            future.exception()
+
+    def as_dict(self) -> dict[str, int]:
+        """Return counters for diagnostics."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "in_flight": len(self._in_flight),
+        }
+
+
+def call_key(name: str, *args: object, **kwargs: object) -> tuple[object, ...]:
+    """Return the single-flight key of a provider call."""
+    return (name, args, tuple(sorted(kwargs.items())))
+
+
+async def _async_await(factory: Callable[[], Awaitable[object]]) -> object:
+    """Await the awaitable returned by factory."""
+    return await factory()
+
+
+class CoalescingProvider:
+    """Provider proxy that coalesces identical concurrent read calls.
+
+    Write methods and attributes are forwarded to the wrapped provider as-is.
+    """
+
+    def __init__(self, provider: object, single_flight: SingleFlight) -> None:
+        """Wrap a provider."""
+        self._provider = provider
+        self._single_flight = single_flight
+
+    def __getattr__(self, name: str) -> object:
+        """Return provider attributes, coalescing read methods."""
+        attr = getattr(self._provider, name)
+        if name not in COALESCED_READ_METHODS or not callable(attr):
+            return attr
+        method = cast("Callable[..., Awaitable[object]]", attr)
+        single_flight = self._single_flight
+
+        async def _coalesced(*args: object, **kwargs: object) -> object:
+            key = call_key(name, *args, **kwargs)
+            try:
+                hash(key)
+            except TypeError:
+                return await method(*args, **kwargs)
+            return await single_flight.async_run(key, lambda: method(*args, **kwargs))
+
+        return _coalesced
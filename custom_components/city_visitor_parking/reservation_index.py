@@ -0,0 +1,102 @@
+"""Time-ordered reservation index for City visitor parking."""
+
+from __future__ import annotations
+
+from bisect import bisect_right
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+    from datetime import datetime
+
+    from .models import CoordinatorData, Reservation
+
+
+class ReservationIndex:
+    """Reservations sorted by start and by end time for bisect lookups.
+
+    Counts are answered in O(log n). Listings bisect past every reservation
+    that cannot match and only walk the remaining candidates, so historical
+    reservations never get scanned. Listings keep the provider order.
+    """
+
+    __slots__ = ("_by_end", "_by_start", "_ends", "_order", "_starts")
+
+    def __init__(self, reservations: Iterable[Reservation]) -> None:
+        """Build the index."""
+        ordered = tuple(reservations)
+        self._order: dict[int, int] = {
+            id(reservation): position for position, reservation in enumerate(ordered)
+        }
+        self._by_start: tuple[Reservation, ...] = tuple(
+            sorted(ordered, key=lambda reservation: reservation.start_time)
+        )
+        self._starts: list[datetime] = [
+            reservation.start_time for reservation in self._by_start
+        ]
+        self._by_end: tuple[Reservation, ...] = tuple(
+            sorted(ordered, key=lambda reservation: reservation.end_time)
+        )
+        self._ends: list[datetime] = [
+            reservation.end_time for reservation in self._by_end
+        ]
+
+    def __len__(self) -> int:
+        """Return the number of indexed reservations."""
+        return len(self._by_start)
+
+    def count_active_at(self, moment: datetime) -> int:
+        """Return how many reservations are active at moment."""
+        # Every reservation that ended by moment also started by moment.
+        return bisect_right(self._starts, moment) - bisect_right(self._ends, moment)
+
+    def active_at(self, moment: datetime) -> tuple[Reservation, ...]:
+        """Return reservations with start <= moment < end."""
+        started = bisect_right(self._starts, moment)
+        not_ended = bisect_right(self._ends, moment)
+        if started <= len(self._ends) - not_ended:
+            candidates: Sequence[Reservation] = self._by_start[:started]
+        else:
+            candidates = self._by_end[not_ended:]
+        return self._in_order(
+            reservation
+            for reservation in candidates
+            if reservation.start_time <= moment < reservation.end_time
+        )
+
+    def count_starting_after(self, moment: datetime) -> int:
+        """Return how many reservations start after moment."""
+        return len(self._starts) - bisect_right(self._starts, moment)
+
+    def starting_after(self, moment: datetime) -> tuple[Reservation, ...]:
+        """Return reservations that start after moment."""
+        return self._in_order(self._by_start[bisect_right(self._starts, moment) :])
+
+    def ending_after(self, moment: datetime) -> tuple[Reservation, ...]:
+        """Return reservations that have not ended at moment."""
+        return self._in_order(self._by_end[bisect_right(self._ends, moment) :])
+
+    def next_start(self, moment: datetime) -> datetime | None:
+        """Return the first start time after moment."""
+        index = bisect_right(self._starts, moment)
+        return self._starts[index] if index < len(self._starts) else None
+
+    def next_end(self, moment: datetime) -> datetime | None:
+        """Return the first end time after moment of a reservation active then."""
+        for reservation in self._by_end[bisect_right(self._ends, moment) :]:
+            if reservation.start_time <= moment:
+                return reservation.end_time
+        return None
+
+    def _in_order(self, reservations: Iterable[Reservation]) -> tuple[Reservation, ...]:
+        """Return reservations in their original provider order."""
+        return tuple(
+            sorted(reservations, key=lambda reservation: self._order[id(reservation)])
+        )
+
+
+def reservation_index(data: CoordinatorData) -> ReservationIndex:
+    """Return the coordinator reservation index, building one if missing."""
+    if data.reservation_index is not None:
+        return data.reservation_index
+    return ReservationIndex(data.reservations)
@@ -2,16 +2,23 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
+from .request_coalescing import SingleFlight
+
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
     from pycityvisitorparking import Client
     from pycityvisitorparking.provider.base import BaseProvider
 
+    from .circuit_breaker import HostCircuitBreaker
     from .coordinator import CityVisitorParkingCoordinator
+    from .http_session import HostSessionPool
     from .models import AutoEndState, OperatingTimeOverrides, ProviderConfig
+    from .poll_scheduler import HostPollScheduler
+    from .provider_session import ProviderSession
+    from .rate_limit import HostGovernor
 
     type CityVisitorParkingConfigEntry = ConfigEntry["CityVisitorParkingRuntimeData"]
 else:
@@ -22,6 +29,16 @@ else:
     CityVisitorParkingConfigEntry = object
 
 
+@dataclass(frozen=True)
+class HostServices:
+    """Collaborators shared by every config entry on one provider host."""
+
+    poll_scheduler: HostPollScheduler | None = None
+    circuit_breaker: HostCircuitBreaker | None = None
+    host_governor: HostGovernor | None = None
+    session_pool: HostSessionPool | None = None
+
+
 @dataclass
 class CityVisitorParkingRuntimeData:
     """Runtime data stored on the config entry."""
@@ -35,3 +52,7 @@ class CityVisitorParkingRuntimeData:
     operating_time_overrides: OperatingTimeOverrides
     free_dates: str
     free_weekdays: list[str]
+    auto_end: bool = False
+    request_coalescing: SingleFlight = field(default_factory=SingleFlight)
+    provider_session: ProviderSession | None = None
+    host_services: HostServices = field(default_factory=HostServices)
@@ -0,0 +1,308 @@
+"""Compiled chargeable-window schedule for City visitor parking."""
+
+from __future__ import annotations
+
+import json
+from bisect import bisect_right
+from collections import OrderedDict
+from datetime import date, datetime, time, timedelta
+from itertools import accumulate
+from typing import TYPE_CHECKING
+
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    CONF_FREE_DATES,
+    CONF_FREE_WEEKDAYS,
+    CONF_OPERATING_TIME_OVERRIDES,
+    SCHEDULE_CACHE_SIZE,
+    SCHEDULE_HORIZON,
+)
+from .models import ZoneAvailability
+from .time_windows import (
+    current_or_next_window_with_overrides,
+    has_schedule_options,
+    windows_for_today,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+
+    from .models import CoordinatorData, TimeRange
+
+_LOOKAHEAD_DAYS = 7
+"""Extra days searched for the next window, matching the override lookahead."""
+
+_EMPTY_OPTIONS: dict[str, object] = {}
+
+_SHARED_SCHEDULES: OrderedDict[
+    tuple[tuple[TimeRange, ...], str, date, str], ChargeSchedule
+] = OrderedDict()
+"""Compiled schedules shared process-wide, least recently used first."""
+
+
+def schedule_options_key(options: Mapping[str, object]) -> str:
+    """Return a stable key for the options that shape the schedule."""
+    return json.dumps(
+        {
+            key: options.get(key)
+            for key in (
+                CONF_FREE_DATES,
+                CONF_FREE_WEEKDAYS,
+                CONF_OPERATING_TIME_OVERRIDES,
+            )
+        },
+        sort_keys=True,
+        default=str,
+    )
+
+
+class ChargeSchedule:
+    """Chargeable windows compiled once for a zone validity and options pair.
+
+    Per-day windows are resolved for every local day in the horizon and kept
+    as one list sorted by start, together with a running maximum of the end
+    times. Lookups bisect these lists instead of re-parsing options and
+    rebuilding windows on every call. Times outside the horizon fall back to
+    the uncompiled helpers in ``time_windows``.
+    """
+
+    __slots__ = (
+        "_block_max_ends",
+        "_blocks",
+        "_days",
+        "_first_day",
+        "_has_options",
+        "_last_day",
+        "_max_ends",
+        "_options",
+        "_starts",
+        "_windows",
+        "options_key",
+        "zone_validity",
+    )
+
+    def __init__(
+        self,
+        zone_validity: Sequence[TimeRange],
+        options: Mapping[str, object],
+        now: datetime,
+    ) -> None:
+        """Compile the schedule around now."""
+        self.zone_validity: tuple[TimeRange, ...] = tuple(zone_validity)
+        self.options_key: str = schedule_options_key(options)
+        self._options: dict[str, object] = dict(options)
+        self._has_options: bool = has_schedule_options(options)
+
+        today = dt_util.as_local(now).date()
+        self._first_day: date = today - timedelta(days=1)
+        self._last_day: date = today + timedelta(days=SCHEDULE_HORIZON.days)
+        self._days: dict[date, tuple[TimeRange, ...]] = {}
+        day = self._first_day
+        while day <= self._last_day:
+            self._days[day] = tuple(
+                windows_for_today(self.zone_validity, options, _local_noon(day))
+            )
+            day += timedelta(days=1)
+
+        self._windows: tuple[TimeRange, ...] = tuple(
+            sorted(
+                (window for windows in self._days.values() for window in windows),
+                key=lambda window: window.start,
+            )
+        )
+        self._starts: list[datetime] = [window.start for window in self._windows]
+        self._max_ends: list[datetime] = list(
+            accumulate((window.end for window in self._windows), max)
+        )
+        self._blocks: tuple[TimeRange, ...] = tuple(
+            sorted(self.zone_validity, key=lambda block: block.start)
+        )
+        self._block_max_ends: list[datetime] = list(
+            accumulate((block.end for block in self._blocks), max)
+        )
+
+    def matches(
+        self, zone_validity: Sequence[TimeRange], options: Mapping[str, object]
+    ) -> bool:
+        """Return True when compiled from the same validity blocks and options."""
+        return (
+            zone_validity is self.zone_validity
+            or tuple(zone_validity) == self.zone_validity
+        ) and schedule_options_key(options) == self.options_key
+
+    def covers(self, moment: datetime) -> bool:
+        """Return True when lookups at moment are answered from the schedule."""
+        local_day = dt_util.as_local(moment).date()
+        return (
+            self._first_day
+            <= local_day
+            <= self._last_day - timedelta(days=_LOOKAHEAD_DAYS)
+        )
+
+    def windows_for_day(self, moment: datetime) -> tuple[TimeRange, ...]:
+        """Return the chargeable windows of the local day containing moment."""
+        windows = self._days.get(dt_util.as_local(moment).date())
+        if windows is None:
+            return tuple(windows_for_today(self.zone_validity, self._options, moment))
+        return windows
+
+    def is_chargeable(self, moment: datetime) -> bool:
+        """Return True when moment falls inside a chargeable window."""
+        if dt_util.as_local(moment).date() not in self._days:
+            return any(
+                window.start <= moment < window.end
+                for window in self.windows_for_day(moment)
+            )
+        index = bisect_right(self._starts, moment) - 1
+        return index >= 0 and self._max_ends[index] > moment
+
+    def next_change(self, moment: datetime) -> datetime | None:
+        """Return when today's chargeable state next flips after moment."""
+        if self.is_chargeable(moment):
+            return min(
+                (
+                    window.end
+                    for window in self.windows_for_day(moment)
+                    if window.start <= moment < window.end
+                ),
+                default=None,
+            )
+        local_day = dt_util.as_local(moment).date()
+        if local_day not in self._days:
+            return min(
+                (
+                    window.start
+                    for window in self.windows_for_day(moment)
+                    if window.start > moment
+                ),
+                default=None,
+            )
+        index = bisect_right(self._starts, moment)
+        if index == len(self._starts):
+            return None
+        next_start = self._starts[index]
+        if next_start >= _local_midnight(local_day + timedelta(days=1)):
+            return None
+        return next_start
+
+    def current_or_next(self, moment: datetime) -> TimeRange | None:
+        """Return the current or next chargeable window after moment."""
+        if not self._has_options:
+            return _first_ending_after(self._blocks, self._block_max_ends, moment)
+        if not self.covers(moment):
+            return current_or_next_window_with_overrides(
+                self.zone_validity, self._options, moment
+            )
+        local_day = dt_util.as_local(moment).date()
+        lookahead = [
+            local_day + timedelta(days=offset) for offset in range(_LOOKAHEAD_DAYS + 1)
+        ]
+        if not any(self._days[day] for day in lookahead):
+            # Nothing in the lookahead: let the helper scan the raw blocks.
+            return current_or_next_window_with_overrides(
+                self.zone_validity, self._options, moment
+            )
+        window = _first_ending_after(self._windows, self._max_ends, moment)
+        if window is None or dt_util.as_local(window.start).date() > lookahead[-1]:
+            return None
+        return window
+
+    def chargeable_seconds(self, start: datetime, end: datetime) -> float:
+        """Return how many seconds between start and end are chargeable."""
+        total = 0.0
+        counted_until = start
+        day = dt_util.as_local(start).date()
+        last_day = dt_util.as_local(end).date()
+        while day <= last_day:
+            for window in sorted(
+                self.windows_for_day(_local_noon(day)), key=lambda item: item.start
+            ):
+                overlap_start = max(window.start, counted_until)
+                overlap_end = min(window.end, end)
+                if overlap_end > overlap_start:
+                    total += (overlap_end - overlap_start).total_seconds()
+                    counted_until = overlap_end
+            day += timedelta(days=1)
+        return total
+
+    def availability(self, moment: datetime) -> ZoneAvailability:
+        """Return the zone availability at moment."""
+        return ZoneAvailability(
+            is_chargeable_now=self.is_chargeable(moment),
+            next_change_time=self.next_change(moment),
+            windows_today=self.windows_for_day(moment),
+        )
+
+
+def shared_schedule(
+    zone_validity: Sequence[TimeRange], options: Mapping[str, object], now: datetime
+) -> ChargeSchedule:
+    """Return a compiled schedule shared by every entry with the same inputs.
+
+    Permits in one zone report identical validity blocks and most entries use
+    the same options, so one compilation per local day serves all of them.
+    The returned schedule's ``zone_validity`` is the first equal tuple seen,
+    letting entries reference a single immutable copy.
+    """
+    key = (
+        tuple(zone_validity),
+        schedule_options_key(options),
+        dt_util.as_local(now).date(),
+        str(dt_util.DEFAULT_TIME_ZONE),
+    )
+    schedule = _SHARED_SCHEDULES.get(key)
+    if schedule is not None:
+        _SHARED_SCHEDULES.move_to_end(key)
+        return schedule
+    schedule = ChargeSchedule(key[0], options, now)
+    _SHARED_SCHEDULES[key] = schedule
+    if len(_SHARED_SCHEDULES) > SCHEDULE_CACHE_SIZE:
+        _SHARED_SCHEDULES.popitem(last=False)
+    return schedule
+
+
+def effective_schedule(
+    data: CoordinatorData, options: Mapping[str, object], now: datetime
+) -> ChargeSchedule:
+    """Return the coordinator schedule for options, compiling one if needed."""
+    schedule = data.charge_schedule
+    if (
+        schedule is None
+        or not schedule.matches(data.zone_validity, options)
+        or not schedule.covers(now)
+    ):
+        return shared_schedule(data.zone_validity, options, now)
+    return schedule
+
+
+def provider_schedule(data: CoordinatorData, now: datetime) -> ChargeSchedule:
+    """Return the schedule of the provider windows without user options."""
+    schedule = data.provider_schedule
+    if (
+        schedule is None
+        or not schedule.matches(data.zone_validity, _EMPTY_OPTIONS)
+        or not schedule.covers(now)
+    ):
+        return shared_schedule(data.zone_validity, _EMPTY_OPTIONS, now)
+    return schedule
+
+
+def _first_ending_after(
+    windows: Sequence[TimeRange], max_ends: Sequence[datetime], moment: datetime
+) -> TimeRange | None:
+    """Return the earliest-starting window that has not ended at moment."""
+    index = bisect_right(max_ends, moment)
+    if index == len(windows):
+        return None
+    return windows[index]
+
+
+def _local_noon(day: date) -> datetime:
+    """Return noon of a local day, safely away from DST transitions."""
+    return datetime.combine(day, time(12), tzinfo=dt_util.DEFAULT_TIME_ZONE)
+
+
+def _local_midnight(day: date) -> datetime:
+    """Return the start of a local day."""
+    return datetime.combine(day, time.min, tzinfo=dt_util.DEFAULT_TIME_ZONE)
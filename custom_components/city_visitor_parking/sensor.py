@@ -8,13 +8,18 @@ from homeassistant.components.sensor import SensorDeviceClass
 from homeassistant.const import EntityCategory, UnitOfTime
 from homeassistant.util import dt as dt_util
 
-from .const import STATE_CHARGEABLE, STATE_FREE
-from .entity import CityVisitorParkingEntity
-from .time_windows import (
-    current_or_next_window,
-    current_or_next_window_with_overrides,
-    windows_for_today,
+from .const import (
+    SECTION_AVAILABILITY,
+    SECTION_BALANCE,
+    SECTION_FAVORITES,
+    SECTION_RESERVATIONS,
+    SECTION_ZONE_VALIDITY,
+    STATE_CHARGEABLE,
+    STATE_FREE,
 )
+from .entity import CityVisitorParkingEntity
+from .reservation_index import reservation_index
+from .schedule import effective_schedule, provider_schedule
 
 if TYPE_CHECKING:
     from datetime import datetime
@@ -27,6 +32,8 @@ if TYPE_CHECKING:
 
 PARALLEL_UPDATES = 0
 
+_WINDOW_SECTIONS = frozenset({SECTION_ZONE_VALIDITY, SECTION_AVAILABILITY})
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -54,6 +61,7 @@ class ActiveReservationsSensor(CityVisitorParkingEntity):
     """Sensor for active reservations count."""
 
     _entity_key = "active_reservations"
+    _coordinator_sections: frozenset[str] | None = frozenset({SECTION_RESERVATIONS})
     _attr_translation_key: str | None = "active_reservations"
 
     def _update_from_coordinator(self) -> None:
@@ -65,22 +73,23 @@ class FutureReservationsSensor(CityVisitorParkingEntity):
     """Sensor for future reservations count."""
 
     _entity_key = "future_reservations"
+    _coordinator_sections: frozenset[str] | None = frozenset({SECTION_RESERVATIONS})
     _attr_translation_key: str | None = "future_reservations"
 
     def _update_from_coordinator(self) -> None:
         """Update the sensor from coordinator data."""
-        now = dt_util.utcnow()
-        self._attr_native_value = sum(
-            1
-            for reservation in self.coordinator.data.reservations
-            if reservation.start_time > now
-        )
+        self._attr_native_value = reservation_index(
+            self.coordinator.data
+        ).count_starting_after(dt_util.utcnow())
 
 
 class RemainingTimeSensor(CityVisitorParkingEntity):
     """Sensor for remaining balance presented by balance unit."""
 
     _entity_key = "remaining_time"
+    _coordinator_sections: frozenset[str] | None = frozenset(
+        {SECTION_BALANCE, SECTION_RESERVATIONS}
+    )
     _attr_translation_key: str | None = "remaining_time"
     _attr_device_class: SensorDeviceClass | None = None
     _attr_native_unit_of_measurement: str | None = UnitOfTime.HOURS
@@ -90,7 +99,7 @@ class RemainingTimeSensor(CityVisitorParkingEntity):
         """Update the sensor from coordinator data."""
         balance_unit = self.coordinator.data.permit_balance_unit
         remaining_balance = _remaining_balance(self.coordinator.data)
-        next_end_time = _next_end_time(self.coordinator.data)
+        next_end_time = _next_end_time(self.coordinator.data, dt_util.utcnow())
         active_count = len(self.coordinator.data.active_reservations)
         attributes: dict[str, object] = dict(self._attr_extra_state_attributes or {})  # type: ignore[has-type]
         attributes.update(
@@ -129,26 +138,19 @@ class PermitZoneAvailabilitySensor(CityVisitorParkingEntity):
     """Sensor for permit zone availability."""
 
     _entity_key = "permit_zone_availability"
+    _coordinator_sections: frozenset[str] | None = _WINDOW_SECTIONS
     _attr_translation_key: str | None = "permit_zone_availability"
 
     def _update_from_coordinator(self) -> None:
         """Update the sensor from coordinator data."""
-        availability = self.coordinator.data.zone_availability
+        data = self.coordinator.data
+        availability = data.zone_availability
         now = dt_util.utcnow()
-        provider_windows = windows_for_today(
-            self.coordinator.data.zone_validity,
-            {},
-            now,
-        )
-        next_window = current_or_next_window_with_overrides(
-            self.coordinator.data.zone_validity,
-            self._entry.options,
-            now,
-        )
-        provider_next_window = current_or_next_window(
-            self.coordinator.data.zone_validity,
-            now,
-        )
+        provider = provider_schedule(data, now)
+        provider_windows = provider.windows_for_day(now)
+        schedule = effective_schedule(data, self._entry.options, now)
+        next_window = schedule.current_or_next(now)
+        provider_next_window = provider.current_or_next(now)
         attributes: dict[str, object] = dict(self._attr_extra_state_attributes or {})  # type: ignore[has-type]
         attributes.update(
             {
@@ -177,6 +179,7 @@ class ProviderChargeableStartSensor(CityVisitorParkingEntity):
     """Sensor for the start of the current or next provider chargeable window."""
 
     _entity_key = "provider_chargeable_start"
+    _coordinator_sections: frozenset[str] | None = _WINDOW_SECTIONS
     _attr_translation_key: str | None = "provider_chargeable_start"
     _attr_device_class: SensorDeviceClass | None = SensorDeviceClass.TIMESTAMP
     _attr_entity_category: EntityCategory | None = EntityCategory.DIAGNOSTIC
@@ -184,10 +187,8 @@ class ProviderChargeableStartSensor(CityVisitorParkingEntity):
 
     def _update_from_coordinator(self) -> None:
         """Update the sensor from coordinator data."""
-        window = current_or_next_window(
-            self.coordinator.data.zone_validity,
-            dt_util.utcnow(),
-        )
+        now = dt_util.utcnow()
+        window = provider_schedule(self.coordinator.data, now).current_or_next(now)
         self._attr_native_value = window.start if window else None
 
 
@@ -195,6 +196,7 @@ class ProviderChargeableEndSensor(CityVisitorParkingEntity):
     """Sensor for the end of the current or next provider chargeable window."""
 
     _entity_key = "provider_chargeable_end"
+    _coordinator_sections: frozenset[str] | None = _WINDOW_SECTIONS
     _attr_translation_key: str | None = "provider_chargeable_end"
     _attr_device_class: SensorDeviceClass | None = SensorDeviceClass.TIMESTAMP
     _attr_entity_category: EntityCategory | None = EntityCategory.DIAGNOSTIC
@@ -202,10 +204,8 @@ class ProviderChargeableEndSensor(CityVisitorParkingEntity):
 
     def _update_from_coordinator(self) -> None:
         """Update the sensor from coordinator data."""
-        window = current_or_next_window(
-            self.coordinator.data.zone_validity,
-            dt_util.utcnow(),
-        )
+        now = dt_util.utcnow()
+        window = provider_schedule(self.coordinator.data, now).current_or_next(now)
         self._attr_native_value = window.end if window else None
 
 
@@ -213,17 +213,15 @@ class NextChargeableStartSensor(CityVisitorParkingEntity):
     """Sensor for the start of the current or next chargeable window."""
 
     _entity_key = "next_chargeable_start"
+    _coordinator_sections: frozenset[str] | None = _WINDOW_SECTIONS
     _attr_translation_key: str | None = "next_chargeable_start"
     _attr_device_class: SensorDeviceClass | None = SensorDeviceClass.TIMESTAMP
 
     def _update_from_coordinator(self) -> None:
         """Update the sensor from coordinator data."""
         now = dt_util.utcnow()
-        window = current_or_next_window_with_overrides(
-            self.coordinator.data.zone_validity,
-            self._entry.options,
-            now,
-        )
+        schedule = effective_schedule(self.coordinator.data, self._entry.options, now)
+        window = schedule.current_or_next(now)
         self._attr_native_value = window.start if window else None
 
 
@@ -231,17 +229,15 @@ class NextChargeableEndSensor(CityVisitorParkingEntity):
     """Sensor for the end of the current or next chargeable window."""
 
     _entity_key = "next_chargeable_end"
+    _coordinator_sections: frozenset[str] | None = _WINDOW_SECTIONS
     _attr_translation_key: str | None = "next_chargeable_end"
     _attr_device_class: SensorDeviceClass | None = SensorDeviceClass.TIMESTAMP
 
     def _update_from_coordinator(self) -> None:
         """Update the sensor from coordinator data."""
         now = dt_util.utcnow()
-        window = current_or_next_window_with_overrides(
-            self.coordinator.data.zone_validity,
-            self._entry.options,
-            now,
-        )
+        schedule = effective_schedule(self.coordinator.data, self._entry.options, now)
+        window = schedule.current_or_next(now)
         self._attr_native_value = window.end if window else None
 
 
@@ -249,6 +245,7 @@ class FavoritesSensor(CityVisitorParkingEntity):
     """Sensor for favorites count."""
 
     _entity_key = "favorites"
+    _coordinator_sections: frozenset[str] | None = frozenset({SECTION_FAVORITES})
     _attr_translation_key: str | None = "favorites"
 
     def _update_from_coordinator(self) -> None:
@@ -275,12 +272,9 @@ def _normalize_currency_unit(unit: str) -> str:
     return unit
 
 
-def _next_end_time(data: CoordinatorData) -> datetime | None:
-    """Return the next end time for active reservations."""
-    if not data.active_reservations:
-        return None
-
-    return min(reservation.end_time for reservation in data.active_reservations)
+def _next_end_time(data: CoordinatorData, now: datetime) -> datetime | None:
+    """Return the next end time of the reservations active at now."""
+    return reservation_index(data).next_end(now)
 
 
 def _timerange_to_dict(window: TimeRange) -> dict[str, str]:
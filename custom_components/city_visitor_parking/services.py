@@ -24,23 +24,44 @@ from pycityvisitorparking.exceptions import (
     ValidationError,
 )
 
+from .bulk_end import async_end_reservations
 from .const import (
     ATTR_END_TIME,
     ATTR_FAVORITE_ID,
     ATTR_LICENSE_PLATE,
+    ATTR_MAX_AGE,
     ATTR_NAME,
+    ATTR_REFRESH,
     ATTR_RESERVATION_ID,
     ATTR_START_TIME,
     CONF_AUTO_END,
+    CONF_MAX_DATA_AGE,
     CONF_PERMIT_ID,
+    DEFAULT_MAX_DATA_AGE,
     DOMAIN,
 )
-from .helpers import normalize_plate
-from .payloads import build_status_payload, normalize_favorites, reservation_payload
+from .helpers import get_attr, normalize_plate
+from .local_updates import (
+    ReservationUpdate,
+    reservation_from_result,
+    with_favorite_added,
+    with_favorite_removed,
+    with_favorite_updated,
+    with_reservation_added,
+    with_reservation_ended,
+    with_reservation_updated,
+)
+from .payloads import (
+    build_reservations_payload,
+    build_status_payload,
+    favorite_payloads,
+    normalize_favorites,
+)
+from .reservation_index import reservation_index
 from .version import async_get_versions, build_log_block
 
 if TYPE_CHECKING:
-    from collections.abc import Mapping
+    from collections.abc import Callable, Mapping
 
     from homeassistant.config_entries import ConfigEntry
     from homeassistant.core import HomeAssistant, ServiceCall
@@ -54,6 +75,7 @@ _LOGGER = logging.getLogger(__name__)
 SERVICE_START_RESERVATION: Final[str] = "start_reservation"
 SERVICE_UPDATE_RESERVATION: Final[str] = "update_reservation"
 SERVICE_END_RESERVATION: Final[str] = "end_reservation"
+SERVICE_END_ALL_RESERVATIONS: Final[str] = "end_all_reservations"
 SERVICE_ADD_FAVORITE: Final[str] = "add_favorite"
 SERVICE_UPDATE_FAVORITE: Final[str] = "update_favorite"
 SERVICE_REMOVE_FAVORITE: Final[str] = "remove_favorite"
@@ -238,6 +260,13 @@ SERVICE_END_SCHEMA: Final[vol.Schema] = vol.Schema(
     }
 )
 
+SERVICE_END_ALL_SCHEMA: Final[vol.Schema] = vol.Schema(
+    {
+        vol.Required(ATTR_DEVICE_ID): DEVICE_SELECTOR,
+        vol.Optional(ATTR_LICENSE_PLATE): cv.string,
+    }
+)
+
 SERVICE_ADD_FAVORITE_SCHEMA: Final[vol.Schema] = vol.Schema(
     {
         vol.Required(ATTR_DEVICE_ID): DEVICE_SELECTOR,
@@ -265,18 +294,21 @@ SERVICE_REMOVE_FAVORITE_SCHEMA: Final[vol.Schema] = vol.Schema(
 SERVICE_LIST_RESERVATIONS_SCHEMA: Final[vol.Schema] = vol.Schema(
     {
         vol.Required(ATTR_DEVICE_ID): DEVICE_SELECTOR,
+        vol.Optional(ATTR_MAX_AGE): vol.All(vol.Coerce(int), vol.Range(min=0)),
     }
 )
 
 SERVICE_LIST_FAVORITES_SCHEMA: Final[vol.Schema] = vol.Schema(
     {
         vol.Required(ATTR_DEVICE_ID): DEVICE_SELECTOR,
+        vol.Optional(ATTR_REFRESH, default=False): cv.boolean,
     }
 )
 
 SERVICE_GET_STATUS_SCHEMA: Final[vol.Schema] = vol.Schema(
     {
         vol.Required(ATTR_DEVICE_ID): DEVICE_SELECTOR,
+        vol.Optional(ATTR_MAX_AGE): vol.All(vol.Coerce(int), vol.Range(min=0)),
     }
 )
 
@@ -307,6 +339,13 @@ async def async_setup_services(hass: HomeAssistant) -> None:
         _async_handle_end_reservation,
         schema=SERVICE_END_SCHEMA,
     )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_END_ALL_RESERVATIONS,
+        _async_handle_end_all_reservations,
+        schema=SERVICE_END_ALL_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
     hass.services.async_register(
         DOMAIN,
         SERVICE_ADD_FAVORITE,
@@ -385,7 +424,7 @@ async def _async_handle_start_reservation(call: ServiceCall) -> None:
         )
 
     try:
-        await runtime.provider.start_reservation(
+        created = await runtime.provider.start_reservation(
             license_plate=license_plate,
             start_time=start,
             end_time=end,
@@ -405,6 +444,14 @@ async def _async_handle_start_reservation(call: ServiceCall) -> None:
             start,
             end,
         )
+        reservation = reservation_from_result(created, start, end, license_plate)
+        if reservation is None:
+            runtime.coordinator.async_schedule_reconcile()
+            return
+        _apply_local_update(
+            runtime,
+            lambda data: with_reservation_added(data, reservation, dt_util.utcnow()),
+        )
 
 
 async def _async_handle_update_reservation(call: ServiceCall) -> None:
@@ -461,7 +508,7 @@ async def _async_handle_update_reservation(call: ServiceCall) -> None:
         )
 
     try:
-        await runtime.provider.update_reservation(
+        updated = await runtime.provider.update_reservation(
             reservation_id=reservation_id,
             start_time=start_dt,
             end_time=end_dt,
@@ -500,16 +547,26 @@ async def _async_handle_update_reservation(call: ServiceCall) -> None:
             end_dt is not None,
             license_plate is not None,
         )
+        _apply_local_update(
+            runtime,
+            lambda data: with_reservation_updated(
+                data,
+                reservation_id,
+                ReservationUpdate(start_dt, end_dt, updated),
+                dt_util.utcnow(),
+            ),
+        )
 
 
 async def _async_handle_end_reservation(call: ServiceCall) -> None:
     """Handle reservation end service."""
     runtime = _runtime_from_call(call)
     reservation_id: str = call.data[ATTR_RESERVATION_ID]
+    end_time = dt_util.utcnow()
     try:
         await runtime.provider.end_reservation(
             reservation_id,
-            dt_util.utcnow(),
+            end_time,
         )
     except PyCityVisitorParkingError as err:
         ha_cvp_version, pycvp_version = await async_get_versions(call.hass)
@@ -525,6 +582,83 @@ async def _async_handle_end_reservation(call: ServiceCall) -> None:
             call.data[ATTR_DEVICE_ID],
             reservation_id,
         )
+        _apply_local_update(
+            runtime,
+            lambda data: with_reservation_ended(data, [reservation_id], end_time),
+        )
+
+
+async def _async_handle_end_all_reservations(
+    call: ServiceCall,
+) -> dict[str, JsonValueType]:
+    """Handle end all reservations service."""
+    runtime = _runtime_from_call(call)
+    plate_raw = call.data.get(ATTR_LICENSE_PLATE)
+    plate = normalize_plate(plate_raw) if isinstance(plate_raw, str) else None
+    if plate == "":
+        # A filter without letters or digits would match no reservation, so
+        # reject it instead of reporting that nothing ended.
+        raise ServiceValidationError(
+            translation_domain=DOMAIN,
+            translation_key="invalid_license_plate",
+        )
+    # Always pick the targets from a fresh fetch; cached data may still list
+    # reservations that already ended elsewhere.
+    data, _stale = await _async_refresh_runtime_data(
+        runtime,
+        device_id=str(call.data[ATTR_DEVICE_ID]),
+        translation_key="reservation_operation_failed",
+        log_label="End all reservations",
+        max_age=timedelta(0),
+    )
+    now = dt_util.utcnow()
+    active = reservation_index(data).active_at(now)
+    if plate is not None:
+        active = tuple(
+            reservation
+            for reservation in active
+            if normalize_plate(reservation.license_plate) == plate
+        )
+
+    results = await async_end_reservations(
+        runtime.provider, [reservation.reservation_id for reservation in active], now
+    )
+    ended_ids = [result.reservation_id for result in results if result.ended]
+    if ended_ids:
+        _apply_local_update(
+            runtime, lambda data: with_reservation_ended(data, ended_ids, now)
+        )
+    elif results:
+        runtime.coordinator.async_schedule_reconcile()
+
+    payloads: list[JsonValueType] = []
+    for result in results:
+        payload: dict[str, JsonValueType] = {
+            "reservation_id": result.reservation_id,
+            "ended": result.ended,
+        }
+        if result.error is not None:
+            payload["error"] = _error_base_key(result.error, "reservation")
+            payload["detail"] = _error_detail(result.error)
+        payloads.append(payload)
+    ended_count = sum(result.ended for result in results)
+    _LOGGER.debug(
+        "End all reservations for device %s: %s of %s ended",
+        call.data[ATTR_DEVICE_ID],
+        ended_count,
+        len(results),
+    )
+    if ended_count == 0 and results:
+        raise HomeAssistantError(
+            translation_domain=DOMAIN,
+            translation_key="reservation_operation_failed",
+        ) from results[0].error
+    return {
+        "count": len(results),
+        "ended_count": ended_count,
+        "failed_count": len(results) - ended_count,
+        "results": payloads,
+    }
 
 
 async def _async_handle_add_favorite(call: ServiceCall) -> None:
@@ -537,7 +671,7 @@ async def _async_handle_add_favorite(call: ServiceCall) -> None:
         payload: dict[str, str] = {ATTR_LICENSE_PLATE: license_plate}
         if name is not None:
             payload[ATTR_NAME] = name
-        await runtime.provider.add_favorite(**payload)
+        created = await runtime.provider.add_favorite(**payload)
     except (TypeError, PyCityVisitorParkingError) as err:
         _LOGGER.debug(
             "Add favorite failed for device %s: %s: %s",
@@ -552,6 +686,15 @@ async def _async_handle_add_favorite(call: ServiceCall) -> None:
             ha_cvp_version=ha_cvp_version,
             pycvp_version=pycvp_version,
         )
+    else:
+        favorite_id = _created_favorite_id(created)
+        if favorite_id is None:
+            runtime.coordinator.async_schedule_reconcile()
+            return
+        _apply_local_update(
+            runtime,
+            lambda data: with_favorite_added(data, favorite_id, license_plate, name),
+        )
 
 
 async def _async_handle_update_favorite(call: ServiceCall) -> None:
@@ -600,6 +743,11 @@ async def _async_handle_update_favorite(call: ServiceCall) -> None:
             ha_cvp_version=ha_cvp_version,
             pycvp_version=pycvp_version,
         )
+    else:
+        _apply_local_update(
+            runtime,
+            lambda data: with_favorite_updated(data, favorite_id, license_plate, name),
+        )
 
 
 async def _async_handle_remove_favorite(call: ServiceCall) -> None:
@@ -618,6 +766,10 @@ async def _async_handle_remove_favorite(call: ServiceCall) -> None:
             ha_cvp_version=ha_cvp_version,
             pycvp_version=pycvp_version,
         )
+    else:
+        _apply_local_update(
+            runtime, lambda data: with_favorite_removed(data, favorite_id)
+        )
 
 
 async def _async_handle_list_reservations(
@@ -625,31 +777,19 @@ async def _async_handle_list_reservations(
 ) -> dict[str, JsonValueType]:
     """Handle list reservations service."""
     runtime = _runtime_from_call(call)
+    entry = _entry_from_call(call)
     request_started = time.perf_counter()
     data, stale = await _async_refresh_runtime_data(
         runtime,
         device_id=str(call.data[ATTR_DEVICE_ID]),
         translation_key="reservation_operation_failed",
         log_label="Reservations",
+        max_age=_max_age_from_call(call, entry),
     )
     reservation_update_fields = _reservation_update_fields(runtime)
-    reservations = data.reservations
-    favorites = data.favorites
-    now = dt_util.utcnow()
-    visible = [
-        reservation for reservation in reservations if reservation.end_time > now
-    ]
-    active = [
-        reservation
-        for reservation in visible
-        if reservation.start_time <= now < reservation.end_time
-    ]
-    future = [reservation for reservation in visible if reservation.start_time > now]
-    favorite_by_plate = {
-        normalize_plate(favorite.license_plate): favorite
-        for favorite in favorites
-        if favorite.license_plate
-    }
+    reservations = cast(
+        "dict[str, JsonValueType]", build_reservations_payload(data, dt_util.utcnow())
+    )
     config_entry = runtime.coordinator.config_entry
     entry_title = config_entry.title if config_entry else "unknown"
     _LOGGER.debug(
@@ -657,28 +797,26 @@ async def _async_handle_list_reservations(
         "(duration=%.3fs)",
         entry_title,
         runtime.permit_id,
-        len(active),
-        len(future),
-        len(reservations),
+        reservations["active_count"],
+        reservations["future_count"],
+        len(data.reservations),
         time.perf_counter() - request_started,
     )
-    reservation_payloads: list[JsonValueType] = [
-        cast("JsonValueType", reservation_payload(reservation, favorite_by_plate))
-        for reservation in visible
-    ]
+    reservation_payloads = reservations["reservations"]
     reservation_update_fields_json: list[JsonValueType] = [
         str(field) for field in reservation_update_fields
     ]
 
     return {
-        "count": len(visible),
-        "active_count": len(active),
-        "future_count": len(future),
+        "count": reservations["count"],
+        "active_count": reservations["active_count"],
+        "future_count": reservations["future_count"],
         # Keep the legacy response key during the migration window so the
         # existing card and automations do not break when only the backend updates.
         "active_reservations": reservation_payloads,
         "reservations": reservation_payloads,
         "stale": stale,
+        "data_age_seconds": _data_age_seconds(runtime),
         "reservation_update_fields": reservation_update_fields_json,
     }
 
@@ -686,19 +824,26 @@ async def _async_handle_list_reservations(
 async def _async_handle_list_favorites(call: ServiceCall) -> dict[str, JsonValueType]:
     """Handle list favorites service."""
     runtime = _runtime_from_call(call)
-    try:
-        favorites = await runtime.provider.list_favorites()
-    except PyCityVisitorParkingError as err:
-        ha_cvp_version, pycvp_version = await async_get_versions(call.hass)
-        _raise_favorite_error(
-            err,
-            **_runtime_log_context(runtime),
-            ha_cvp_version=ha_cvp_version,
-            pycvp_version=pycvp_version,
-        )
+    data = cast("CoordinatorData | None", runtime.coordinator.data)
+    if data is not None and not call.data.get(ATTR_REFRESH, False):
+        favorites = favorite_payloads(data.favorites)
+        source = "snapshot"
+    else:
+        try:
+            provider_favorites = await runtime.provider.list_favorites()
+        except PyCityVisitorParkingError as err:
+            ha_cvp_version, pycvp_version = await async_get_versions(call.hass)
+            _raise_favorite_error(
+                err,
+                **_runtime_log_context(runtime),
+                ha_cvp_version=ha_cvp_version,
+                pycvp_version=pycvp_version,
+            )
+        favorites = normalize_favorites(provider_favorites)
+        source = "provider"
 
     normalized: list[JsonValueType] = []
-    for favorite in normalize_favorites(favorites):
+    for favorite in favorites:
         payload: dict[str, JsonValueType] = {ATTR_FAVORITE_ID: favorite.get("id", "")}
         if "license_plate" in favorite:
             payload[ATTR_LICENSE_PLATE] = favorite["license_plate"]
@@ -709,10 +854,11 @@ async def _async_handle_list_favorites(call: ServiceCall) -> dict[str, JsonValue
     config_entry = runtime.coordinator.config_entry
     entry_title = config_entry.title if config_entry else "unknown"
     _LOGGER.debug(
-        "List favorites response for %s (permit %s): %s favorites",
+        "List favorites response for %s (permit %s): %s favorites (source=%s)",
         entry_title,
         runtime.permit_id,
         len(normalized),
+        source,
     )
     return {"count": len(normalized), "favorites": normalized}
 
@@ -726,6 +872,7 @@ async def _async_handle_get_status(call: ServiceCall) -> dict[str, JsonValueType
         device_id=str(call.data[ATTR_DEVICE_ID]),
         translation_key="status_operation_failed",
         log_label="Status",
+        max_age=_max_age_from_call(call, entry),
     )
     response = build_status_payload(
         data,
@@ -734,6 +881,7 @@ async def _async_handle_get_status(call: ServiceCall) -> dict[str, JsonValueType
         stale=stale,
     )
     response["stale"] = stale
+    response["data_age_seconds"] = _data_age_seconds(runtime)
     return cast("dict[str, JsonValueType]", response)
 
 
@@ -776,12 +924,13 @@ async def _fallback_update_reservation(
         end_time,
         license_plate,
     )
+    now = dt_util.utcnow()
     try:
         await runtime.provider.end_reservation(
             reservation_id,
-            dt_util.utcnow(),
+            now,
         )
-        await runtime.provider.start_reservation(
+        created = await runtime.provider.start_reservation(
             license_plate=license_plate,
             start_time=start_time,
             end_time=end_time,
@@ -804,6 +953,17 @@ async def _fallback_update_reservation(
         )
     else:
         _LOGGER.debug("Fallback reservation update succeeded for %s", reservation_id)
+        reservation = reservation_from_result(
+            created, start_time, end_time, license_plate
+        )
+
+        def _update(data: CoordinatorData) -> CoordinatorData:
+            data = with_reservation_ended(data, [reservation_id], now)
+            if reservation is None:
+                return data
+            return with_reservation_added(data, reservation, now)
+
+        _apply_local_update(runtime, _update)
 
 
 async def _fallback_update_favorite(
@@ -829,11 +989,11 @@ async def _fallback_update_favorite(
     try:
         await runtime.provider.remove_favorite(favorite_id)
         if name is None:
-            await runtime.provider.add_favorite(
+            created = await runtime.provider.add_favorite(
                 license_plate=license_plate,
             )
         else:
-            await runtime.provider.add_favorite(
+            created = await runtime.provider.add_favorite(
                 license_plate=license_plate,
                 name=name,
             )
@@ -855,6 +1015,36 @@ async def _fallback_update_favorite(
         )
     else:
         _LOGGER.debug("Fallback favorite update succeeded for %s", favorite_id)
+        created_id = _created_favorite_id(created)
+
+        def _update(data: CoordinatorData) -> CoordinatorData:
+            data = with_favorite_removed(data, favorite_id)
+            if created_id is None:
+                return data
+            return with_favorite_added(data, created_id, license_plate, name)
+
+        _apply_local_update(runtime, _update)
+
+
+def _apply_local_update(
+    runtime: CityVisitorParkingRuntimeData,
+    update: Callable[[CoordinatorData], CoordinatorData],
+) -> None:
+    """Apply a write to the coordinator snapshot and reconcile later."""
+    coordinator = runtime.coordinator
+    data = cast("CoordinatorData | None", coordinator.data)
+    if data is None:
+        coordinator.async_schedule_reconcile()
+        return
+    coordinator.async_apply_local_update(update(data))
+
+
+def _created_favorite_id(created: object) -> str | None:
+    """Return the favorite id reported by the provider after an add, if any."""
+    favorite_id = get_attr(created, "id")
+    if favorite_id is None or favorite_id == "":
+        return None
+    return str(favorite_id)
 
 
 def _runtime_from_call(call: ServiceCall) -> CityVisitorParkingRuntimeData:
@@ -918,11 +1108,12 @@ async def _async_refresh_runtime_data(
     device_id: str,
     translation_key: str,
     log_label: str,
+    max_age: timedelta,
 ) -> tuple[CoordinatorData, bool]:
-    """Refresh coordinator data for a response service."""
+    """Return coordinator data for a response service, refreshing when too old."""
     stale = False
     try:
-        await runtime.coordinator.async_refresh()
+        await runtime.coordinator.async_refresh_if_stale(max_age)
     except Exception as err:  # pragma: no cover - defensive
         _LOGGER.debug(
             "%s refresh raised for device %s: %s: %s",
@@ -965,6 +1156,30 @@ async def _async_refresh_runtime_data(
     return coordinator_data, stale
 
 
+def _max_age_from_call(call: ServiceCall, entry: ConfigEntry) -> timedelta:
+    """Return the data freshness limit for a read service call."""
+    raw_max_age = call.data.get(ATTR_MAX_AGE)
+    if raw_max_age is None:
+        raw_max_age = entry.options.get(
+            CONF_MAX_DATA_AGE, DEFAULT_MAX_DATA_AGE.total_seconds()
+        )
+    if not isinstance(raw_max_age, int | float | str):
+        return DEFAULT_MAX_DATA_AGE
+    try:
+        seconds = float(raw_max_age)
+    except ValueError:
+        return DEFAULT_MAX_DATA_AGE
+    return timedelta(seconds=max(0.0, seconds))
+
+
+def _data_age_seconds(runtime: CityVisitorParkingRuntimeData) -> float | None:
+    """Return the age of the coordinator data in seconds for responses."""
+    age = runtime.coordinator.data_age_seconds
+    if age is None:
+        return None
+    return round(age, 1)
+
+
 def _reservation_update_fields(
     runtime: CityVisitorParkingRuntimeData,
 ) -> list[str]:
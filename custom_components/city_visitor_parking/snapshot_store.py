@@ -0,0 +1,154 @@
+"""Persisted coordinator snapshot for City visitor parking."""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, cast
+
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN
+from .models import Favorite, Reservation, TimeRange
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+    from datetime import datetime
+
+    from homeassistant.core import HomeAssistant
+
+    from .models import CoordinatorData
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+SAVE_DELAY = 10
+"""Seconds to wait before writing so back-to-back refreshes share one write."""
+
+
+@dataclass(frozen=True)
+class CoordinatorSnapshot:
+    """Normalized provider data, as fetched or persisted after a refresh."""
+
+    permit_id: str
+    permit_remaining_balance: float
+    permit_balance_unit: str | None
+    zone_validity: Sequence[TimeRange]
+    reservations: list[Reservation]
+    favorites: tuple[Favorite, ...]
+
+
+class SnapshotStore:
+    """Keep the last good coordinator data of one config entry on disk."""
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize the store."""
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.snapshot", private=True
+        )
+        self._pending: dict[str, Any] | None = None
+
+    async def async_load(self, permit_id: str) -> CoordinatorSnapshot | None:
+        """Return the stored snapshot for permit_id, if one is usable."""
+        try:
+            raw = await self._store.async_load()
+        except Exception:  # A corrupt snapshot must never block setup.
+            _LOGGER.debug("Could not load coordinator snapshot", exc_info=True)
+            return None
+        if not raw or raw.get("permit_id") != permit_id:
+            return None
+        try:
+            return _snapshot_from_dict(raw)
+        except KeyError, TypeError, ValueError:
+            _LOGGER.debug("Ignoring malformed coordinator snapshot", exc_info=True)
+            return None
+
+    def async_delay_save(self, data: CoordinatorData) -> None:
+        """Schedule writing data as the latest snapshot."""
+        self._pending = _snapshot_to_dict(data)
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    async def async_flush(self) -> None:
+        """Write a pending snapshot right away."""
+        if self._pending is None:
+            return
+        await self._store.async_save(self._data_to_save())
+
+    async def async_remove(self) -> None:
+        """Delete the stored snapshot."""
+        self._pending = None
+        await self._store.async_remove()
+
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the pending snapshot and clear it."""
+        data, self._pending = self._pending or {}, None
+        return data
+
+
+def _snapshot_to_dict(data: CoordinatorData) -> dict[str, Any]:
+    """Serialize the provider fields of coordinator data."""
+    return {
+        "permit_id": data.permit_id,
+        "permit_remaining_balance": data.permit_remaining_balance,
+        "permit_balance_unit": data.permit_balance_unit,
+        "zone_validity": [
+            {"start": window.start.isoformat(), "end": window.end.isoformat()}
+            for window in data.zone_validity
+        ],
+        "reservations": [
+            {
+                "reservation_id": reservation.reservation_id,
+                "start_time": reservation.start_time.isoformat(),
+                "end_time": reservation.end_time.isoformat(),
+                "license_plate": reservation.license_plate,
+            }
+            for reservation in data.reservations
+        ],
+        "favorites": [
+            {
+                "favorite_id": favorite.favorite_id,
+                "license_plate": favorite.license_plate,
+                "name": favorite.name,
+            }
+            for favorite in data.favorites
+        ],
+    }
+
+
+def _snapshot_from_dict(raw: Mapping[str, Any]) -> CoordinatorSnapshot:
+    """Deserialize a stored snapshot."""
+    return CoordinatorSnapshot(
+        permit_id=str(raw["permit_id"]),
+        permit_remaining_balance=float(raw["permit_remaining_balance"]),
+        permit_balance_unit=cast("str | None", raw.get("permit_balance_unit")),
+        zone_validity=[
+            TimeRange(start=_parse(window["start"]), end=_parse(window["end"]))
+            for window in raw["zone_validity"]
+        ],
+        reservations=[
+            Reservation(
+                reservation_id=str(item["reservation_id"]),
+                start_time=_parse(item["start_time"]),
+                end_time=_parse(item["end_time"]),
+                license_plate=item.get("license_plate"),
+            )
+            for item in raw["reservations"]
+        ],
+        favorites=tuple(
+            Favorite(
+                favorite_id=str(item["favorite_id"]),
+                license_plate=item.get("license_plate"),
+                name=item.get("name"),
+            )
+            for item in raw["favorites"]
+        ),
+    )
+
+
+def _parse(value: object) -> datetime:
+    """Parse a stored ISO timestamp."""
+    parsed = dt_util.parse_datetime(str(value))
+    if parsed is None:
+        raise ValueError(f"Invalid timestamp: {value}")
+    return dt_util.as_utc(parsed)
@@ -35,14 +35,8 @@ def current_or_next_window_with_overrides(
     now: datetime,
 ) -> TimeRange | None:
     """Return the current or next chargeable window, honoring overrides."""
-    overrides = options.get(CONF_OPERATING_TIME_OVERRIDES)
-    free_dates_raw = options.get(CONF_FREE_DATES)
-    free_weekdays_raw = options.get(CONF_FREE_WEEKDAYS)
-    has_free_dates = isinstance(free_dates_raw, str) and bool(free_dates_raw.strip())
-    has_overrides = isinstance(overrides, Mapping) and bool(overrides)
-    has_free_weekdays = isinstance(free_weekdays_raw, list) and bool(free_weekdays_raw)
-
-    if not has_free_dates and not has_overrides and not has_free_weekdays:
+    has_overrides, has_free_days = _schedule_option_flags(options)
+    if not has_overrides and not has_free_days:
         return current_or_next_window(zone_validity, now)
 
     windows: list[TimeRange] = []
@@ -54,7 +48,7 @@ def current_or_next_window_with_overrides(
         )
 
     if not windows:
-        if has_free_dates or has_free_weekdays:
+        if has_free_days:
             # Lookahead found nothing; scan zone_validity directly so sparse or
             # seasonal windows beyond the 8-day horizon are still found.
             for block in sorted(zone_validity, key=lambda b: b.start):
@@ -76,6 +70,22 @@ def current_or_next_window_with_overrides(
     return current_or_next_window(windows, now)
 
 
+def has_schedule_options(options: Mapping[str, object]) -> bool:
+    """Return True when options change the provider's chargeable windows."""
+    return any(_schedule_option_flags(options))
+
+
+def _schedule_option_flags(options: Mapping[str, object]) -> tuple[bool, bool]:
+    """Return whether overrides and free dates/weekdays are configured."""
+    overrides = options.get(CONF_OPERATING_TIME_OVERRIDES)
+    free_dates_raw = options.get(CONF_FREE_DATES)
+    free_weekdays_raw = options.get(CONF_FREE_WEEKDAYS)
+    has_free_dates = isinstance(free_dates_raw, str) and bool(free_dates_raw.strip())
+    has_overrides = isinstance(overrides, Mapping) and bool(overrides)
+    has_free_weekdays = isinstance(free_weekdays_raw, list) and bool(free_weekdays_raw)
+    return has_overrides, has_free_dates or has_free_weekdays
+
+
 def windows_for_today(
     zone_validity: Sequence[TimeRange],
     options: Mapping[str, object],
@@ -4,23 +4,38 @@ from __future__ import annotations
 
 import logging
 import time
+from datetime import timedelta
 from typing import TYPE_CHECKING, Final, cast
 
 import voluptuous as vol
 from homeassistant import config_entries
 from homeassistant.components import websocket_api
 from homeassistant.const import ATTR_CONFIG_ENTRY_ID
+from homeassistant.core import callback
+from homeassistant.helpers.event import async_track_point_in_utc_time
 from homeassistant.util import dt as dt_util
 from pycityvisitorparking.exceptions import PyCityVisitorParkingError
 
-from .const import DOMAIN
-from .payloads import build_status_payload, normalize_favorites
+from .const import ATTR_DELTAS, ATTR_REFRESH, DOMAIN
+from .payloads import (
+    build_reservations_payload,
+    build_status_payload,
+    favorite_payloads,
+    json_patch,
+    normalize_favorites,
+)
+from .reservation_index import reservation_index
+from .schedule import effective_schedule
 
 if TYPE_CHECKING:
-    from homeassistant.core import HomeAssistant
+    from collections.abc import Mapping
+    from datetime import datetime
+
+    from homeassistant.core import CALLBACK_TYPE, HomeAssistant
     from pycityvisitorparking import Favorite as ProviderFavorite
     from pycityvisitorparking.provider.base import BaseProvider
 
+    from .coordinator import CityVisitorParkingCoordinator
     from .models import CoordinatorData
     from .runtime_data import (
         CityVisitorParkingConfigEntry,
@@ -31,6 +46,7 @@ else:
 
 WEBSOCKET_LIST_FAVORITES: Final[str] = "city_visitor_parking/favorites"
 WEBSOCKET_GET_STATUS: Final[str] = "city_visitor_parking/status"
+WEBSOCKET_SUBSCRIBE_STATUS: Final[str] = "city_visitor_parking/subscribe_status"
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -39,6 +55,7 @@ async def async_setup_websocket(hass: HomeAssistant) -> None:
     """Set up WebSocket commands."""
     websocket_api.async_register_command(hass, _ws_list_favorites)
     websocket_api.async_register_command(hass, _ws_get_status)
+    websocket_api.async_register_command(hass, _ws_subscribe_status)
 
 
 def _get_loaded_entry(
@@ -64,6 +81,7 @@ def _get_loaded_entry(
     {
         vol.Required("type"): WEBSOCKET_LIST_FAVORITES,
         vol.Required(ATTR_CONFIG_ENTRY_ID): str,
+        vol.Optional(ATTR_REFRESH, default=False): bool,
     }
 )
 @websocket_api.async_response
@@ -80,26 +98,36 @@ async def _ws_list_favorites(
         return
 
     runtime: CityVisitorParkingRuntimeData = entry.runtime_data
-    provider: BaseProvider = runtime.provider
-    try:
-        favorites: list[ProviderFavorite] = await provider.list_favorites()
-    except PyCityVisitorParkingError:
-        _LOGGER.debug(
-            "Favorites websocket fetch failed for %s (permit %s)",
-            entry.title,
-            runtime.permit_id,
-            exc_info=True,
-        )
-        connection.send_error(msg_id, "favorites_failed", "Could not fetch favorites")
-        return
+    data = cast("CoordinatorData | None", runtime.coordinator.data)
+    if data is not None and not msg.get(ATTR_REFRESH, False):
+        favorites = favorite_payloads(data.favorites)
+        source = "snapshot"
+    else:
+        provider: BaseProvider = runtime.provider
+        try:
+            provider_favorites: list[ProviderFavorite] = await provider.list_favorites()
+        except PyCityVisitorParkingError:
+            _LOGGER.debug(
+                "Favorites websocket fetch failed for %s (permit %s)",
+                entry.title,
+                runtime.permit_id,
+                exc_info=True,
+            )
+            connection.send_error(
+                msg_id, "favorites_failed", "Could not fetch favorites"
+            )
+            return
+        favorites = normalize_favorites(provider_favorites)
+        source = "provider"
 
-    connection.send_result(msg_id, {"favorites": normalize_favorites(favorites)})
+    connection.send_result(msg_id, {"favorites": favorites})
     _LOGGER.debug(
         "Favorites websocket response for %s (permit %s): %s favorites "
-        "(duration=%.3fs)",
+        "(source=%s duration=%.3fs)",
         entry.title,
         runtime.permit_id,
-        len(favorites or []),
+        len(favorites),
+        source,
         time.perf_counter() - request_started,
     )
 
@@ -129,7 +157,7 @@ async def _ws_get_status(
         if data is None:
             connection.send_error(msg_id, "status_failed", "No data available")
             return
-        stale = not runtime.coordinator.last_update_success
+        stale = _is_stale(runtime.coordinator)
         now = dt_util.utcnow()
         payload = build_status_payload(data, entry.options, now, stale=stale)
     except Exception:  # Websocket boundary needs a consistent error response.
@@ -155,3 +183,152 @@ async def _ws_get_status(
         payload["window_kind"],
         time.perf_counter() - request_started,
     )
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): WEBSOCKET_SUBSCRIBE_STATUS,
+        vol.Required(ATTR_CONFIG_ENTRY_ID): str,
+        vol.Optional(ATTR_DELTAS, default=False): bool,
+    }
+)
+@callback
+def _ws_subscribe_status(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, object],
+) -> None:
+    """Push status and reservations whenever they may have changed.
+
+    An event is sent right after subscribing, after every coordinator update,
+    and when a window or reservation boundary passes between updates.
+
+    With ``deltas`` enabled the first event is ``{"type": "snapshot", "seq": 0,
+    "data": ...}`` and later events are ``{"type": "delta", "seq": n, "ops":
+    [...]}`` holding JSON-patch operations against the previous event. Unchanged
+    payloads are not sent, so a client that sees a gap in ``seq`` should
+    resubscribe to get a fresh snapshot.
+    """
+    msg_id = cast("int", msg["id"])
+    entry = _get_loaded_entry(hass, connection, msg)
+    if entry is None:
+        return
+
+    runtime: CityVisitorParkingRuntimeData = entry.runtime_data
+    coordinator = runtime.coordinator
+    unsub_boundary: CALLBACK_TYPE | None = None
+    deltas = bool(msg.get(ATTR_DELTAS, False))
+    previous: dict[str, object] | None = None
+    seq = 0
+
+    @callback
+    def _async_send(payload: dict[str, object]) -> None:
+        """Send a full payload, or the changes since the last one."""
+        nonlocal previous, seq
+        event: dict[str, object] = payload
+        if deltas:
+            if previous is None:
+                event = {"type": "snapshot", "seq": seq, "data": payload}
+            else:
+                ops = json_patch(previous, payload)
+                if not ops:
+                    return
+                seq += 1
+                event = {"type": "delta", "seq": seq, "ops": ops}
+            previous = payload
+        connection.send_message(websocket_api.event_message(msg_id, event))
+
+    @callback
+    def _async_push(_now: datetime | None = None) -> None:
+        """Send the current snapshot and arm the next boundary timer."""
+        nonlocal unsub_boundary
+        if unsub_boundary is not None:
+            unsub_boundary()
+            unsub_boundary = None
+        if entry.state is not config_entries.ConfigEntryState.LOADED:
+            return
+        data = cast("CoordinatorData | None", coordinator.data)
+        if data is None:
+            return
+        now = dt_util.utcnow()
+        _async_send(
+            _subscription_payload(
+                data,
+                entry.options,
+                now,
+                stale=_is_stale(coordinator),
+            )
+        )
+        unsub_boundary = async_track_point_in_utc_time(
+            hass,
+            _async_push,
+            _next_boundary(data, entry.options, now),
+        )
+
+    unsub_listener = coordinator.async_add_listener(_async_push)
+
+    @callback
+    def _async_unsubscribe() -> None:
+        """Stop pushing updates for this subscription."""
+        unsub_listener()
+        if unsub_boundary is not None:
+            unsub_boundary()
+
+    connection.subscriptions[msg_id] = _async_unsubscribe
+    connection.send_result(msg_id)
+    _async_push()
+    _LOGGER.debug(
+        "Status subscription %s started for %s (permit %s, deltas=%s)",
+        msg_id,
+        entry.title,
+        runtime.permit_id,
+        deltas,
+    )
+
+
+def _is_stale(coordinator: CityVisitorParkingCoordinator) -> bool:
+    """Return True unless the data comes from a successful fetch in this run.
+
+    Data seeded from the stored snapshot has no age until the first refresh.
+    """
+    return not coordinator.last_update_success or coordinator.data_age_seconds is None
+
+
+def _subscription_payload(
+    data: CoordinatorData,
+    options: Mapping[str, object],
+    now: datetime,
+    *,
+    stale: bool,
+) -> dict[str, object]:
+    """Build the event payload pushed to status subscribers."""
+    next_change_time = data.zone_availability.next_change_time
+    # Between polls the snapshot availability expires at its next change;
+    # recompute it from the windows the same way stale data is handled.
+    expired = next_change_time is not None and next_change_time <= now
+    status = build_status_payload(data, options, now, stale=stale or expired)
+    status["stale"] = stale
+    return {
+        "status": status,
+        "reservations": build_reservations_payload(data, now),
+    }
+
+
+def _next_boundary(
+    data: CoordinatorData, options: Mapping[str, object], now: datetime
+) -> datetime:
+    """Return the next moment the pushed payload changes without new data."""
+    windows = [*effective_schedule(data, options, now).windows_for_day(now)]
+    windows.extend(data.zone_validity)
+    points = [point for window in windows for point in (window.start, window.end)]
+    # A future reservation starts before it ends, so the next start and the
+    # next end of an active reservation cover every reservation change.
+    index = reservation_index(data)
+    points.extend(
+        point for point in (index.next_start(now), index.next_end(now)) if point
+    )
+    # Today's windows roll over at local midnight.
+    next_midnight = dt_util.start_of_local_day(
+        (dt_util.as_local(now) + timedelta(days=1)).date()
+    )
+    return min([next_midnight, *(point for point in points if point > now)])
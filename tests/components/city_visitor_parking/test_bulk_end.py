@@ -0,0 +1,83 @@
+"""Tests for bounded concurrent reservation ends."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING
+from unittest.mock import AsyncMock
+
+from custom_components.city_visitor_parking import bulk_end
+from custom_components.city_visitor_parking.bulk_end import async_end_reservations
+
+if TYPE_CHECKING:
+    from types import ModuleType
+
+    from pytest import MonkeyPatch
+
+MAX_CONCURRENT = 2
+RETRIES = 2
+FLAKY_ATTEMPTS = 2
+END_TIME = datetime(2025, 1, 1, 12, 0, tzinfo=UTC)
+
+
+async def test_ends_are_bounded_and_ordered() -> None:
+    """No more than max_concurrent ends should run at once."""
+    running = 0
+    peak = 0
+
+    async def _end(_reservation_id: str, _end_time: datetime) -> None:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0)
+        running -= 1
+
+    provider = AsyncMock()
+    provider.end_reservation.side_effect = _end
+    reservation_ids = ["res1", "res2", "res3", "res4", "res1"]
+
+    results = await async_end_reservations(
+        provider, reservation_ids, END_TIME, max_concurrent=MAX_CONCURRENT
+    )
+
+    assert peak == MAX_CONCURRENT
+    assert [result.reservation_id for result in results] == [
+        "res1",
+        "res2",
+        "res3",
+        "res4",
+    ]
+    assert all(result.ended for result in results)
+
+
+async def test_network_errors_are_retried(
+    pv_library: ModuleType, monkeypatch: MonkeyPatch
+) -> None:
+    """Network errors should be retried; other errors fail the item at once."""
+    monkeypatch.setattr(bulk_end, "BULK_END_RETRIES", RETRIES)
+    monkeypatch.setattr(bulk_end, "BULK_END_RETRY_DELAY", timedelta(0))
+
+    async def _end(reservation_id: str, _end_time: datetime) -> None:
+        if reservation_id == "flaky" and provider.end_reservation.await_count == 1:
+            raise pv_library.NetworkError("timeout")
+        if reservation_id == "down":
+            raise pv_library.NetworkError("timeout")
+        if reservation_id == "rejected":
+            raise pv_library.ValidationError("already ended")
+
+    provider = AsyncMock()
+    provider.end_reservation.side_effect = _end
+
+    (flaky,) = await async_end_reservations(provider, ["flaky"], END_TIME)
+    down, rejected = await async_end_reservations(
+        provider, ["down", "rejected"], END_TIME
+    )
+
+    assert flaky.ended
+    assert flaky.attempts == FLAKY_ATTEMPTS
+    assert not down.ended
+    assert isinstance(down.error, pv_library.NetworkError)
+    assert down.attempts == RETRIES + 1
+    assert not rejected.ended
+    assert rejected.attempts == 1
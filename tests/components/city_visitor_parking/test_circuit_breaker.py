@@ -0,0 +1,109 @@
+"""Tests for the per-host provider circuit breaker."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from custom_components.city_visitor_parking.circuit_breaker import (
+    CircuitState,
+    HostCircuitBreaker,
+    async_get_circuit_breaker,
+    async_release_circuit_breaker,
+)
+from custom_components.city_visitor_parking.rate_limit import host_key
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+FAILURE_THRESHOLD = 3
+MIN_OPEN_TIME = 60.0
+MAX_OPEN_TIME = 200.0
+
+
+def _breaker() -> HostCircuitBreaker:
+    """Return a breaker with small, predictable limits."""
+    return HostCircuitBreaker(
+        failure_threshold=FAILURE_THRESHOLD,
+        min_open_time=MIN_OPEN_TIME,
+        max_open_time=MAX_OPEN_TIME,
+    )
+
+
+def test_breaker_opens_after_consecutive_failures() -> None:
+    """Polls should pause once the failure threshold is reached."""
+    breaker = _breaker()
+
+    for _ in range(FAILURE_THRESHOLD - 1):
+        breaker.record_failure(0.0)
+    assert breaker.allow(0.0)
+
+    breaker.record_failure(0.0)
+    assert breaker.state is CircuitState.OPEN
+    assert not breaker.allow(1.0)
+    retry_after = breaker.retry_after(1.0)
+    assert retry_after is not None
+    assert MIN_OPEN_TIME / 2 - 1 <= retry_after <= MIN_OPEN_TIME - 1
+
+
+def test_half_open_probe_closes_breaker_on_success() -> None:
+    """One probe should be let through and close the breaker when it works."""
+    breaker = _breaker()
+    for _ in range(FAILURE_THRESHOLD):
+        breaker.record_failure(0.0)
+
+    assert breaker.allow(MIN_OPEN_TIME)
+    assert breaker.state is CircuitState.HALF_OPEN
+    assert not breaker.allow(MIN_OPEN_TIME)
+
+    breaker.record_success()
+    assert breaker.state is CircuitState.CLOSED
+    assert breaker.retry_after(MIN_OPEN_TIME) is None
+
+
+def test_failed_probe_backs_off_exponentially() -> None:
+    """Each failed probe should double the pause up to the maximum."""
+    breaker = _breaker()
+    for _ in range(FAILURE_THRESHOLD):
+        breaker.record_failure(0.0)
+
+    now = MIN_OPEN_TIME
+    expected = (MIN_OPEN_TIME * 2, MAX_OPEN_TIME, MAX_OPEN_TIME)
+    for backoff in expected:
+        assert breaker.allow(now)
+        breaker.record_failure(now)
+        retry_after = breaker.retry_after(now)
+        assert retry_after is not None
+        assert backoff / 2 <= retry_after <= backoff
+        now += backoff
+
+
+def test_stuck_probe_times_out() -> None:
+    """A probe that never reports back should not block polling forever."""
+    breaker = _breaker()
+    for _ in range(FAILURE_THRESHOLD):
+        breaker.record_failure(0.0)
+
+    assert breaker.allow(MIN_OPEN_TIME)
+    assert not breaker.allow(MIN_OPEN_TIME * 1.5)
+    assert breaker.allow(MIN_OPEN_TIME * 2)
+
+
+async def test_breaker_is_dropped_after_the_last_entry(
+    hass: HomeAssistant,
+) -> None:
+    """Re-added entries should not inherit the open state of a released host."""
+    key = host_key("https://mijn.2park.nl", "2park")
+    first = async_get_circuit_breaker(hass, key, "entry1")
+    async_get_circuit_breaker(hass, key, "entry2")
+    for _ in range(FAILURE_THRESHOLD):
+        first.record_failure(0.0)
+
+    async_release_circuit_breaker(hass, key, "entry1")
+    assert async_get_circuit_breaker(hass, key, "entry1") is first
+
+    async_release_circuit_breaker(hass, key, "entry1")
+    async_release_circuit_breaker(hass, key, "entry2")
+    async_release_circuit_breaker(hass, key, "entry2")
+    breaker = async_get_circuit_breaker(hass, key, "entry1")
+    assert breaker is not first
+    assert breaker.state is CircuitState.CLOSED
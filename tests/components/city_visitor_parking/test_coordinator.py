@@ -2,28 +2,40 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+from dataclasses import replace
 from datetime import UTC, datetime, time, timedelta
 from types import SimpleNamespace
 from typing import TYPE_CHECKING, Any, cast
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from freezegun import freeze_time
 from homeassistant.exceptions import ConfigEntryAuthFailed
 from homeassistant.helpers.update_coordinator import UpdateFailed
 from homeassistant.util import dt as dt_util
-from pytest_homeassistant_custom_component.common import MockConfigEntry
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+)
 
-import custom_components.city_visitor_parking.coordinator as coord_module
+from custom_components.city_visitor_parking.circuit_breaker import (
+    CircuitState,
+    HostCircuitBreaker,
+)
 from custom_components.city_visitor_parking.const import (
+    CIRCUIT_MIN_OPEN_TIME,
     CONF_AUTO_END,
+    CONF_FREE_WEEKDAYS,
     CONF_OPERATING_TIME_OVERRIDES,
+    COORDINATOR_SECTIONS,
     DEFAULT_UPDATE_INTERVAL,
     DOMAIN,
     IDLE_UPDATE_INTERVAL,
-    TRANSITION_BUFFER,
-    TRANSITION_LOOKAHEAD,
+    RECONCILE_DELAY,
+    SECTION_FAVORITES,
+    WEEKDAY_KEYS,
 )
 from custom_components.city_visitor_parking.coordinator import (
     CityVisitorParkingCoordinator,
@@ -32,7 +44,6 @@ from custom_components.city_visitor_parking.coordinator import (
     ProviderProtocol,
     ProviderReservation,
     _as_utc_datetime,
-    _compute_zone_availability,
     _normalize_favorites,
     _normalize_remaining_balance,
     _normalize_reservations,
@@ -51,6 +62,12 @@ from custom_components.city_visitor_parking.models import (
     TimeRange,
     ZoneAvailability,
 )
+from custom_components.city_visitor_parking.poll_scheduler import HostPollScheduler
+from custom_components.city_visitor_parking.request_coalescing import (
+    CoalescingProvider,
+    SingleFlight,
+)
+from custom_components.city_visitor_parking.runtime_data import HostServices
 from custom_components.city_visitor_parking.time_windows import (
     _as_time,
     windows_for_today,
@@ -63,6 +80,9 @@ if TYPE_CHECKING:
     from pytest import LogCaptureFixture, MonkeyPatch
 
 EXPECTED_MINUTES = 15
+LOCAL_UPDATES = 2
+ANCHOR_BALANCE = 120.0
+REANCHOR_BALANCE = 100.0
 
 
 async def test_auto_end_reservation_once(hass: HomeAssistant) -> None:
@@ -84,8 +104,6 @@ async def test_auto_end_reservation_once(hass: HomeAssistant) -> None:
         hass,
         provider=provider,
         config_entry=entry,
-        permit_id="permit",
-        auto_end_state=AutoEndState(),
     )
 
     with freeze_time(now):
@@ -116,8 +134,6 @@ async def test_auth_failure_triggers_reauth(
         hass,
         provider=provider,
         config_entry=entry,
-        permit_id="permit",
-        auto_end_state=AutoEndState(),
     )
 
     with caplog.at_level(
@@ -150,8 +166,6 @@ async def test_network_failure_raises_updatefailed(
         hass,
         provider=provider,
         config_entry=entry,
-        permit_id="permit",
-        auto_end_state=AutoEndState(),
     )
 
     with caplog.at_level(
@@ -163,6 +177,65 @@ async def test_network_failure_raises_updatefailed(
     assert "1.2.3" in caplog.text
 
 
+async def test_open_circuit_pauses_polling(
+    hass: HomeAssistant, pv_library: ModuleType
+) -> None:
+    """Failing polls should open the host circuit and stop calling the provider."""
+    entry = _create_entry(auto_end=False)
+    entry.add_to_hass(hass)
+    provider = AsyncMock()
+    provider.fetch_all.side_effect = pv_library.NetworkError
+    breaker = HostCircuitBreaker(failure_threshold=1)
+    coordinator = CityVisitorParkingCoordinator(
+        hass,
+        provider=provider,
+        config_entry=entry,
+        host_services=HostServices(circuit_breaker=breaker),
+    )
+
+    await coordinator.async_refresh()
+    await coordinator.async_refresh()
+
+    provider.fetch_all.assert_awaited_once()
+    assert breaker.state is CircuitState.OPEN
+    assert isinstance(coordinator.last_exception, UpdateFailed)
+    assert coordinator.update_interval is not None
+    assert coordinator.update_interval <= CIRCUIT_MIN_OPEN_TIME
+
+
+async def test_failed_poll_returns_to_its_slot(
+    hass: HomeAssistant, pv_library: ModuleType
+) -> None:
+    """A failure that leaves the circuit closed should retry in the entry's slot."""
+    entry = _create_entry(auto_end=False)
+    entry.add_to_hass(hass)
+    provider = AsyncMock()
+    provider.fetch_all.side_effect = pv_library.NetworkError
+    scheduler = HostPollScheduler()
+    scheduler.async_register(entry.entry_id)
+    scheduler.async_register("other_entry")
+    coordinator = CityVisitorParkingCoordinator(
+        hass,
+        provider=provider,
+        config_entry=entry,
+        host_services=HostServices(
+            poll_scheduler=scheduler,
+            circuit_breaker=HostCircuitBreaker(),
+        ),
+    )
+    # An off-slot delay left over from an earlier reschedule.
+    coordinator.update_interval = timedelta(minutes=1)
+
+    now = datetime(2025, 1, 6, 9, 0, tzinfo=UTC)
+    with freeze_time(now):
+        await coordinator.async_refresh()
+
+    assert isinstance(coordinator.last_exception, UpdateFailed)
+    assert coordinator.update_interval == scheduler.next_interval(
+        entry.entry_id, DEFAULT_UPDATE_INTERVAL, now
+    )
+
+
 async def test_unexpected_failure_raises_updatefailed(hass: HomeAssistant) -> None:
     """Unexpected failures should raise UpdateFailed."""
     entry = _create_entry(auto_end=False)
@@ -175,8 +248,6 @@ async def test_unexpected_failure_raises_updatefailed(hass: HomeAssistant) -> No
         hass,
         provider=provider,
         config_entry=entry,
-        permit_id="permit",
-        auto_end_state=AutoEndState(),
     )
 
     await coordinator.async_refresh()
@@ -196,8 +267,6 @@ async def test_coordinator_logs_recovery(hass: HomeAssistant) -> None:
         hass,
         provider=provider,
         config_entry=entry,
-        permit_id="permit",
-        auto_end_state=AutoEndState(),
     )
     coordinator._unavailable_logged = True
 
@@ -228,8 +297,6 @@ async def test_auto_end_handles_provider_failure(
         hass,
         provider=provider,
         config_entry=entry,
-        permit_id="permit",
-        auto_end_state=AutoEndState(),
     )
 
     with freeze_time(now):
@@ -284,7 +351,18 @@ def test_normalize_helpers() -> None:
         )
     )
     assert len(validity) == 1
-    assert _normalize_zone_validity(cast("Permit", {"zone_validity": {}})) == []
+    assert _normalize_zone_validity(cast("Permit", {"zone_validity": {}})) == ()
+    # Permits reporting the same blocks share one parsed tuple.
+    raw = {
+        "zone_validity": [
+            {
+                "start_time": now.isoformat(),
+                "end_time": (now + timedelta(hours=1)).isoformat(),
+            }
+        ]
+    }
+    shared = _normalize_zone_validity(cast("Permit", raw))
+    assert _normalize_zone_validity(cast("Permit", dict(raw))) is shared
 
     parsed = _as_utc_datetime("2025-01-01T10:00:00+00:00")
     assert parsed.tzinfo is not None
@@ -350,8 +428,6 @@ async def test_auto_end_skips_when_chargeable(hass: HomeAssistant) -> None:
         hass,
         provider=provider,
         config_entry=entry,
-        permit_id="permit",
-        auto_end_state=AutoEndState(),
     )
 
     data = CoordinatorData(
@@ -389,8 +465,6 @@ async def test_auto_end_skips_without_reservations(hass: HomeAssistant) -> None:
         hass,
         provider=provider,
         config_entry=entry,
-        permit_id="permit",
-        auto_end_state=AutoEndState(),
     )
 
     data = CoordinatorData(
@@ -421,8 +495,6 @@ async def test_options_fallback_when_missing_entry(hass: HomeAssistant) -> None:
         hass,
         provider=AsyncMock(),
         config_entry=entry,
-        permit_id="permit",
-        auto_end_state=AutoEndState(),
     )
     coordinator.config_entry = None
 
@@ -438,8 +510,6 @@ async def test_log_unavailable_once(hass: HomeAssistant) -> None:
         hass,
         provider=AsyncMock(),
         config_entry=entry,
-        permit_id="permit",
-        auto_end_state=AutoEndState(),
     )
 
     coordinator._log_unavailable_once()
@@ -484,19 +554,6 @@ def test_override_helpers() -> None:
     assert get_attr(SimpleNamespace(name="test"), "name") == "test"
 
 
-def test_compute_zone_availability_next_change() -> None:
-    """Zone availability should return the end of the current window."""
-    now = datetime(2025, 1, 6, 9, 30, tzinfo=UTC)
-    window = TimeRange(
-        start=datetime(2025, 1, 6, 9, 0, tzinfo=UTC),
-        end=datetime(2025, 1, 6, 11, 0, tzinfo=UTC),
-    )
-    availability = _compute_zone_availability([window], {}, now)
-
-    assert availability.is_chargeable_now is True
-    assert availability.next_change_time == window.end
-
-
 def test_windows_for_today_invalid_overrides() -> None:
     """Invalid overrides should fall back to zone validity."""
     now = datetime(2025, 1, 6, 9, 0, tzinfo=UTC)
@@ -525,8 +582,6 @@ def test_compute_next_interval_active_reservation(hass: HomeAssistant) -> None:
         hass,
         provider=AsyncMock(),
         config_entry=entry,
-        permit_id="permit",
-        auto_end_state=AutoEndState(),
     )
 
     now = datetime(2025, 1, 6, 9, 0, tzinfo=UTC)
@@ -540,7 +595,7 @@ def test_compute_next_interval_active_reservation(hass: HomeAssistant) -> None:
         ),
     )
 
-    assert coordinator._compute_next_interval(data, now) == DEFAULT_UPDATE_INTERVAL
+    assert coordinator._compute_next_interval(data) == DEFAULT_UPDATE_INTERVAL
 
 
 def test_compute_next_interval_zone_chargeable(hass: HomeAssistant) -> None:
@@ -551,8 +606,6 @@ def test_compute_next_interval_zone_chargeable(hass: HomeAssistant) -> None:
         hass,
         provider=AsyncMock(),
         config_entry=entry,
-        permit_id="permit",
-        auto_end_state=AutoEndState(),
     )
 
     now = datetime(2025, 1, 6, 9, 0, tzinfo=UTC)
@@ -564,184 +617,492 @@ def test_compute_next_interval_zone_chargeable(hass: HomeAssistant) -> None:
         ),
     )
 
-    assert coordinator._compute_next_interval(data, now) == DEFAULT_UPDATE_INTERVAL
+    assert coordinator._compute_next_interval(data) == DEFAULT_UPDATE_INTERVAL
 
 
-def test_compute_next_interval_transition_imminent(hass: HomeAssistant) -> None:
-    """Zone transition within TRANSITION_LOOKAHEAD → default interval."""
+def test_compute_next_interval_ignores_upcoming_transition(
+    hass: HomeAssistant,
+) -> None:
+    """A known zone transition is handled by the timer, not by faster polling."""
     entry = _create_entry(auto_end=False)
     entry.add_to_hass(hass)
     coordinator = CityVisitorParkingCoordinator(
         hass,
         provider=AsyncMock(),
         config_entry=entry,
-        permit_id="permit",
-        auto_end_state=AutoEndState(),
     )
 
     now = datetime(2025, 1, 6, 9, 0, tzinfo=UTC)
-    # Transition is exactly at the edge of the lookahead window.
     data = _idle_data(
         zone_availability=ZoneAvailability(
             is_chargeable_now=False,
-            next_change_time=now + TRANSITION_LOOKAHEAD,
+            next_change_time=now + timedelta(minutes=5),
             windows_today=(),
         ),
     )
 
-    assert coordinator._compute_next_interval(data, now) == DEFAULT_UPDATE_INTERVAL
+    assert coordinator._compute_next_interval(data) == IDLE_UPDATE_INTERVAL
 
 
-def test_compute_next_interval_precise_scheduling(hass: HomeAssistant) -> None:
-    """Known transition beyond lookahead -> precise interval capped at IDLE."""
+def test_compute_next_interval_idle(hass: HomeAssistant) -> None:
+    """No active reservation, free zone, no next transition → idle interval."""
     entry = _create_entry(auto_end=False)
     entry.add_to_hass(hass)
     coordinator = CityVisitorParkingCoordinator(
         hass,
         provider=AsyncMock(),
         config_entry=entry,
-        permit_id="permit",
-        auto_end_state=AutoEndState(),
     )
 
+    data = _idle_data()
+
+    assert coordinator._compute_next_interval(data) == IDLE_UPDATE_INTERVAL
+
+
+async def test_adaptive_interval_applied_after_update(hass: HomeAssistant) -> None:
+    """Coordinator should apply the computed interval after a successful update."""
+    entry = _create_entry(auto_end=False)
+    entry.add_to_hass(hass)
+
     now = datetime(2025, 1, 6, 9, 0, tzinfo=UTC)
+    provider = AsyncMock()
+    # No active reservation, free zone, no next change → idle interval expected.
+    provider.fetch_all.return_value = ({"zone_validity": []}, [], [])
 
-    # Transition in 45 minutes -- beyond TRANSITION_LOOKAHEAD (30 min).
-    # Expected: 45 min - TRANSITION_BUFFER (2 min) = 43 min, which is > IDLE (30 min),
-    # so the result is capped at IDLE_UPDATE_INTERVAL.
-    transition_in_45 = now + timedelta(minutes=45)
-    data_45 = _idle_data(
-        zone_availability=ZoneAvailability(
-            is_chargeable_now=False,
-            next_change_time=transition_in_45,
-            windows_today=(),
-        ),
+    coordinator = CityVisitorParkingCoordinator(
+        hass,
+        provider=provider,
+        config_entry=entry,
     )
-    assert coordinator._compute_next_interval(data_45, now) == IDLE_UPDATE_INTERVAL
 
-    # Transition in 32 minutes -- just beyond TRANSITION_LOOKAHEAD (30 min).
-    # Expected: 32 min - 2 min buffer = 30 min, equal to IDLE_UPDATE_INTERVAL.
-    transition_in_32 = now + timedelta(minutes=32)
-    data_32 = _idle_data(
-        zone_availability=ZoneAvailability(
-            is_chargeable_now=False,
-            next_change_time=transition_in_32,
-            windows_today=(),
-        ),
-    )
-    precise = timedelta(minutes=32) - TRANSITION_BUFFER
-    assert coordinator._compute_next_interval(data_32, now) == min(
-        precise, IDLE_UPDATE_INTERVAL
-    )
+    with freeze_time(now):
+        await coordinator.async_refresh()
 
+    assert coordinator.update_interval == IDLE_UPDATE_INTERVAL
 
-def test_compute_next_interval_clamp_prevents_negative(
-    hass: HomeAssistant, monkeypatch: MonkeyPatch
-) -> None:
-    """precise_interval clamp must prevent a negative interval.
 
-    With default constants TRANSITION_BUFFER (2 min) < TRANSITION_LOOKAHEAD
-    (30 min), so precise_interval can never go negative in production. This
-    test monkeypatches TRANSITION_BUFFER to exceed TRANSITION_LOOKAHEAD,
-    reproducing the edge case that the max(..., timedelta(0)) guard covers.
-    """
+async def test_adaptive_interval_fast_when_reservation_active(
+    hass: HomeAssistant,
+) -> None:
+    """Coordinator should use default interval when a reservation is active."""
     entry = _create_entry(auto_end=False)
     entry.add_to_hass(hass)
+
+    now = datetime(2025, 1, 6, 9, 0, tzinfo=UTC)
+    reservation = {
+        "id": "res1",
+        "start_time": (now - timedelta(hours=1)).isoformat(),
+        "end_time": (now + timedelta(hours=1)).isoformat(),
+    }
+    provider = AsyncMock()
+    provider.fetch_all.return_value = ({"zone_validity": []}, [reservation], [])
+
     coordinator = CityVisitorParkingCoordinator(
         hass,
-        provider=AsyncMock(),
+        provider=provider,
         config_entry=entry,
-        permit_id="permit",
-        auto_end_state=AutoEndState(),
     )
 
-    now = datetime(2025, 1, 6, 9, 0, tzinfo=UTC)
-    # Transition is 35 minutes away — beyond TRANSITION_LOOKAHEAD (30 min),
-    # so we reach case 4.  With a patched TRANSITION_BUFFER of 40 min the
-    # unguarded calculation would yield -5 min; the clamp must return 0.
-    monkeypatch.setattr(coord_module, "TRANSITION_BUFFER", timedelta(minutes=40))
-    data = _idle_data(
-        zone_availability=ZoneAvailability(
-            is_chargeable_now=False,
-            next_change_time=now + timedelta(minutes=35),
-            windows_today=(),
-        ),
+    with freeze_time(now):
+        await coordinator.async_refresh()
+
+    assert coordinator.update_interval == DEFAULT_UPDATE_INTERVAL
+
+
+async def test_refresh_if_stale_reuses_fresh_data(hass: HomeAssistant) -> None:
+    """Fresh data should be served without another provider round-trip."""
+    entry = _create_entry(auto_end=False)
+    entry.add_to_hass(hass)
+
+    provider = AsyncMock()
+    provider.fetch_all.return_value = ({"zone_validity": []}, [], [])
+    coordinator = CityVisitorParkingCoordinator(
+        hass,
+        provider=provider,
+        config_entry=entry,
     )
+    assert coordinator.data_age_seconds is None
 
-    result = coordinator._compute_next_interval(data, now)
-    assert result == timedelta(0), f"Expected timedelta(0), got {result}"
+    await coordinator.async_refresh_if_stale(timedelta(seconds=30))
+    await coordinator.async_refresh_if_stale(timedelta(seconds=30))
 
+    assert provider.fetch_all.await_count == 1
+    assert coordinator.data_age_seconds is not None
 
-def test_compute_next_interval_idle(hass: HomeAssistant) -> None:
-    """No active reservation, free zone, no next transition → idle interval."""
+
+async def test_refresh_if_stale_coalesces_concurrent_callers(
+    hass: HomeAssistant,
+) -> None:
+    """Concurrent callers should share a single in-flight refresh."""
     entry = _create_entry(auto_end=False)
     entry.add_to_hass(hass)
+
+    release = asyncio.Event()
+
+    async def _fetch_all() -> tuple[object, list[object], list[object]]:
+        await release.wait()
+        return ({"zone_validity": []}, [], [])
+
+    provider = AsyncMock()
+    provider.fetch_all.side_effect = _fetch_all
     coordinator = CityVisitorParkingCoordinator(
         hass,
-        provider=AsyncMock(),
+        provider=provider,
         config_entry=entry,
-        permit_id="permit",
-        auto_end_state=AutoEndState(),
     )
 
-    now = datetime(2025, 1, 6, 9, 0, tzinfo=UTC)
-    data = _idle_data()
+    callers = [
+        hass.async_create_task(coordinator.async_refresh_if_stale(timedelta(0)))
+        for _ in range(3)
+    ]
+    await asyncio.sleep(0)
+    release.set()
+    await asyncio.gather(*callers)
 
-    assert coordinator._compute_next_interval(data, now) == IDLE_UPDATE_INTERVAL
+    assert provider.fetch_all.await_count == 1
 
 
-async def test_adaptive_interval_applied_after_update(hass: HomeAssistant) -> None:
-    """Coordinator should apply the computed interval after a successful update."""
+async def test_apply_local_update_reconciles_once(hass: HomeAssistant) -> None:
+    """Local updates should notify listeners and debounce one reconcile."""
     entry = _create_entry(auto_end=False)
     entry.add_to_hass(hass)
 
-    now = datetime(2025, 1, 6, 9, 0, tzinfo=UTC)
     provider = AsyncMock()
-    # No active reservation, free zone, no next change → idle interval expected.
     provider.fetch_all.return_value = ({"zone_validity": []}, [], [])
+    coordinator = CityVisitorParkingCoordinator(
+        hass,
+        provider=provider,
+        config_entry=entry,
+    )
+    listener = MagicMock()
+    unsub = coordinator.async_add_listener(listener)
+
+    data = _idle_data()
+    for _ in range(LOCAL_UPDATES):
+        coordinator.async_apply_local_update(data)
+
+    assert coordinator.data is data
+    assert listener.call_count == LOCAL_UPDATES
+    provider.fetch_all.assert_not_called()
+
+    async_fire_time_changed(hass, dt_util.utcnow() + RECONCILE_DELAY)
+    await hass.async_block_till_done()
+
+    provider.fetch_all.assert_awaited_once()
+    unsub()
+    await coordinator.async_shutdown()
+
+
+async def test_update_listeners_tracks_changed_sections(
+    hass: HomeAssistant,
+) -> None:
+    """Only sections whose fingerprint moved should be reported as changed."""
+    entry = _create_entry(auto_end=False)
+    entry.add_to_hass(hass)
+    coordinator = CityVisitorParkingCoordinator(
+        hass,
+        provider=AsyncMock(),
+        config_entry=entry,
+    )
+    data = _idle_data()
+
+    coordinator.async_apply_local_update(data)
+    assert coordinator.changed_sections == COORDINATOR_SECTIONS
+
+    coordinator.async_apply_local_update(replace(data))
+    assert coordinator.changed_sections == frozenset()
 
+    coordinator.async_apply_local_update(
+        replace(data, favorites=(Favorite(favorite_id="fav1"),))
+    )
+    assert coordinator.changed_sections == {SECTION_FAVORITES}
+    await coordinator.async_shutdown()
+
+
+async def test_transition_timer_flips_availability_locally(
+    hass: HomeAssistant,
+) -> None:
+    """The zone should flip at the window boundary without a provider call."""
+    entry = _create_entry(auto_end=False)
+    entry.add_to_hass(hass)
+    provider = AsyncMock()
     coordinator = CityVisitorParkingCoordinator(
         hass,
         provider=provider,
         config_entry=entry,
-        permit_id="permit",
-        auto_end_state=AutoEndState(),
     )
+    # Keep polling out of the way so only the transition timer can fire.
+    coordinator.update_interval = None
+    listener = MagicMock()
+    unsub = coordinator.async_add_listener(listener)
 
-    with freeze_time(now):
-        await coordinator.async_refresh()
+    now = datetime(2025, 1, 6, 17, 0, tzinfo=UTC)
+    window = TimeRange(
+        start=now + timedelta(minutes=10), end=now + timedelta(minutes=20)
+    )
+    data = replace(
+        _idle_data(
+            zone_availability=ZoneAvailability(
+                is_chargeable_now=False,
+                next_change_time=window.start,
+                windows_today=(window,),
+            ),
+        ),
+        zone_validity=(window,),
+    )
+    with freeze_time(now) as frozen:
+        coordinator.async_set_updated_data(data)
+        listener.reset_mock()
 
-    assert coordinator.update_interval == IDLE_UPDATE_INTERVAL
+        frozen.move_to(window.start)
+        async_fire_time_changed(hass, window.start)
+        await hass.async_block_till_done()
 
+        assert coordinator.data.zone_availability.is_chargeable_now is True
+        assert coordinator.data.zone_availability.next_change_time == window.end
+        # The chargeable zone is polled at the fast interval from now on.
+        assert coordinator.update_interval == DEFAULT_UPDATE_INTERVAL
+    listener.assert_called_once()
+    provider.fetch_all.assert_not_called()
 
-async def test_adaptive_interval_fast_when_reservation_active(
+    unsub()
+    await coordinator.async_shutdown()
+
+
+async def test_transition_timer_auto_ends_at_free_transition(
     hass: HomeAssistant,
 ) -> None:
-    """Coordinator should use default interval when a reservation is active."""
+    """Auto-end should fire at the free transition without waiting for a poll."""
+    entry = _create_entry(auto_end=True)
+    entry.add_to_hass(hass)
+    provider = AsyncMock()
+    coordinator = CityVisitorParkingCoordinator(
+        hass,
+        provider=provider,
+        config_entry=entry,
+    )
+    coordinator.update_interval = None
+
+    now = datetime(2025, 1, 6, 17, 0, tzinfo=UTC)
+    window = TimeRange(start=now - timedelta(hours=1), end=now + timedelta(minutes=5))
+    reservation = Reservation("res1", window.start, now + timedelta(hours=2))
+    data = replace(
+        _idle_data(
+            active_reservations=(reservation,),
+            zone_availability=ZoneAvailability(
+                is_chargeable_now=True,
+                next_change_time=window.end,
+                windows_today=(window,),
+            ),
+        ),
+        zone_validity=(window,),
+        reservations=(reservation,),
+    )
+    with freeze_time(now) as frozen:
+        # No entity listens; the timer is armed for auto-end alone.
+        coordinator.async_set_updated_data(data)
+
+        frozen.move_to(window.end)
+        async_fire_time_changed(hass, window.end)
+        await hass.async_block_till_done()
+
+    provider.end_reservation.assert_awaited_once_with("res1", window.end)
+    provider.fetch_all.assert_not_called()
+    # The ended reservation is applied locally and reconciled later.
+    assert coordinator.data.active_reservations == ()
+    assert coordinator.data.reservations[0].end_time == window.end
+    assert coordinator.write_reconciler.dirty
+
+    await coordinator.async_shutdown()
+
+
+async def test_write_during_shared_fetch_stays_dirty(hass: HomeAssistant) -> None:
+    """A poll joining a fetch that started before a write should not settle it."""
     entry = _create_entry(auto_end=False)
     entry.add_to_hass(hass)
+    release = asyncio.Event()
+
+    async def _fetch_all() -> tuple[object, list[object], list[object]]:
+        await release.wait()
+        return ({"zone_validity": []}, [], [])
+
+    raw_provider = AsyncMock()
+    raw_provider.fetch_all.side_effect = _fetch_all
+    single_flight = SingleFlight()
+    provider = CoalescingProvider(raw_provider, single_flight)
+    coordinator = CityVisitorParkingCoordinator(
+        hass,
+        provider=cast("ProviderProtocol", provider),
+        config_entry=entry,
+        request_coalescing=single_flight,
+    )
+
+    fetch_all = provider.fetch_all
+    assert callable(fetch_all)
+    shared_fetch = asyncio.ensure_future(fetch_all())
+    await asyncio.sleep(0)
+    coordinator.write_reconciler.async_mark_dirty()
+    refresh = asyncio.ensure_future(coordinator.async_refresh())
+    await hass.async_block_till_done()
+    assert single_flight.hits == 1
+    release.set()
+    await asyncio.gather(shared_fetch, refresh)
+
+    raw_provider.fetch_all.assert_awaited_once()
+    assert coordinator.last_update_success
+    assert coordinator.write_reconciler.dirty
+    assert coordinator.write_reconciler.settled_by_fetch == 0
+
+    await coordinator.async_shutdown()
+
+
+async def test_balance_is_projected_between_polls(hass: HomeAssistant) -> None:
+    """Minutes should count down locally only inside chargeable windows."""
+    # Polling is disabled so only the local projection moves the balance.
+    entry = MockConfigEntry(
+        domain=DOMAIN, data={"permit_id": "permit"}, pref_disable_polling=True
+    )
+    entry.add_to_hass(hass)
 
     now = datetime(2025, 1, 6, 9, 0, tzinfo=UTC)
+    window_end = now + timedelta(minutes=30)
+    permit = {
+        "remaining_balance": ANCHOR_BALANCE,
+        "balance_unit": "MINUTE",
+        "zone_validity": [
+            {
+                "start_time": (now - timedelta(hours=1)).isoformat(),
+                "end_time": window_end.isoformat(),
+            }
+        ],
+    }
     reservation = {
         "id": "res1",
         "start_time": (now - timedelta(hours=1)).isoformat(),
         "end_time": (now + timedelta(hours=1)).isoformat(),
     }
     provider = AsyncMock()
-    provider.fetch_all.return_value = ({"zone_validity": []}, [reservation], [])
+    provider.fetch_all.return_value = (permit, [reservation], [])
+    coordinator = CityVisitorParkingCoordinator(
+        hass,
+        provider=provider,
+        config_entry=entry,
+    )
+    unsub = coordinator.async_add_listener(MagicMock())
+
+    with freeze_time(now) as frozen:
+        await coordinator.async_refresh()
+        assert coordinator.data.permit_remaining_balance == ANCHOR_BALANCE
+
+        frozen.tick(timedelta(minutes=1))
+        async_fire_time_changed(hass, dt_util.utcnow())
+        await hass.async_block_till_done()
+        assert coordinator.data.permit_remaining_balance == ANCHOR_BALANCE - 1
+
+        # Only the 30 minutes until the window closed are consumed.
+        frozen.move_to(window_end + timedelta(minutes=10))
+        async_fire_time_changed(hass, dt_util.utcnow())
+        await hass.async_block_till_done()
+        assert coordinator.data.permit_remaining_balance == ANCHOR_BALANCE - 30
+
+        permit["remaining_balance"] = REANCHOR_BALANCE
+        await coordinator.async_refresh()
+        assert coordinator.data.permit_remaining_balance == REANCHOR_BALANCE
+
+    provider.fetch_all.assert_awaited()
+    unsub()
+    await coordinator.async_shutdown()
+
 
+async def test_apply_options_recomputes_availability_locally(
+    hass: HomeAssistant,
+) -> None:
+    """Changed schedule options should apply without a provider call."""
+    entry = _create_entry(auto_end=False)
+    entry.add_to_hass(hass)
+    provider = AsyncMock()
     coordinator = CityVisitorParkingCoordinator(
         hass,
         provider=provider,
         config_entry=entry,
-        permit_id="permit",
-        auto_end_state=AutoEndState(),
     )
+    listener = MagicMock()
+    unsub = coordinator.async_add_listener(listener)
+
+    now = datetime(2025, 1, 6, 18, 0, tzinfo=UTC)
+    window = TimeRange(start=now - timedelta(hours=1), end=now + timedelta(hours=1))
+    data = replace(
+        _idle_data(
+            zone_availability=ZoneAvailability(
+                is_chargeable_now=True,
+                next_change_time=window.end,
+                windows_today=(window,),
+            ),
+        ),
+        zone_validity=(window,),
+    )
+    with freeze_time(now):
+        coordinator.async_set_updated_data(data)
+        listener.reset_mock()
+
+        weekday = WEEKDAY_KEYS[dt_util.as_local(now).weekday()]
+        hass.config_entries.async_update_entry(
+            entry, options={**entry.options, CONF_FREE_WEEKDAYS: [weekday]}
+        )
+        coordinator.async_apply_options()
+
+        assert coordinator.data.zone_availability.is_chargeable_now is False
+        assert coordinator.changed_sections == COORDINATOR_SECTIONS
+        assert coordinator.update_interval == IDLE_UPDATE_INTERVAL
+    listener.assert_called_once()
+    provider.fetch_all.assert_not_called()
+
+    unsub()
+    await coordinator.async_shutdown()
 
+
+async def test_apply_options_arms_transition_for_auto_end(
+    hass: HomeAssistant,
+) -> None:
+    """Turning auto-end on or off should arm or cancel the transition timer."""
+    entry = _create_entry(auto_end=False)
+    entry.add_to_hass(hass)
+    coordinator = CityVisitorParkingCoordinator(
+        hass,
+        provider=AsyncMock(),
+        config_entry=entry,
+    )
+    coordinator.update_interval = None
+
+    now = datetime(2025, 1, 6, 17, 0, tzinfo=UTC)
+    window = TimeRange(start=now - timedelta(hours=1), end=now + timedelta(minutes=5))
+    reservation = Reservation("res1", window.start, now + timedelta(hours=2))
+    data = replace(
+        _idle_data(
+            active_reservations=(reservation,),
+            zone_availability=ZoneAvailability(
+                is_chargeable_now=True,
+                next_change_time=window.end,
+                windows_today=(window,),
+            ),
+        ),
+        zone_validity=(window,),
+        reservations=(reservation,),
+    )
     with freeze_time(now):
-        await coordinator.async_refresh()
+        # Without listeners the timer only runs for auto-end.
+        coordinator.async_set_updated_data(data)
+        assert coordinator._transition_unsub is None
 
-    assert coordinator.update_interval == DEFAULT_UPDATE_INTERVAL
+        hass.config_entries.async_update_entry(entry, options={CONF_AUTO_END: True})
+        coordinator.async_apply_options()
+        assert coordinator._transition_at == window.end
+
+        hass.config_entries.async_update_entry(entry, options={CONF_AUTO_END: False})
+        coordinator.async_apply_options()
+        assert coordinator._transition_unsub is None
+
+    await coordinator.async_shutdown()
 
 
 def _idle_data(
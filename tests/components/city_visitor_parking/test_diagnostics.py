@@ -124,3 +124,4 @@ async def test_diagnostics_redacts_sensitive_data(hass: HomeAssistant) -> None:
     assert runtime["permit_id"] == "permit"
     assert runtime["zone_validity_blocks"] == 1
     assert runtime["favorites"] == 1
+    assert runtime["request_coalescing"] == {"hits": 0, "misses": 0, "in_flight": 0}
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from dataclasses import replace
 from datetime import UTC, datetime, time, timedelta
 from types import SimpleNamespace
 from typing import TYPE_CHECKING, cast
@@ -16,11 +17,10 @@ from pytest_homeassistant_custom_component.common import MockConfigEntry
 from custom_components.city_visitor_parking.const import (
     CONF_OPERATING_TIME_OVERRIDES,
     DOMAIN,
+    SECTION_FAVORITES,
+    SECTION_RESERVATIONS,
     STATE_CHARGEABLE,
 )
-from custom_components.city_visitor_parking.coordinator import (
-    _compute_zone_availability,
-)
 from custom_components.city_visitor_parking.entity import CityVisitorParkingEntity
 from custom_components.city_visitor_parking.models import (
     CoordinatorData,
@@ -29,6 +29,7 @@ from custom_components.city_visitor_parking.models import (
     TimeRange,
     ZoneAvailability,
 )
+from custom_components.city_visitor_parking.schedule import shared_schedule
 from custom_components.city_visitor_parking.sensor import (
     ActiveReservationsSensor,
     FavoritesSensor,
@@ -58,6 +59,7 @@ EXPECTED_COUNT_BALANCE = 3
 EXPECTED_DURATION_BALANCE = 120
 EXPECTED_MONETARY_BALANCE = 12.5
 EXPECTED_EURO_BALANCE = 237.5
+EXPECTED_WRITES_AFTER_OUTAGE = 2
 
 
 async def test_entity_unique_id_and_device_info() -> None:
@@ -110,7 +112,7 @@ async def test_zone_availability_uses_overrides() -> None:
     }
 
     with freeze_time(now):
-        availability = _compute_zone_availability(zone_validity, options, now)
+        availability = shared_schedule(zone_validity, options, now).availability(now)
 
         assert availability.is_chargeable_now is False
         local_now = dt_util.as_local(now)
@@ -176,7 +178,7 @@ async def test_next_chargeable_window_uses_overrides() -> None:
     }
 
     with freeze_time(now):
-        availability = _compute_zone_availability(zone_validity, options, now)
+        availability = shared_schedule(zone_validity, options, now).availability(now)
         data = CoordinatorData(
             permit_id="permit",
             permit_remaining_balance=0,
@@ -309,6 +311,29 @@ async def test_sensors_handle_coordinator_update(
     assert favorites_sensor.native_value == 1
 
 
+async def test_sensor_skips_writes_for_unrelated_sections(
+    monkeypatch: MonkeyPatch,
+) -> None:
+    """Sensors should only write state when their sections or availability change."""
+    coordinator = _make_coordinator(_sample_data())
+    coordinator.last_update_success = True
+    sensor = FavoritesSensor(coordinator, _create_entry("provider:permit1:city"))
+    write_state = MagicMock()
+    monkeypatch.setattr(sensor, "async_write_ha_state", write_state)
+
+    coordinator.changed_sections = frozenset({SECTION_FAVORITES})
+    sensor._handle_coordinator_update()
+    assert write_state.call_count == 1
+
+    coordinator.changed_sections = frozenset({SECTION_RESERVATIONS})
+    sensor._handle_coordinator_update()
+    assert write_state.call_count == 1
+
+    coordinator.last_update_success = False
+    sensor._handle_coordinator_update()
+    assert write_state.call_count == EXPECTED_WRITES_AFTER_OUTAGE
+
+
 async def test_remaining_balance_sensor_uses_count_presentation() -> None:
     """Count balances should not be converted to hours."""
     coordinator = _make_coordinator(
@@ -486,15 +511,9 @@ def test_sensor_helpers() -> None:
         zone_availability=data.zone_availability,
         active_reservations=(),
     )
-    data_with_active = CoordinatorData(
-        permit_id=data.permit_id,
-        permit_remaining_balance=data.permit_remaining_balance,
-        permit_balance_unit=None,
-        zone_validity=data.zone_validity,
-        reservations=data.reservations,
-        favorites=data.favorites,
-        zone_availability=data.zone_availability,
-        active_reservations=(
+    data_with_active = replace(
+        data_no_active,
+        reservations=(
             Reservation(
                 reservation_id="res2",
                 start_time=datetime(2025, 1, 1, 7, 0, tzinfo=UTC),
@@ -507,9 +526,12 @@ def test_sensor_helpers() -> None:
             ),
         ),
     )
+    moment = datetime(2025, 1, 1, 7, 15, tzinfo=UTC)
     assert _remaining_balance(data) == EXPECTED_REMAINING_MINUTES
-    assert _next_end_time(data_no_active) is None
-    assert _next_end_time(data_with_active) == datetime(2025, 1, 1, 7, 30, tzinfo=UTC)
+    assert _next_end_time(data_no_active, moment) is None
+    assert _next_end_time(data_with_active, moment) == datetime(
+        2025, 1, 1, 7, 30, tzinfo=UTC
+    )
     assert _as_utc_iso(None) == ""
 
     window = TimeRange(
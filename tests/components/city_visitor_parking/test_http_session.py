@@ -0,0 +1,51 @@
+"""Tests for dedicated provider host sessions."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import TYPE_CHECKING
+
+from custom_components.city_visitor_parking.http_session import (
+    ConnectionStats,
+    async_get_session_pool,
+)
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+
+async def test_pool_is_shared_and_closed_after_last_release(
+    hass: HomeAssistant,
+) -> None:
+    """Entries on one host should share a session closed by the last release."""
+    pool = async_get_session_pool(hass, "mijn.2park.nl")
+    first = pool.async_acquire("entry_a")
+    second = async_get_session_pool(hass, "mijn.2park.nl").async_acquire("entry_b")
+
+    assert first is second
+
+    await pool.async_release("entry_a")
+    assert not first.closed
+
+    await pool.async_release("entry_b")
+    assert first.closed
+    assert async_get_session_pool(hass, "mijn.2park.nl") is not pool
+
+
+async def test_connection_stats_track_reuse() -> None:
+    """Trace callbacks should count new and reused connections."""
+    stats = ConnectionStats()
+    trace = stats.trace_config()
+    context = SimpleNamespace()
+
+    for callback in trace.on_connection_create_start:
+        await callback(None, context, None)
+    for callback in trace.on_connection_create_end:
+        await callback(None, context, None)
+    for callback in trace.on_connection_reuseconn:
+        await callback(None, context, None)
+
+    diagnostics = stats.as_dict()
+    assert diagnostics["new_connections"] == 1
+    assert diagnostics["reused_connections"] == 1
+    assert diagnostics["avg_connect_ms"] is not None
@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from pathlib import Path
 from types import SimpleNamespace
-from typing import TYPE_CHECKING
-from unittest.mock import AsyncMock
+from typing import TYPE_CHECKING, Any
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from homeassistant import config_entries
@@ -39,6 +40,8 @@ if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
     from pytest import LogCaptureFixture, MonkeyPatch
 
+EXPECTED_SEEDED_BALANCE = 30
+
 
 async def test_async_setup_entry_auth_error(
     hass: HomeAssistant, monkeypatch: MonkeyPatch, pv_library: ModuleType
@@ -100,14 +103,77 @@ async def test_async_setup_entry_provider_error(
         await init_module.async_setup_entry(hass, entry)
 
 
-async def test_update_listener_reloads_on_override_change(
+async def test_async_setup_entry_warm_starts_from_snapshot(
+    hass: HomeAssistant, monkeypatch: MonkeyPatch, hass_storage: dict[str, Any]
+) -> None:
+    """A stored snapshot should seed the coordinator before login completes."""
+    entry = _create_entry()
+    entry.add_to_hass(hass)
+    entry.mock_state(hass, config_entries.ConfigEntryState.SETUP_IN_PROGRESS)
+    key = f"{DOMAIN}.{entry.entry_id}.snapshot"
+    hass_storage[key] = {
+        "version": 1,
+        "minor_version": 1,
+        "key": key,
+        "data": {
+            "permit_id": "permit",
+            "permit_remaining_balance": 30,
+            "permit_balance_unit": None,
+            "zone_validity": [],
+            "reservations": [],
+            "favorites": [{"favorite_id": "fav1", "license_plate": "AB12CD"}],
+        },
+    }
+
+    release_login = asyncio.Event()
+
+    async def _login(**_kwargs: object) -> None:
+        await release_login.wait()
+
+    provider = AsyncMock()
+    provider.resolved_login_params = {}
+    provider.login.side_effect = _login
+    provider.fetch_all.return_value = ({"id": "permit", "zone_validity": []}, [], [])
+    client = AsyncMock()
+    client.get_provider.return_value = provider
+    monkeypatch.setattr(
+        init_module, "async_create_client", AsyncMock(return_value=client)
+    )
+    monkeypatch.setattr(
+        hass.config_entries,
+        "async_forward_entry_setups",
+        AsyncMock(return_value=True),
+    )
+
+    assert await init_module.async_setup_entry(hass, entry)
+
+    coordinator = entry.runtime_data.coordinator
+    assert coordinator.data.permit_remaining_balance == EXPECTED_SEEDED_BALANCE
+    assert [favorite.favorite_id for favorite in coordinator.data.favorites] == ["fav1"]
+    assert coordinator.data_age_seconds is None
+    provider.fetch_all.assert_not_awaited()
+
+    release_login.set()
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+    provider.fetch_all.assert_awaited_once()
+    assert coordinator.data.favorites == ()
+    assert coordinator.data_age_seconds is not None
+    await coordinator.async_shutdown()
+
+
+async def test_update_listener_applies_override_change_in_place(
     hass: HomeAssistant, monkeypatch: MonkeyPatch
 ) -> None:
-    """Override changes should reload the entry."""
+    """Override changes should be applied without reloading the entry."""
     entry = await _setup_entry(hass, monkeypatch)
 
     reload_mock = AsyncMock()
     monkeypatch.setattr(hass.config_entries, "async_reload", reload_mock)
+    apply_options = MagicMock()
+    monkeypatch.setattr(
+        entry.runtime_data.coordinator, "async_apply_options", apply_options
+    )
 
     hass.config_entries.async_update_entry(
         entry,
@@ -117,7 +183,9 @@ async def test_update_listener_reloads_on_override_change(
     )
     await hass.async_block_till_done()
 
-    reload_mock.assert_awaited_once_with(entry.entry_id)
+    reload_mock.assert_not_awaited()
+    apply_options.assert_called_once_with()
+    assert entry.runtime_data.operating_time_overrides["mon"]
 
 
 async def test_update_listener_skips_reload_without_override_change(
@@ -129,6 +197,11 @@ async def test_update_listener_skips_reload_without_override_change(
     reload_mock = AsyncMock()
     monkeypatch.setattr(hass.config_entries, "async_reload", reload_mock)
 
+    apply_options = MagicMock()
+    monkeypatch.setattr(
+        entry.runtime_data.coordinator, "async_apply_options", apply_options
+    )
+
     hass.config_entries.async_update_entry(
         entry,
         options={CONF_AUTO_END: True},
@@ -136,6 +209,9 @@ async def test_update_listener_skips_reload_without_override_change(
     await hass.async_block_till_done()
 
     reload_mock.assert_not_awaited()
+    # Auto-end arms the transition timer, so the change is applied in place.
+    apply_options.assert_called_once_with()
+    assert entry.runtime_data.auto_end is True
 
 
 async def test_register_frontend_assets(
@@ -5,12 +5,21 @@ from __future__ import annotations
 from datetime import UTC, datetime, timedelta
 
 from custom_components.city_visitor_parking.const import STATE_CHARGEABLE, STATE_FREE
+from custom_components.city_visitor_parking.local_updates import (
+    with_favorite_updated,
+)
 from custom_components.city_visitor_parking.models import (
     CoordinatorData,
+    Favorite,
+    Reservation,
     TimeRange,
     ZoneAvailability,
 )
-from custom_components.city_visitor_parking.payloads import build_status_payload
+from custom_components.city_visitor_parking.payloads import (
+    build_reservations_payload,
+    build_status_payload,
+    json_patch,
+)
 
 ZONE_STATUS_RESPONSE_KEYS = {
     "state",
@@ -21,6 +30,7 @@ ZONE_STATUS_RESPONSE_KEYS = {
     "balance_unit",
 }
 EXPECTED_REMAINING_MINUTES = 15
+EXPECTED_VISIBLE_RESERVATIONS = 2
 
 
 def test_build_status_payload_includes_zone_status_response_contract() -> None:
@@ -84,3 +94,102 @@ def test_build_status_payload_uses_null_window_fields_when_no_window_applies() -
     assert payload["window_end"] is None
     assert payload["remaining_balance"] == EXPECTED_REMAINING_MINUTES
     assert payload["balance_unit"] is None
+
+
+def test_build_reservations_payload_splits_active_and_future() -> None:
+    """Reservation payload should drop ended items and count active/future ones."""
+    now = datetime(2025, 1, 6, 10, 0, tzinfo=UTC)
+    ended = Reservation("ended", now - timedelta(hours=2), now - timedelta(hours=1))
+    active = Reservation(
+        "active", now - timedelta(minutes=5), now + timedelta(hours=1), "ab-12-cd"
+    )
+    future = Reservation("future", now + timedelta(hours=2), now + timedelta(hours=3))
+    data = CoordinatorData(
+        permit_id="permit-1",
+        permit_remaining_balance=0,
+        permit_balance_unit=None,
+        zone_validity=(),
+        reservations=(ended, active, future),
+        favorites=(Favorite("fav1", "AB12CD", "Car"),),
+        zone_availability=ZoneAvailability(
+            is_chargeable_now=False,
+            next_change_time=None,
+            windows_today=(),
+        ),
+        active_reservations=(active,),
+    )
+
+    payload = build_reservations_payload(data, now)
+
+    assert payload["count"] == EXPECTED_VISIBLE_RESERVATIONS
+    assert payload["active_count"] == 1
+    assert payload["future_count"] == 1
+    reservations = payload["reservations"]
+    assert isinstance(reservations, list)
+    assert [item["reservation_id"] for item in reservations] == ["active", "future"]
+    assert reservations[0]["favorite_name"] == "Car"
+
+
+def test_build_reservations_payload_uses_favorite_index() -> None:
+    """Favorite lookups should follow the cached plate index and local updates."""
+    now = datetime(2025, 1, 6, 10, 0, tzinfo=UTC)
+    active = Reservation(
+        "active", now - timedelta(minutes=5), now + timedelta(hours=1), "ab-12-cd"
+    )
+    favorite = Favorite("fav1", "AB12CD", "Car")
+    data = CoordinatorData(
+        permit_id="permit-1",
+        permit_remaining_balance=0,
+        permit_balance_unit=None,
+        zone_validity=(),
+        reservations=(active,),
+        favorites=(favorite,),
+        zone_availability=ZoneAvailability(
+            is_chargeable_now=False,
+            next_change_time=None,
+            windows_today=(),
+        ),
+        active_reservations=(active,),
+        favorite_by_plate={"AB12CD": favorite},
+    )
+
+    payload = build_reservations_payload(data, now)
+    reservations = payload["reservations"]
+    assert isinstance(reservations, list)
+    assert reservations[0]["favorite_name"] == "Car"
+
+    renamed = with_favorite_updated(data, "fav1", None, "Van")
+    assert renamed.favorite_by_plate is not None
+    assert renamed.favorite_by_plate["AB12CD"].name == "Van"
+
+    payload = build_reservations_payload(renamed, now)
+    reservations = payload["reservations"]
+    assert isinstance(reservations, list)
+    assert reservations[0]["favorite_name"] == "Van"
+
+
+def test_json_patch_diffs_nested_mappings() -> None:
+    """JSON patch should recurse into mappings and replace other values."""
+    old = {
+        "status": {"state": "free", "stale": False, "a/b": 1},
+        "reservations": {"count": 1, "reservations": [{"id": "1"}]},
+        "gone": True,
+    }
+    new = {
+        "status": {"state": "chargeable", "stale": False, "a/b": 2},
+        "reservations": {"count": 1, "reservations": [{"id": "2"}]},
+        "added": None,
+    }
+
+    assert json_patch(old, new) == [
+        {"op": "replace", "path": "/status/state", "value": "chargeable"},
+        {"op": "replace", "path": "/status/a~1b", "value": 2},
+        {
+            "op": "replace",
+            "path": "/reservations/reservations",
+            "value": [{"id": "2"}],
+        },
+        {"op": "remove", "path": "/gone"},
+        {"op": "add", "path": "/added", "value": None},
+    ]
+    assert json_patch(new, new) == []
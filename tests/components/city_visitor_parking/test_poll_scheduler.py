@@ -0,0 +1,87 @@
+"""Tests for staggered poll scheduling."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from itertools import pairwise
+from typing import TYPE_CHECKING
+
+from custom_components.city_visitor_parking.const import IDLE_UPDATE_INTERVAL
+from custom_components.city_visitor_parking.poll_scheduler import (
+    HostPollScheduler,
+    async_get_poll_scheduler,
+    async_release_poll_scheduler,
+)
+from custom_components.city_visitor_parking.rate_limit import host_key
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+ENTRY_IDS = ("entry_a", "entry_b", "entry_c", "entry_d")
+PHASE_TOLERANCE_SECONDS = 1e-3
+
+
+def test_entries_poll_in_separate_slots() -> None:
+    """Entries set up together should poll spread across the interval."""
+    scheduler = HostPollScheduler()
+    for entry_id in ENTRY_IDS:
+        scheduler.async_register(entry_id)
+    now = datetime(2025, 1, 6, 9, 0, tzinfo=UTC)
+    slot = IDLE_UPDATE_INTERVAL / len(ENTRY_IDS)
+
+    polls = sorted(
+        now + scheduler.next_interval(entry_id, IDLE_UPDATE_INTERVAL, now)
+        for entry_id in ENTRY_IDS
+    )
+
+    gaps = [later - earlier for earlier, later in pairwise(polls)]
+    assert all(gap > slot / 2 for gap in gaps)
+
+
+def test_next_interval_keeps_the_polling_rate() -> None:
+    """Aligned delays should keep the interval and always land on the phase."""
+    scheduler = HostPollScheduler()
+    scheduler.async_register("entry_a")
+    now = datetime(2025, 1, 6, 9, 0, tzinfo=UTC)
+    seconds = IDLE_UPDATE_INTERVAL.total_seconds()
+    phase = scheduler.phase("entry_a", IDLE_UPDATE_INTERVAL)
+
+    for minute in range(0, 60, 7):
+        moment = now + timedelta(minutes=minute)
+        delay = scheduler.next_interval("entry_a", IDLE_UPDATE_INTERVAL, moment)
+        assert IDLE_UPDATE_INTERVAL / 2 <= delay < IDLE_UPDATE_INTERVAL * 1.5
+        offset = ((moment + delay).timestamp() - phase) % seconds
+        assert min(offset, seconds - offset) < PHASE_TOLERANCE_SECONDS
+
+
+def test_unregister_releases_the_slot() -> None:
+    """Unloaded entries should give their slot back."""
+    scheduler = HostPollScheduler()
+    unregister = scheduler.async_register("entry_a")
+    scheduler.async_register("entry_b")
+
+    unregister()
+    unregister()
+
+    assert scheduler.phase("entry_b", IDLE_UPDATE_INTERVAL) < (
+        IDLE_UPDATE_INTERVAL.total_seconds() / 2
+    )
+
+
+async def test_scheduler_is_dropped_after_the_last_entry(
+    hass: HomeAssistant,
+) -> None:
+    """Releasing the last entry of a host should drop its scheduler."""
+    key = host_key("https://mijn.2park.nl", "2park")
+    first = async_get_poll_scheduler(hass, key, "entry1")
+    async_get_poll_scheduler(hass, key, "entry1")
+    async_get_poll_scheduler(hass, key, "entry2")
+
+    async_release_poll_scheduler(hass, key, "entry1")
+    assert async_get_poll_scheduler(hass, key, "entry2") is first
+    assert first.phase("entry2", IDLE_UPDATE_INTERVAL) < (
+        IDLE_UPDATE_INTERVAL.total_seconds() / 2
+    )
+
+    async_release_poll_scheduler(hass, key, "entry2")
+    assert async_get_poll_scheduler(hass, key, "entry1") is not first
@@ -0,0 +1,79 @@
+"""Tests for transparent provider re-login."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, cast
+from unittest.mock import AsyncMock
+
+import pytest
+
+from custom_components.city_visitor_parking.provider_session import (
+    ProviderSession,
+    ReloginProvider,
+)
+
+if TYPE_CHECKING:
+    from types import ModuleType
+
+EXPECTED_CALLS_AFTER_RELOGIN = 2
+EXPECTED_CONCURRENT_CALLERS = 3
+
+
+async def test_relogin_retries_call_once(pv_library: ModuleType) -> None:
+    """An AuthError should trigger one login and one retry of the call."""
+    provider = AsyncMock()
+    provider.fetch_all.side_effect = [pv_library.AuthError("expired"), "data"]
+    login = AsyncMock()
+    session = ProviderSession(login)
+    proxy = cast("AsyncMock", ReloginProvider(provider, session))
+
+    assert await proxy.fetch_all() == "data"
+
+    login.assert_awaited_once()
+    assert provider.fetch_all.await_count == EXPECTED_CALLS_AFTER_RELOGIN
+    assert session.as_dict() == {"logins": 1}
+
+
+async def test_failed_relogin_raises_auth_error(pv_library: ModuleType) -> None:
+    """A failing re-login should surface the AuthError without another retry."""
+    provider = AsyncMock()
+    provider.fetch_all.side_effect = pv_library.AuthError("expired")
+    session = ProviderSession(AsyncMock(side_effect=pv_library.AuthError("bad")))
+    proxy = cast("AsyncMock", ReloginProvider(provider, session))
+
+    with pytest.raises(pv_library.AuthError):
+        await proxy.fetch_all()
+
+    provider.fetch_all.assert_awaited_once()
+
+
+async def test_concurrent_callers_share_one_relogin(pv_library: ModuleType) -> None:
+    """Concurrent calls rejected by the provider should log in only once."""
+    logged_in = False
+    release_login = asyncio.Event()
+
+    async def _login() -> None:
+        nonlocal logged_in
+        await release_login.wait()
+        logged_in = True
+
+    async def _list_reservations() -> list[object]:
+        if not logged_in:
+            raise pv_library.AuthError("expired")
+        return []
+
+    provider = AsyncMock()
+    provider.list_reservations.side_effect = _list_reservations
+    login = AsyncMock(side_effect=_login)
+    proxy = cast("AsyncMock", ReloginProvider(provider, ProviderSession(login)))
+
+    callers = [
+        asyncio.ensure_future(proxy.list_reservations())
+        for _ in range(EXPECTED_CONCURRENT_CALLERS)
+    ]
+    await asyncio.sleep(0)
+    release_login.set()
+
+    assert await asyncio.gather(*callers) == [[], [], []]
+    login.assert_awaited_once()
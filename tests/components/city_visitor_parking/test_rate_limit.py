@@ -0,0 +1,115 @@
+"""Tests for per-host rate limiting of provider calls."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, cast
+from unittest.mock import AsyncMock
+
+from custom_components.city_visitor_parking.rate_limit import (
+    PRIORITY_BACKGROUND,
+    PRIORITY_INTERACTIVE,
+    HostGovernor,
+    RateLimitedProvider,
+    async_get_host_governor,
+    async_release_host_governor,
+    host_key,
+)
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+EXPECTED_BURST = 2
+FAST_RATE = 1000.0
+LARGE_BURST = 10
+
+
+async def test_interactive_calls_overtake_background_calls() -> None:
+    """Queued interactive calls should run before earlier background calls."""
+    governor = HostGovernor(rate=FAST_RATE, burst=EXPECTED_BURST, max_concurrent=1)
+    order: list[str] = []
+    release = asyncio.Event()
+
+    async def _call(name: str, priority: int) -> None:
+        async with governor.async_slot(priority):
+            order.append(name)
+            if name == "first":
+                await release.wait()
+
+    first = asyncio.ensure_future(_call("first", PRIORITY_BACKGROUND))
+    await asyncio.sleep(0)
+    poll = asyncio.ensure_future(_call("poll", PRIORITY_BACKGROUND))
+    write = asyncio.ensure_future(_call("write", PRIORITY_INTERACTIVE))
+    await asyncio.sleep(0)
+    release.set()
+    await asyncio.gather(first, poll, write)
+
+    assert order == ["first", "write", "poll"]
+
+
+async def test_calls_beyond_the_burst_wait_for_tokens() -> None:
+    """Calls beyond the burst should wait until the bucket refills."""
+    governor = HostGovernor(rate=FAST_RATE, burst=EXPECTED_BURST, max_concurrent=10)
+    provider = AsyncMock()
+    limited = cast("AsyncMock", RateLimitedProvider(provider, governor))
+
+    await asyncio.gather(*(limited.fetch_all() for _ in range(EXPECTED_BURST + 1)))
+
+    assert provider.fetch_all.await_count == EXPECTED_BURST + 1
+    assert governor.as_dict() == {
+        "calls": EXPECTED_BURST + 1,
+        "throttled": 1,
+        "active": 0,
+        "waiting": 0,
+    }
+
+
+async def test_entries_on_the_same_host_share_a_governor(
+    hass: HomeAssistant,
+) -> None:
+    """Entries with the same base URL should share one governor."""
+    first = async_get_host_governor(
+        hass, host_key("https://mijn.2park.nl", "2park"), "entry1"
+    )
+    second = async_get_host_governor(
+        hass, host_key("https://MIJN.2park.nl/", "2park"), "entry2"
+    )
+    other = async_get_host_governor(
+        hass, host_key("https://parkeren.apeldoorn.nl/", "dvsportal"), "entry3"
+    )
+
+    assert first is second
+    assert other is not first
+
+
+async def test_strictest_entry_limits_apply_to_the_host(
+    hass: HomeAssistant,
+) -> None:
+    """The smallest burst of the entries on a host should bound its calls."""
+    key = host_key("https://mijn.2park.nl", "2park")
+    async_get_host_governor(hass, key, "entry1", rate=FAST_RATE, burst=LARGE_BURST)
+    governor = async_get_host_governor(
+        hass, key, "entry2", rate=FAST_RATE, burst=EXPECTED_BURST
+    )
+    provider = AsyncMock()
+    limited = cast("AsyncMock", RateLimitedProvider(provider, governor))
+
+    await asyncio.gather(*(limited.fetch_all() for _ in range(EXPECTED_BURST + 1)))
+
+    assert governor.as_dict()["throttled"] == 1
+
+
+async def test_governor_is_dropped_after_the_last_entry(
+    hass: HomeAssistant,
+) -> None:
+    """Releasing the last entry of a host should drop its governor."""
+    key = host_key("https://mijn.2park.nl", "2park")
+    first = async_get_host_governor(hass, key, "entry1")
+    async_get_host_governor(hass, key, "entry2")
+
+    async_release_host_governor(hass, key, "entry1")
+    assert async_get_host_governor(hass, key, "entry1") is first
+
+    async_release_host_governor(hass, key, "entry1")
+    async_release_host_governor(hass, key, "entry2")
+    assert async_get_host_governor(hass, key, "entry1") is not first
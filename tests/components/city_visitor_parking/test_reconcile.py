@@ -0,0 +1,84 @@
+"""Tests for the debounced refresh after provider writes."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import TYPE_CHECKING
+from unittest.mock import AsyncMock
+
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+)
+
+from custom_components.city_visitor_parking import reconcile
+from custom_components.city_visitor_parking.const import DOMAIN, RECONCILE_DELAY
+from custom_components.city_visitor_parking.reconcile import WriteReconciler
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+    from pytest import MonkeyPatch
+
+QUIET = RECONCILE_DELAY.total_seconds()
+MAX_DELAY = timedelta(seconds=5)
+WRITES = 3
+
+
+def _reconciler(hass: HomeAssistant, function: AsyncMock) -> WriteReconciler:
+    """Return a reconciler around function for a new entry."""
+    entry = MockConfigEntry(domain=DOMAIN)
+    entry.add_to_hass(hass)
+    return WriteReconciler(hass, entry, function=function, name="reconcile")
+
+
+async def test_burst_of_writes_refreshes_once(hass: HomeAssistant) -> None:
+    """Writes within the quiet period should share one refresh."""
+    refresh = AsyncMock()
+    reconciler = _reconciler(hass, refresh)
+
+    for _ in range(WRITES):
+        reconciler.async_mark_dirty()
+    assert reconciler.dirty
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=QUIET))
+    await hass.async_block_till_done()
+
+    refresh.assert_awaited_once()
+    assert not reconciler.dirty
+    assert reconciler.as_dict()["last_coalesced"] == WRITES
+    assert reconciler.as_dict()["refreshes"] == 1
+
+
+async def test_refresh_is_not_delayed_past_max_delay(
+    hass: HomeAssistant, monkeypatch: MonkeyPatch
+) -> None:
+    """The first write of a burst should bound how long the refresh waits."""
+    monkeypatch.setattr(reconcile, "RECONCILE_MAX_DELAY", MAX_DELAY)
+    refresh = AsyncMock()
+    reconciler = _reconciler(hass, refresh)
+
+    reconciler.async_mark_dirty()
+    async_fire_time_changed(hass, dt_util.utcnow() + MAX_DELAY)
+    await hass.async_block_till_done()
+
+    refresh.assert_awaited_once()
+
+
+async def test_fetch_after_writes_settles_them(hass: HomeAssistant) -> None:
+    """A fetch that started after the latest write should replace the refresh."""
+    refresh = AsyncMock()
+    reconciler = _reconciler(hass, refresh)
+
+    reconciler.async_mark_dirty()
+    reconciler.async_fetched(hass.loop.time() - QUIET)
+    assert reconciler.dirty
+
+    reconciler.async_fetched(hass.loop.time())
+    assert not reconciler.dirty
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=QUIET))
+    await hass.async_block_till_done()
+
+    refresh.assert_not_awaited()
+    assert reconciler.as_dict()["settled_by_fetch"] == 1
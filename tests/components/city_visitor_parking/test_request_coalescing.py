@@ -0,0 +1,125 @@
+"""Tests for City visitor parking provider request coalescing."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, Any
+from unittest.mock import AsyncMock
+
+import pytest
+
+from custom_components.city_visitor_parking.request_coalescing import (
+    CoalescingProvider,
+    SingleFlight,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Coroutine
+
+EXPECTED_HITS = 2
+
+
+async def test_concurrent_reads_share_one_call() -> None:
+    """Identical concurrent reads should share a single provider call."""
+    release = asyncio.Event()
+    calls = 0
+
+    async def _list_favorites() -> list[dict[str, str]]:
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return [{"id": "fav1"}]
+
+    raw_provider = AsyncMock()
+    raw_provider.list_favorites.side_effect = _list_favorites
+    single_flight = SingleFlight()
+    provider = CoalescingProvider(raw_provider, single_flight)
+    list_favorites = provider.list_favorites
+    assert callable(list_favorites)
+
+    callers = [asyncio.ensure_future(list_favorites()) for _ in range(3)]
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*callers)
+
+    assert calls == 1
+    assert results == [[{"id": "fav1"}]] * 3
+    assert single_flight.as_dict() == {
+        "hits": EXPECTED_HITS,
+        "misses": 1,
+        "in_flight": 0,
+    }
+
+    await list_favorites()
+    assert calls == EXPECTED_HITS
+
+
+async def test_errors_propagate_to_all_callers() -> None:
+    """A failing shared call should raise for every waiting caller."""
+    release = asyncio.Event()
+
+    async def _fetch_all() -> None:
+        await release.wait()
+        raise RuntimeError("boom")
+
+    raw_provider = AsyncMock()
+    raw_provider.fetch_all.side_effect = _fetch_all
+    provider = CoalescingProvider(raw_provider, SingleFlight())
+    fetch_all = provider.fetch_all
+    assert callable(fetch_all)
+
+    callers = [asyncio.ensure_future(fetch_all()) for _ in range(2)]
+    await asyncio.sleep(0)
+    release.set()
+
+    for caller in callers:
+        with pytest.raises(RuntimeError):
+            await caller
+    raw_provider.fetch_all.assert_awaited_once()
+
+
+async def test_writes_are_not_coalesced() -> None:
+    """Write methods and attributes should pass through unchanged."""
+    raw_provider = AsyncMock()
+    raw_provider.provider_id = "dvsportal"
+    provider = CoalescingProvider(raw_provider, SingleFlight())
+
+    assert provider.provider_id == "dvsportal"
+    assert provider.end_reservation is raw_provider.end_reservation
+
+
+async def test_shared_calls_use_task_factory_and_cancel_on_shutdown() -> None:
+    """Shared calls should run as tracked tasks that shutdown cancels."""
+    started = asyncio.Event()
+    names: list[str] = []
+    tasks: list[asyncio.Task[object]] = []
+
+    def _create_task(
+        coro: Coroutine[Any, Any, object], name: str
+    ) -> asyncio.Task[object]:
+        names.append(name)
+        task = asyncio.get_running_loop().create_task(coro, name=name)
+        tasks.append(task)
+        return task
+
+    async def _fetch_all() -> None:
+        started.set()
+        await asyncio.Event().wait()
+
+    raw_provider = AsyncMock()
+    raw_provider.fetch_all.side_effect = _fetch_all
+    single_flight = SingleFlight(_create_task, name="entry provider call")
+    provider = CoalescingProvider(raw_provider, single_flight)
+    fetch_all = provider.fetch_all
+    assert callable(fetch_all)
+
+    caller = asyncio.ensure_future(fetch_all())
+    await started.wait()
+    assert names == ["entry provider call ('fetch_all', (), ())"]
+
+    single_flight.async_shutdown()
+    with pytest.raises(asyncio.CancelledError):
+        await caller
+    assert tasks[0].cancelled()
+    await asyncio.sleep(0)
+    assert single_flight.as_dict()["in_flight"] == 0
@@ -0,0 +1,63 @@
+"""Tests for the time-ordered reservation index."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+
+from custom_components.city_visitor_parking.models import Reservation
+from custom_components.city_visitor_parking.reservation_index import (
+    ReservationIndex,
+)
+
+START = datetime(2025, 1, 6, 0, 0, tzinfo=UTC)
+RESERVATIONS = tuple(
+    Reservation(
+        f"res-{number}",
+        START + timedelta(minutes=37 * number % 600),
+        START + timedelta(minutes=37 * number % 600 + 15 + 45 * (number % 5)),
+    )
+    for number in range(40)
+)
+
+
+def test_index_matches_linear_scans() -> None:
+    """Indexed lookups should agree with scanning every reservation."""
+    index = ReservationIndex(RESERVATIONS)
+
+    for step in range(-1, 12 * 12):
+        moment = START + timedelta(minutes=5 * step)
+        active = tuple(
+            reservation
+            for reservation in RESERVATIONS
+            if reservation.start_time <= moment < reservation.end_time
+        )
+        future = tuple(
+            reservation
+            for reservation in RESERVATIONS
+            if reservation.start_time > moment
+        )
+
+        assert index.active_at(moment) == active
+        assert index.count_active_at(moment) == len(active)
+        assert index.count_starting_after(moment) == len(future)
+        assert set(index.starting_after(moment)) == set(future)
+        assert index.ending_after(moment) == tuple(
+            reservation for reservation in RESERVATIONS if reservation.end_time > moment
+        )
+        assert index.next_start(moment) == min(
+            (reservation.start_time for reservation in future), default=None
+        )
+        assert index.next_end(moment) == min(
+            (reservation.end_time for reservation in active), default=None
+        )
+
+
+def test_empty_index() -> None:
+    """An empty index should answer every query with nothing."""
+    index = ReservationIndex(())
+
+    assert len(index) == 0
+    assert index.active_at(START) == ()
+    assert index.count_active_at(START) == 0
+    assert index.next_start(START) is None
+    assert index.next_end(START) is None
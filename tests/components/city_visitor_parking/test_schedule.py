@@ -0,0 +1,138 @@
+"""Tests for the compiled chargeable-window schedule."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from custom_components.city_visitor_parking.const import (
+    CONF_FREE_DATES,
+    CONF_FREE_WEEKDAYS,
+    CONF_OPERATING_TIME_OVERRIDES,
+    SCHEDULE_HORIZON,
+)
+from custom_components.city_visitor_parking.models import (
+    CoordinatorData,
+    TimeRange,
+    ZoneAvailability,
+)
+from custom_components.city_visitor_parking.schedule import (
+    ChargeSchedule,
+    effective_schedule,
+    shared_schedule,
+)
+from custom_components.city_visitor_parking.time_windows import (
+    current_or_next_window,
+    current_or_next_window_with_overrides,
+    windows_for_today,
+)
+
+START = datetime(2025, 1, 6, 0, 0, tzinfo=UTC)
+ZONE_VALIDITY = tuple(
+    TimeRange(
+        start=START + timedelta(days=day, hours=8),
+        end=START + timedelta(days=day, hours=18),
+    )
+    for day in range(21)
+)
+
+
+@pytest.mark.parametrize(
+    "options",
+    [
+        {},
+        {CONF_OPERATING_TIME_OVERRIDES: {"mon": [{"start": "10:00", "end": "12:00"}]}},
+        {CONF_FREE_WEEKDAYS: ["sat", "sun"]},
+        {CONF_FREE_DATES: "07-01, 09-01-2025"},
+    ],
+)
+def test_schedule_matches_uncompiled_helpers(options: dict[str, object]) -> None:
+    """Compiled lookups should agree with the per-call helpers."""
+    schedule = ChargeSchedule(ZONE_VALIDITY, options, START)
+
+    for step in range(0, 10 * 24 * 4):
+        moment = START + timedelta(minutes=15 * step)
+        windows = windows_for_today(ZONE_VALIDITY, options, moment)
+        chargeable = any(window.start <= moment < window.end for window in windows)
+        if chargeable:
+            next_change = min(
+                window.end for window in windows if window.start <= moment < window.end
+            )
+        else:
+            next_change = min(
+                (window.start for window in windows if window.start > moment),
+                default=None,
+            )
+
+        assert schedule.windows_for_day(moment) == tuple(windows)
+        assert schedule.is_chargeable(moment) is chargeable
+        assert schedule.next_change(moment) == next_change
+        assert schedule.current_or_next(moment) == (
+            current_or_next_window_with_overrides(ZONE_VALIDITY, options, moment)
+        )
+
+
+def test_schedule_falls_back_outside_horizon() -> None:
+    """Lookups beyond the compiled horizon should use the uncompiled helpers."""
+    options = {CONF_FREE_WEEKDAYS: ["sun"]}
+    schedule = ChargeSchedule(ZONE_VALIDITY, options, START)
+    moment = START + SCHEDULE_HORIZON + timedelta(days=2, hours=9)
+
+    assert not schedule.covers(moment)
+    assert schedule.is_chargeable(moment) is bool(
+        windows_for_today(ZONE_VALIDITY, options, moment)
+    )
+    assert schedule.current_or_next(moment) == current_or_next_window(
+        ZONE_VALIDITY, moment
+    )
+
+
+def test_schedule_availability_next_change() -> None:
+    """Zone availability should return the end of the current window."""
+    now = datetime(2025, 1, 6, 9, 30, tzinfo=UTC)
+    window = TimeRange(
+        start=datetime(2025, 1, 6, 9, 0, tzinfo=UTC),
+        end=datetime(2025, 1, 6, 11, 0, tzinfo=UTC),
+    )
+    availability = ChargeSchedule([window], {}, now).availability(now)
+
+    assert availability.is_chargeable_now is True
+    assert availability.next_change_time == window.end
+
+
+def test_effective_schedule_reuses_matching_schedule() -> None:
+    """The coordinator schedule should be reused only for matching options."""
+    options = {CONF_FREE_WEEKDAYS: ["sun"]}
+    schedule = ChargeSchedule(ZONE_VALIDITY, options, START)
+    data = CoordinatorData(
+        permit_id="permit",
+        permit_remaining_balance=0,
+        permit_balance_unit=None,
+        zone_validity=schedule.zone_validity,
+        reservations=(),
+        favorites=(),
+        zone_availability=ZoneAvailability(
+            is_chargeable_now=False,
+            next_change_time=None,
+            windows_today=(),
+        ),
+        active_reservations=(),
+        charge_schedule=schedule,
+    )
+
+    assert effective_schedule(data, dict(options), START) is schedule
+    assert effective_schedule(data, {}, START) is not schedule
+
+
+def test_shared_schedule_reuses_compilation_for_equal_inputs() -> None:
+    """Entries with equal validity blocks and options should share a schedule."""
+    now = START + timedelta(hours=9)
+    first = shared_schedule(ZONE_VALIDITY, {CONF_FREE_DATES: ""}, now)
+
+    second = shared_schedule(list(ZONE_VALIDITY), {CONF_FREE_DATES: ""}, now)
+    other = shared_schedule(ZONE_VALIDITY, {CONF_FREE_WEEKDAYS: ["mon"]}, now)
+
+    assert second is first
+    assert second.zone_validity is first.zone_validity
+    assert other is not first
@@ -3,10 +3,11 @@
 from __future__ import annotations
 
 import logging
+from dataclasses import replace
 from datetime import UTC, datetime, time, timedelta
 from types import SimpleNamespace
 from typing import TYPE_CHECKING
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from freezegun import freeze_time
@@ -25,10 +26,14 @@ from custom_components.city_visitor_parking.const import (
     ATTR_END_TIME,
     ATTR_FAVORITE_ID,
     ATTR_LICENSE_PLATE,
+    ATTR_MAX_AGE,
     ATTR_NAME,
+    ATTR_REFRESH,
     ATTR_RESERVATION_ID,
     ATTR_START_TIME,
     CONF_AUTO_END,
+    CONF_MAX_DATA_AGE,
+    DEFAULT_MAX_DATA_AGE,
     DOMAIN,
 )
 from custom_components.city_visitor_parking.models import (
@@ -45,6 +50,7 @@ from custom_components.city_visitor_parking.runtime_data import (
 )
 from custom_components.city_visitor_parking.services import (
     SERVICE_ADD_FAVORITE,
+    SERVICE_END_ALL_RESERVATIONS,
     SERVICE_END_RESERVATION,
     SERVICE_GET_ENTRY_INFO,
     SERVICE_GET_STATUS,
@@ -75,6 +81,7 @@ if TYPE_CHECKING:
 
 EXPECTED_COUNT = 2
 EXPECTED_REMAINING_MINUTES = 90
+EXPECTED_DATA_AGE = 12.3
 
 
 def _override_range_for_day(now: datetime, start: time, end: time) -> TimeRange:
@@ -313,6 +320,149 @@ async def test_service_end_reservation_calls_provider(hass: HomeAssistant) -> No
     provider.end_reservation.assert_awaited_once_with("res1", now)
 
 
+async def test_service_end_all_reservations_filters_by_plate(
+    hass: HomeAssistant, pv_library: ModuleType
+) -> None:
+    """End all should end matching active reservations and report each result."""
+    await async_setup_services(hass)
+
+    entry, device, provider = _create_entry_with_device(hass, "permit1")
+    now = datetime(2025, 1, 1, 12, 0, tzinfo=UTC)
+
+    def _reservation(reservation_id: str, plate: str, start: datetime) -> Reservation:
+        return Reservation(
+            reservation_id=reservation_id,
+            start_time=start,
+            end_time=now + timedelta(hours=2),
+            license_plate=plate,
+        )
+
+    reservations = (
+        _reservation("res1", "AB-12-34", now - timedelta(hours=1)),
+        _reservation("res2", "ab1234", now - timedelta(minutes=5)),
+        _reservation("res3", "XY9876", now - timedelta(hours=1)),
+        _reservation("res4", "AB1234", now + timedelta(hours=1)),
+    )
+    entry.runtime_data.coordinator.data = CoordinatorData(
+        permit_id="permit1",
+        permit_remaining_balance=0,
+        permit_balance_unit=None,
+        zone_validity=(),
+        reservations=reservations,
+        favorites=(),
+        zone_availability=ZoneAvailability(
+            is_chargeable_now=True,
+            next_change_time=None,
+            windows_today=(),
+        ),
+        active_reservations=reservations[:3],
+    )
+
+    async def _end(reservation_id: str, _end_time: datetime) -> None:
+        if reservation_id == "res2":
+            raise pv_library.ValidationError("already ended")
+
+    provider.end_reservation.side_effect = _end
+
+    with freeze_time(now):
+        response = await hass.services.async_call(
+            DOMAIN,
+            SERVICE_END_ALL_RESERVATIONS,
+            {ATTR_DEVICE_ID: device.id, ATTR_LICENSE_PLATE: "ab 12 34"},
+            blocking=True,
+            return_response=True,
+        )
+
+    assert response is not None
+    assert response["count"] == EXPECTED_COUNT
+    assert response["ended_count"] == 1
+    assert response["results"] == [
+        {"reservation_id": "res1", "ended": True},
+        {
+            "reservation_id": "res2",
+            "ended": False,
+            "error": "reservation_validation_failed",
+            "detail": None,
+        },
+    ]
+    assert {call.args[0] for call in provider.end_reservation.await_args_list} == {
+        "res1",
+        "res2",
+    }
+    ended = entry.runtime_data.coordinator.async_apply_local_update.call_args.args[0]
+    assert ended.reservations[0].end_time == now
+    assert ended.reservations[1:] == reservations[1:]
+    assert ended.active_reservations == reservations[1:3]
+
+
+async def test_service_end_all_reservations_raises_when_none_ended(
+    hass: HomeAssistant, pv_library: ModuleType
+) -> None:
+    """End all should refresh first and raise when every end failed."""
+    await async_setup_services(hass)
+
+    entry, device, provider = _create_entry_with_device(hass, "permit1")
+    now = datetime(2025, 1, 1, 12, 0, tzinfo=UTC)
+    reservation = Reservation(
+        reservation_id="res1",
+        start_time=now - timedelta(hours=1),
+        end_time=now + timedelta(hours=1),
+        license_plate="AB1234",
+    )
+    coordinator = entry.runtime_data.coordinator
+    coordinator.data = CoordinatorData(
+        permit_id="permit1",
+        permit_remaining_balance=0,
+        permit_balance_unit=None,
+        zone_validity=(),
+        reservations=(reservation,),
+        favorites=(),
+        zone_availability=ZoneAvailability(
+            is_chargeable_now=True,
+            next_change_time=None,
+            windows_today=(),
+        ),
+        active_reservations=(reservation,),
+    )
+    provider.end_reservation.side_effect = pv_library.ValidationError("rejected")
+
+    with freeze_time(now), pytest.raises(HomeAssistantError) as err:
+        await hass.services.async_call(
+            DOMAIN,
+            SERVICE_END_ALL_RESERVATIONS,
+            {ATTR_DEVICE_ID: device.id},
+            blocking=True,
+            return_response=True,
+        )
+
+    assert err.value.translation_key == "reservation_operation_failed"
+    coordinator.async_refresh_if_stale.assert_awaited_once_with(timedelta(0))
+    coordinator.async_apply_local_update.assert_not_called()
+    coordinator.async_schedule_reconcile.assert_called_once_with()
+
+
+async def test_service_end_all_reservations_rejects_empty_plate(
+    hass: HomeAssistant,
+) -> None:
+    """A plate filter without letters or digits should fail validation."""
+    await async_setup_services(hass)
+
+    entry, device, provider = _create_entry_with_device(hass, "permit1")
+
+    with pytest.raises(ServiceValidationError) as err:
+        await hass.services.async_call(
+            DOMAIN,
+            SERVICE_END_ALL_RESERVATIONS,
+            {ATTR_DEVICE_ID: device.id, ATTR_LICENSE_PLATE: " - "},
+            blocking=True,
+            return_response=True,
+        )
+
+    assert err.value.translation_key == "invalid_license_plate"
+    entry.runtime_data.coordinator.async_refresh_if_stale.assert_not_awaited()
+    provider.end_reservation.assert_not_awaited()
+
+
 async def test_service_add_and_remove_favorite(hass: HomeAssistant) -> None:
     """Add and remove favorite services should call the provider."""
     await async_setup_services(hass)
@@ -519,7 +669,7 @@ async def test_service_list_reservations_failure(
     await async_setup_services(hass)
 
     entry, device, _provider = _create_entry_with_device(hass, "permit1")
-    entry.runtime_data.coordinator.async_refresh = AsyncMock(
+    entry.runtime_data.coordinator.async_refresh_if_stale = AsyncMock(
         side_effect=RuntimeError("boom")
     )
     entry.runtime_data.coordinator.data = None
@@ -963,6 +1113,10 @@ async def test_service_list_reservations_response(
     assert response["active_count"] == 1
     assert response["future_count"] == 1
     assert response["stale"] is False
+    assert response["data_age_seconds"] == EXPECTED_DATA_AGE
+    entry.runtime_data.coordinator.async_refresh_if_stale.assert_awaited_once_with(
+        DEFAULT_MAX_DATA_AGE
+    )
     assert set(response["reservation_update_fields"]) == {
         ATTR_START_TIME,
         ATTR_END_TIME,
@@ -1195,6 +1349,50 @@ async def test_service_get_status_stale_recomputes_consistent_windows(
     ]
 
 
+async def test_service_get_status_max_age(hass: HomeAssistant) -> None:
+    """Get status should honor per-call and option freshness limits."""
+    await async_setup_services(hass)
+
+    entry, device, _provider = _create_entry_with_device(
+        hass, "permit1", options={CONF_MAX_DATA_AGE: 120}
+    )
+    coordinator = entry.runtime_data.coordinator
+    coordinator.data = CoordinatorData(
+        permit_id="permit1",
+        permit_remaining_balance=0,
+        permit_balance_unit=None,
+        zone_validity=(),
+        reservations=(),
+        favorites=(),
+        zone_availability=ZoneAvailability(
+            is_chargeable_now=False,
+            next_change_time=None,
+            windows_today=(),
+        ),
+        active_reservations=(),
+    )
+
+    response = await hass.services.async_call(
+        DOMAIN,
+        SERVICE_GET_STATUS,
+        {ATTR_DEVICE_ID: device.id},
+        blocking=True,
+        return_response=True,
+    )
+    coordinator.async_refresh_if_stale.assert_awaited_once_with(timedelta(seconds=120))
+    assert response["data_age_seconds"] == EXPECTED_DATA_AGE
+
+    coordinator.async_refresh_if_stale.reset_mock()
+    await hass.services.async_call(
+        DOMAIN,
+        SERVICE_GET_STATUS,
+        {ATTR_DEVICE_ID: device.id, ATTR_MAX_AGE: 0},
+        blocking=True,
+        return_response=True,
+    )
+    coordinator.async_refresh_if_stale.assert_awaited_once_with(timedelta(0))
+
+
 async def test_service_get_entry_info_response(hass: HomeAssistant) -> None:
     """Get entry info should return non-sensitive metadata."""
     await async_setup_services(hass)
@@ -1251,6 +1449,201 @@ async def test_service_list_favorites_response(hass: HomeAssistant) -> None:
     assert favorites[1][ATTR_LICENSE_PLATE] == "BB9999"
 
 
+async def test_service_list_favorites_from_snapshot(hass: HomeAssistant) -> None:
+    """List favorites should answer from coordinator data unless refreshed."""
+    await async_setup_services(hass)
+
+    entry, device, provider = _create_entry_with_device(hass, "permit1")
+    entry.runtime_data.coordinator.data = _favorites_data(
+        Favorite(favorite_id="fav1", license_plate="AA1234", name="Car"),
+        Favorite(favorite_id="fav2", license_plate="BB9999"),
+    )
+
+    response = await hass.services.async_call(
+        DOMAIN,
+        SERVICE_LIST_FAVORITES,
+        {ATTR_DEVICE_ID: device.id},
+        blocking=True,
+        return_response=True,
+    )
+
+    provider.list_favorites.assert_not_called()
+    assert response["count"] == EXPECTED_COUNT
+    assert response["favorites"] == [
+        {ATTR_FAVORITE_ID: "fav1", ATTR_LICENSE_PLATE: "AA1234", ATTR_NAME: "Car"},
+        {ATTR_FAVORITE_ID: "fav2", ATTR_LICENSE_PLATE: "BB9999"},
+    ]
+
+    provider.list_favorites.return_value = [{"id": "fav3", "license_plate": "CC1"}]
+    response = await hass.services.async_call(
+        DOMAIN,
+        SERVICE_LIST_FAVORITES,
+        {ATTR_DEVICE_ID: device.id, ATTR_REFRESH: True},
+        blocking=True,
+        return_response=True,
+    )
+
+    provider.list_favorites.assert_awaited_once()
+    assert response["favorites"] == [
+        {ATTR_FAVORITE_ID: "fav3", ATTR_LICENSE_PLATE: "CC1"}
+    ]
+
+
+async def test_service_favorite_writes_update_snapshot(hass: HomeAssistant) -> None:
+    """Favorite writes should update the snapshot and schedule reconciliation."""
+    await async_setup_services(hass)
+
+    entry, device, provider = _create_entry_with_device(hass, "permit1")
+    coordinator = entry.runtime_data.coordinator
+    coordinator.data = _favorites_data(
+        Favorite(favorite_id="fav1", license_plate="AA1234", name="Car"),
+    )
+    provider.add_favorite.return_value = {"id": "fav2", "license_plate": "BB9999"}
+
+    await hass.services.async_call(
+        DOMAIN,
+        SERVICE_ADD_FAVORITE,
+        {ATTR_DEVICE_ID: device.id, ATTR_LICENSE_PLATE: "BB9999"},
+        blocking=True,
+    )
+    added = coordinator.async_apply_local_update.call_args.args[0]
+    assert added.favorites[-1] == Favorite(favorite_id="fav2", license_plate="BB9999")
+
+    await hass.services.async_call(
+        DOMAIN,
+        SERVICE_UPDATE_FAVORITE,
+        {ATTR_DEVICE_ID: device.id, ATTR_FAVORITE_ID: "fav1", ATTR_NAME: "Van"},
+        blocking=True,
+    )
+    updated = coordinator.async_apply_local_update.call_args.args[0]
+    assert updated.favorites == (
+        Favorite(favorite_id="fav1", license_plate="AA1234", name="Van"),
+    )
+
+    await hass.services.async_call(
+        DOMAIN,
+        SERVICE_REMOVE_FAVORITE,
+        {ATTR_DEVICE_ID: device.id, ATTR_FAVORITE_ID: "fav1"},
+        blocking=True,
+    )
+    removed = coordinator.async_apply_local_update.call_args.args[0]
+    assert removed.favorites == ()
+    coordinator.async_schedule_reconcile.assert_not_called()
+
+
+async def test_service_reservation_writes_update_snapshot(
+    hass: HomeAssistant,
+) -> None:
+    """Reservation writes should update the snapshot without a refresh."""
+    await async_setup_services(hass)
+
+    entry, device, provider = _create_entry_with_device(hass, "permit1")
+    provider.reservation_update_fields = [ATTR_START_TIME, ATTR_END_TIME]
+    coordinator = entry.runtime_data.coordinator
+    now = datetime(2025, 1, 1, 12, 0, tzinfo=UTC)
+    active = Reservation(
+        reservation_id="res1",
+        start_time=now - timedelta(hours=1),
+        end_time=now + timedelta(hours=1),
+        license_plate="AA1234",
+    )
+    coordinator.data = replace(
+        _favorites_data(), reservations=(active,), active_reservations=(active,)
+    )
+    start = now + timedelta(hours=1)
+    end = now + timedelta(hours=2)
+    provider.start_reservation.return_value = {
+        "id": "res2",
+        "start_time": start.isoformat(),
+        "end_time": end.isoformat(),
+    }
+    provider.update_reservation.return_value = None
+
+    with freeze_time(now):
+        await hass.services.async_call(
+            DOMAIN,
+            SERVICE_START_RESERVATION,
+            {
+                ATTR_DEVICE_ID: device.id,
+                ATTR_START_TIME: start,
+                ATTR_END_TIME: end,
+                ATTR_LICENSE_PLATE: "BB9999",
+            },
+            blocking=True,
+        )
+        started = coordinator.async_apply_local_update.call_args.args[0]
+        assert started.reservations[-1] == Reservation(
+            reservation_id="res2",
+            start_time=start,
+            end_time=end,
+            license_plate="BB9999",
+        )
+        assert started.active_reservations == (active,)
+
+        await hass.services.async_call(
+            DOMAIN,
+            SERVICE_UPDATE_RESERVATION,
+            {
+                ATTR_DEVICE_ID: device.id,
+                ATTR_RESERVATION_ID: "res1",
+                ATTR_END_TIME: end,
+            },
+            blocking=True,
+        )
+        updated = coordinator.async_apply_local_update.call_args.args[0]
+        assert updated.reservations == (replace(active, end_time=end),)
+
+        await hass.services.async_call(
+            DOMAIN,
+            SERVICE_END_RESERVATION,
+            {ATTR_DEVICE_ID: device.id, ATTR_RESERVATION_ID: "res1"},
+            blocking=True,
+        )
+        ended = coordinator.async_apply_local_update.call_args.args[0]
+        assert ended.reservations == (replace(active, end_time=now),)
+        assert ended.active_reservations == ()
+
+    coordinator.async_schedule_reconcile.assert_not_called()
+
+
+async def test_service_add_favorite_without_reported_id(hass: HomeAssistant) -> None:
+    """An add without a reported id should reconcile instead of adding locally."""
+    await async_setup_services(hass)
+
+    entry, device, provider = _create_entry_with_device(hass, "permit1")
+    coordinator = entry.runtime_data.coordinator
+    coordinator.data = _favorites_data()
+    provider.add_favorite.return_value = None
+
+    await hass.services.async_call(
+        DOMAIN,
+        SERVICE_ADD_FAVORITE,
+        {ATTR_DEVICE_ID: device.id, ATTR_LICENSE_PLATE: "BB9999"},
+        blocking=True,
+    )
+
+    coordinator.async_apply_local_update.assert_not_called()
+    coordinator.async_schedule_reconcile.assert_called_once()
+
+
+async def test_service_favorite_write_without_snapshot(hass: HomeAssistant) -> None:
+    """Favorite writes without coordinator data should only reconcile."""
+    await async_setup_services(hass)
+
+    entry, device, _provider = _create_entry_with_device(hass, "permit1")
+    coordinator = entry.runtime_data.coordinator
+
+    await hass.services.async_call(
+        DOMAIN,
+        SERVICE_REMOVE_FAVORITE,
+        {ATTR_DEVICE_ID: device.id, ATTR_FAVORITE_ID: "fav1"},
+        blocking=True,
+    )
+
+    coordinator.async_apply_local_update.assert_not_called()
+    coordinator.async_schedule_reconcile.assert_called_once()
+
+
 async def test_service_invalid_device_target(hass: HomeAssistant) -> None:
     """Service calls should reject unknown devices."""
     await async_setup_services(hass)
@@ -1267,6 +1660,24 @@ async def test_service_invalid_device_target(hass: HomeAssistant) -> None:
         )
 
 
+def _favorites_data(*favorites: Favorite) -> CoordinatorData:
+    """Build coordinator data holding only favorites."""
+    return CoordinatorData(
+        permit_id="permit1",
+        permit_remaining_balance=0,
+        permit_balance_unit=None,
+        zone_validity=(),
+        reservations=(),
+        favorites=favorites,
+        zone_availability=ZoneAvailability(
+            is_chargeable_now=False,
+            next_change_time=None,
+            windows_today=(),
+        ),
+        active_reservations=(),
+    )
+
+
 def _create_entry_with_device(
     hass: HomeAssistant, permit_id: str, options: dict[str, object] | None = None
 ) -> tuple[MockConfigEntry, dr.DeviceEntry, AsyncMock]:
@@ -1290,8 +1701,13 @@ def _create_entry_with_device(
     provider = AsyncMock()
     coordinator = AsyncMock()
     coordinator.async_refresh = AsyncMock()
+    coordinator.async_refresh_if_stale = AsyncMock()
+    coordinator.data_age_seconds = EXPECTED_DATA_AGE
     coordinator.last_update_success = True
     coordinator.config_entry = entry
+    coordinator.data = None
+    coordinator.async_apply_local_update = MagicMock()
+    coordinator.async_schedule_reconcile = MagicMock()
 
     runtime = CityVisitorParkingRuntimeData(
         client=AsyncMock(),
@@ -0,0 +1,72 @@
+"""Tests for the persisted coordinator snapshot."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING, Any
+
+from custom_components.city_visitor_parking.models import (
+    CoordinatorData,
+    Favorite,
+    Reservation,
+    TimeRange,
+    ZoneAvailability,
+)
+from custom_components.city_visitor_parking.snapshot_store import SnapshotStore
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+EXPECTED_BALANCE = 42.5
+
+
+async def test_snapshot_round_trip(hass: HomeAssistant) -> None:
+    """A flushed snapshot should load back with the same provider data."""
+    now = datetime(2025, 1, 6, 9, 0, tzinfo=UTC)
+    window = TimeRange(start=now, end=now + timedelta(hours=8))
+    reservation = Reservation(
+        "res1", now, now + timedelta(hours=1), license_plate="AB12CD"
+    )
+    favorite = Favorite("fav1", "AB12CD", "Car")
+    data = CoordinatorData(
+        permit_id="permit",
+        permit_remaining_balance=EXPECTED_BALANCE,
+        permit_balance_unit="MINUTE",
+        zone_validity=(window,),
+        reservations=(reservation,),
+        favorites=(favorite,),
+        zone_availability=ZoneAvailability(
+            is_chargeable_now=True,
+            next_change_time=window.end,
+            windows_today=(window,),
+        ),
+        active_reservations=(reservation,),
+    )
+    store = SnapshotStore(hass, "entry")
+
+    store.async_delay_save(data)
+    await store.async_flush()
+
+    snapshot = await SnapshotStore(hass, "entry").async_load("permit")
+    assert snapshot is not None
+    assert snapshot.permit_remaining_balance == EXPECTED_BALANCE
+    assert snapshot.permit_balance_unit == "MINUTE"
+    assert snapshot.zone_validity == [window]
+    assert snapshot.reservations == [reservation]
+    assert snapshot.favorites == (favorite,)
+
+    assert await SnapshotStore(hass, "entry").async_load("other") is None
+
+
+async def test_snapshot_ignores_malformed_data(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """A broken snapshot should be ignored instead of failing setup."""
+    hass_storage["city_visitor_parking.entry.snapshot"] = {
+        "version": 1,
+        "minor_version": 1,
+        "key": "city_visitor_parking.entry.snapshot",
+        "data": {"permit_id": "permit", "zone_validity": [{"start": "never"}]},
+    }
+
+    assert await SnapshotStore(hass, "entry").async_load("permit") is None
@@ -2,17 +2,21 @@
 
 from __future__ import annotations
 
+from dataclasses import replace
 from datetime import UTC, datetime, time, timedelta
 from types import SimpleNamespace
-from typing import TYPE_CHECKING, cast
-from unittest.mock import AsyncMock
+from typing import TYPE_CHECKING, Any, cast
+from unittest.mock import AsyncMock, MagicMock
 
 from freezegun import freeze_time
 from homeassistant import config_entries
 from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
 from homeassistant.util import dt as dt_util
 from pycityvisitorparking.exceptions import PyCityVisitorParkingError
-from pytest_homeassistant_custom_component.common import MockConfigEntry
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+)
 
 from custom_components.city_visitor_parking.const import (
     CONF_MUNICIPALITY,
@@ -26,7 +30,9 @@ from custom_components.city_visitor_parking.const import (
 from custom_components.city_visitor_parking.models import (
     AutoEndState,
     CoordinatorData,
+    Favorite,
     ProviderConfig,
+    Reservation,
     TimeRange,
     ZoneAvailability,
 )
@@ -36,13 +42,21 @@ from custom_components.city_visitor_parking.runtime_data import (
 from custom_components.city_visitor_parking.websocket_api import (
     _ws_get_status,
     _ws_list_favorites,
+    _ws_subscribe_status,
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from homeassistant.components.websocket_api.connection import ActiveConnection
     from homeassistant.core import HomeAssistant
 
 
+EXPECTED_PUSHES_AFTER_UPDATE = 2
+EXPECTED_PUSHES_AFTER_BOUNDARY = 3
+EXPECTED_BALANCE = 30.0
+
+
 class _FakeConnection:
     """Capture websocket responses for tests."""
 
@@ -50,15 +64,21 @@ class _FakeConnection:
         """Initialize the fake connection."""
         self.errors: list[dict[str, object]] = []
         self.results: list[dict[str, object]] = []
+        self.messages: list[dict[str, object]] = []
+        self.subscriptions: dict[int, Callable[[], None]] = {}
 
     def send_error(self, msg_id: int, code: str, message: str) -> None:
         """Capture an error response."""
         self.errors.append({"id": msg_id, "code": code, "message": message})
 
-    def send_result(self, msg_id: int, result: dict[str, object]) -> None:
+    def send_result(self, msg_id: int, result: dict[str, object] | None = None) -> None:
         """Capture a success response."""
         self.results.append({"id": msg_id, "result": result})
 
+    def send_message(self, message: dict[str, object]) -> None:
+        """Capture a pushed message."""
+        self.messages.append(message)
+
 
 def _as_utc_iso(value: datetime | None) -> str | None:
     """Return a UTC ISO8601 timestamp string for websocket assertions."""
@@ -97,6 +117,53 @@ async def test_ws_list_favorites_success(hass: HomeAssistant) -> None:
     assert favorites[1]["license_plate"] == "CD-5678"
 
 
+async def test_ws_list_favorites_from_snapshot(hass: HomeAssistant) -> None:
+    """Websocket should answer favorites from coordinator data by default."""
+    entry = _create_entry()
+    entry.add_to_hass(hass)
+    entry.mock_state(hass, config_entries.ConfigEntryState.LOADED)
+
+    provider = AsyncMock()
+    data = CoordinatorData(
+        permit_id="permit",
+        permit_remaining_balance=0,
+        permit_balance_unit=None,
+        zone_validity=(),
+        reservations=(),
+        favorites=(Favorite(favorite_id="fav1", license_plate="AB-1234"),),
+        zone_availability=ZoneAvailability(
+            is_chargeable_now=False,
+            next_change_time=None,
+            windows_today=(),
+        ),
+        active_reservations=(),
+    )
+    entry.runtime_data = _runtime(provider, data)
+
+    raw_connection = _FakeConnection()
+    connection = cast("ActiveConnection", raw_connection)
+    _ws_list_favorites(
+        hass,
+        connection,
+        {"id": 1, "config_entry_id": entry.entry_id},
+    )
+    await hass.async_block_till_done()
+
+    result = _first_result(raw_connection)
+    assert result["favorites"] == [{"id": "fav1", "license_plate": "AB-1234"}]
+    provider.list_favorites.assert_not_called()
+
+    provider.list_favorites.return_value = [{"id": "fav2"}]
+    _ws_list_favorites(
+        hass,
+        connection,
+        {"id": 2, "config_entry_id": entry.entry_id, "refresh": True},
+    )
+    await hass.async_block_till_done()
+
+    provider.list_favorites.assert_awaited_once()
+
+
 async def test_ws_list_favorites_invalid_target(hass: HomeAssistant) -> None:
     """Websocket should reject invalid targets."""
     raw_connection = _FakeConnection()
@@ -267,6 +334,139 @@ async def test_ws_get_status_failure_response(hass: HomeAssistant) -> None:
     assert error["code"] == "status_failed"
 
 
+async def test_ws_subscribe_status_pushes_updates(hass: HomeAssistant) -> None:
+    """Subscriptions should push on subscribe, updates, and window boundaries."""
+    entry = _create_entry()
+    entry.add_to_hass(hass)
+    entry.mock_state(hass, config_entries.ConfigEntryState.LOADED)
+
+    now = datetime(2025, 1, 6, 10, 0, tzinfo=UTC)
+    window = TimeRange(start=now - timedelta(hours=1), end=now + timedelta(hours=1))
+    reservation = Reservation(
+        reservation_id="res1",
+        start_time=now - timedelta(minutes=30),
+        end_time=now + timedelta(hours=2),
+        license_plate="AB-1234",
+    )
+    data = CoordinatorData(
+        permit_id="permit",
+        permit_remaining_balance=30,
+        permit_balance_unit=None,
+        zone_validity=(window,),
+        reservations=(reservation,),
+        favorites=(),
+        zone_availability=ZoneAvailability(
+            is_chargeable_now=True,
+            next_change_time=window.end,
+            windows_today=(window,),
+        ),
+        active_reservations=(reservation,),
+    )
+    runtime = _runtime(AsyncMock(), data)
+    unsub_listener = MagicMock()
+    runtime.coordinator.async_add_listener = MagicMock(return_value=unsub_listener)
+    runtime.coordinator.last_update_success = True
+    entry.runtime_data = runtime
+
+    raw_connection = _FakeConnection()
+    connection = cast("ActiveConnection", raw_connection)
+    with freeze_time(now) as frozen:
+        _ws_subscribe_status(
+            hass,
+            connection,
+            {"id": 5, "config_entry_id": entry.entry_id},
+        )
+        assert raw_connection.results == [{"id": 5, "result": None}]
+        first = _event(raw_connection, 0)
+        assert first["status"]["state"] == STATE_CHARGEABLE
+        assert first["status"]["stale"] is False
+        assert first["reservations"]["active_count"] == 1
+
+        listener = runtime.coordinator.async_add_listener.call_args.args[0]
+        listener()
+        assert len(raw_connection.messages) == EXPECTED_PUSHES_AFTER_UPDATE
+
+        frozen.move_to(window.end)
+        async_fire_time_changed(hass, window.end)
+        await hass.async_block_till_done()
+
+    boundary = _event(raw_connection, -1)
+    assert boundary["status"]["state"] == STATE_FREE
+    assert len(raw_connection.messages) == EXPECTED_PUSHES_AFTER_BOUNDARY
+
+    raw_connection.subscriptions[5]()
+    unsub_listener.assert_called_once()
+
+
+async def test_ws_subscribe_status_deltas(hass: HomeAssistant) -> None:
+    """Delta subscriptions should send a snapshot, then sequenced patches."""
+    entry = _create_entry()
+    entry.add_to_hass(hass)
+    entry.mock_state(hass, config_entries.ConfigEntryState.LOADED)
+
+    now = datetime(2025, 1, 6, 10, 0, tzinfo=UTC)
+    data = CoordinatorData(
+        permit_id="permit",
+        permit_remaining_balance=30,
+        permit_balance_unit=None,
+        zone_validity=(),
+        reservations=(),
+        favorites=(),
+        zone_availability=ZoneAvailability(
+            is_chargeable_now=False,
+            next_change_time=None,
+            windows_today=(),
+        ),
+        active_reservations=(),
+    )
+    runtime = _runtime(AsyncMock(), data)
+    runtime.coordinator.async_add_listener = MagicMock(return_value=MagicMock())
+    runtime.coordinator.last_update_success = True
+    entry.runtime_data = runtime
+
+    raw_connection = _FakeConnection()
+    connection = cast("ActiveConnection", raw_connection)
+    with freeze_time(now):
+        _ws_subscribe_status(
+            hass,
+            connection,
+            {"id": 7, "config_entry_id": entry.entry_id, "deltas": True},
+        )
+        snapshot = _event(raw_connection, 0)
+        assert snapshot["type"] == "snapshot"
+        assert snapshot["seq"] == 0
+        assert snapshot["data"]["status"]["remaining_balance"] == EXPECTED_BALANCE
+
+        listener = runtime.coordinator.async_add_listener.call_args.args[0]
+        listener()
+        assert len(raw_connection.messages) == 1
+
+        runtime.coordinator.data = replace(data, permit_remaining_balance=20)
+        listener()
+
+    delta = _event(raw_connection, 1)
+    assert delta["type"] == "delta"
+    assert delta["seq"] == 1
+    assert delta["ops"] == [
+        {"op": "replace", "path": "/status/remaining_balance", "value": 20.0}
+    ]
+
+
+async def test_ws_subscribe_status_invalid_target(hass: HomeAssistant) -> None:
+    """Subscriptions should reject invalid targets."""
+    raw_connection = _FakeConnection()
+    connection = cast("ActiveConnection", raw_connection)
+    _ws_subscribe_status(
+        hass,
+        connection,
+        {"id": 1, "config_entry_id": "missing"},
+    )
+
+    error = _first_error(raw_connection)
+    assert error["code"] == "invalid_target"
+    assert not raw_connection.subscriptions
+
+
 def test_ws_as_utc_iso_none() -> None:
     """UTC formatting should return None for missing values."""
     assert _as_utc_iso(None) is None
@@ -277,6 +477,11 @@ def _first_result(connection: _FakeConnection) -> dict[str, object]:
     return cast("dict[str, object]", connection.results[0]["result"])
 
 
+def _event(connection: _FakeConnection, index: int) -> dict[str, Any]:
+    """Return a pushed subscription event payload."""
+    return cast("dict[str, Any]", connection.messages[index]["event"])
+
+
 def _first_error(connection: _FakeConnection) -> dict[str, object]:
     """Return the first websocket error payload."""
     return cast("dict[str, object]", connection.errors[0])